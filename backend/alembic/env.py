@@ -7,7 +7,7 @@ from alembic import context
 
 # Import the base and all models
 from app.database import Base
-from app.models import User  # noqa: F401
+from app.models import Post, RefreshToken, RevokedToken, User  # noqa: F401
 from app.config import settings
 
 # this is the Alembic Config object, which provides
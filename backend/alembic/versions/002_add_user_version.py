@@ -0,0 +1,30 @@
+"""add users.version
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the user version counter embedded in access tokens."""
+    op.add_column(
+        'users',
+        sa.Column('version', sa.Integer(), nullable=False, server_default=sa.text('1')),
+    )
+
+
+def downgrade() -> None:
+    """Drop the user version counter."""
+    op.drop_column('users', 'version')
@@ -0,0 +1,41 @@
+"""create revoked_tokens table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create revoked_tokens table used by server-side logout."""
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('jti', sa.String(length=64), primary_key=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column(
+            'revoked_at', sa.DateTime(), nullable=False,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+        ),
+    )
+
+    # Purge scans by expiry, workers sync by revocation time
+    op.create_index('ix_revoked_tokens_expires_at', 'revoked_tokens', ['expires_at'])
+    op.create_index('ix_revoked_tokens_revoked_at', 'revoked_tokens', ['revoked_at'])
+
+
+def downgrade() -> None:
+    """Drop revoked_tokens table and its indexes."""
+    op.drop_index('ix_revoked_tokens_revoked_at', table_name='revoked_tokens')
+    op.drop_index('ix_revoked_tokens_expires_at', table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
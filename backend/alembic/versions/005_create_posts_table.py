@@ -0,0 +1,43 @@
+"""create posts table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create posts table with the index used by timeline pagination."""
+    op.create_table(
+        'posts',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            'user_id', postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False,
+        ),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+
+    # Keyset pagination seeks on (created_at, id); user_id backs the FK cascade
+    op.create_index('ix_posts_created_at_id', 'posts', ['created_at', 'id'])
+    op.create_index('ix_posts_user_id', 'posts', ['user_id'])
+
+
+def downgrade() -> None:
+    """Drop posts table and its indexes."""
+    op.drop_index('ix_posts_user_id', table_name='posts')
+    op.drop_index('ix_posts_created_at_id', table_name='posts')
+    op.drop_table('posts')
@@ -0,0 +1,5 @@
+"""Production server entry point: python -m app."""
+from app.server import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Load and micro-benchmarks for the auth endpoints.
+
+Run ``python -m app.benchmarks --help`` for usage.
+"""
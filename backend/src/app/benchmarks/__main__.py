@@ -0,0 +1,154 @@
+"""Command line entry point: python -m app.benchmarks {load,micro,importtime,compare}."""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from app.benchmarks.results import (
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    write_results,
+)
+
+
+def _report(results: List[BenchmarkResult], output: Path, config: dict) -> None:
+    """Print summaries and optionally persist results."""
+    for result in results:
+        print(result.summary_line())
+    if output is not None:
+        write_results(output, results, config)
+        print(f"Results written to {output}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.benchmarks",
+        description="Benchmark the Alt X auth endpoints.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    load = subparsers.add_parser("load", help="Concurrent load against the auth endpoints")
+    load.add_argument("--users", type=int, default=100, help="Benchmark users to seed")
+    load.add_argument("--requests", type=int, default=500, help="Measured requests per endpoint")
+    load.add_argument("--concurrency", type=int, default=20, help="Concurrent clients")
+    load.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per endpoint")
+    load.add_argument(
+        "--endpoints", default="login,refresh,me",
+        help="Comma separated subset of login,refresh,me",
+    )
+    load.add_argument(
+        "--base-url",
+        help="Benchmark a running server (e.g. http://localhost:8000) instead of in-process",
+    )
+    load.add_argument(
+        "--database-url",
+        help="Database to seed users into (default: temporary SQLite in-process, "
+             "DATABASE_URL with --base-url)",
+    )
+    load.add_argument("--output", type=Path, help="Write JSON results to this file")
+
+    micro = subparsers.add_parser("micro", help="Micro-benchmarks of auth building blocks")
+    micro.add_argument("--iterations", type=int, default=2000)
+    micro.add_argument("--password-iterations", type=int, default=10)
+    micro.add_argument("--users", type=int, default=1000, help="Users seeded for lookups")
+    micro.add_argument("--database-url", help="Database for lookups (default: temporary SQLite)")
+    micro.add_argument("--output", type=Path, help="Write JSON results to this file")
+
+    importtime = subparsers.add_parser(
+        "importtime", help="Cold import time of the app (python -X importtime)"
+    )
+    importtime.add_argument("--module", default="app.main", help="Module to import")
+    importtime.add_argument("--runs", type=int, default=3, help="Fresh interpreters to start")
+    importtime.add_argument("--top", type=int, default=15, help="Packages/modules to list")
+    importtime.add_argument(
+        "--budget-ms", type=float,
+        help="Fail when the fastest run imports slower than this",
+    )
+    importtime.add_argument("--output", type=Path, help="Write JSON results to this file")
+
+    compare = subparsers.add_parser("compare", help="Compare two result files for regressions")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("candidate", type=Path)
+    compare.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="Allowed relative p95/throughput change (default: 0.1)",
+    )
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point for the benchmark command.
+
+    Returns:
+        Process exit code (1 when compare finds regressions or the import
+        time exceeds its budget)
+    """
+    args = build_parser().parse_args(argv)
+    config = {key: str(value) for key, value in vars(args).items()}
+
+    if args.command == "load":
+        from app.benchmarks.load import (
+            STATUS_HINTS,
+            failed_responses,
+            run_against_server,
+            run_in_process,
+        )
+
+        endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+        if args.base_url:
+            coroutine = run_against_server(
+                args.base_url, args.users, args.requests, args.concurrency,
+                args.warmup, endpoints, args.database_url,
+            )
+        else:
+            coroutine = run_in_process(
+                args.users, args.requests, args.concurrency,
+                args.warmup, endpoints, args.database_url,
+            )
+        results = asyncio.run(coroutine)
+        _report(results, args.output, config)
+        # Failed requests are left out of the latencies, so the numbers above
+        # describe only the requests that succeeded
+        for status, count in sorted(failed_responses(results).items()):
+            hint = STATUS_HINTS.get(status)
+            print(f"WARNING {count} requests failed ({status})" + (f"; {hint}" if hint else ""))
+
+    elif args.command == "micro":
+        from app.benchmarks.micro import run_micro
+
+        results = run_micro(
+            args.iterations, args.password_iterations, args.users, args.database_url
+        )
+        _report(results, args.output, config)
+
+    elif args.command == "importtime":
+        from app.benchmarks.importtime import format_report, run_importtime
+
+        result, timings = run_importtime(args.module, args.runs)
+        print(format_report(timings, args.module, args.top))
+        print()
+        _report([result], args.output, config)
+        fastest_ms = result.extra["fastest_ms"]
+        if args.budget_ms is not None and fastest_ms > args.budget_ms:
+            print(f"OVER BUDGET import {args.module}: {fastest_ms:.1f} ms > {args.budget_ms} ms")
+            return 1
+
+    elif args.command == "compare":
+        regressions = compare_results(
+            load_results(args.baseline), load_results(args.candidate), args.threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions found.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
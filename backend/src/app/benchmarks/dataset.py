@@ -0,0 +1,103 @@
+"""Benchmark database setup and user seeding."""
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, engine_options, get_async_db, to_async_url
+from app.models.user import User
+from app.utils.password import hash_password
+
+BENCH_PASSWORD = "BenchPass123"
+SEED_BATCH_SIZE = 1000
+
+
+def bench_email(index: int) -> str:
+    """Email address of the index-th benchmark user."""
+    return f"bench-{index}@example.com"
+
+
+class BenchmarkDatabase:
+    """Database used by a benchmark run.
+
+    Without a URL, a throwaway SQLite file is created and removed on close.
+    With a URL (e.g. the Postgres from docker compose), the schema is expected
+    to exist already and seeded benchmark users are left in place.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        """Initialize database.
+
+        Args:
+            database_url: Sync database URL, or None for a temporary SQLite file
+        """
+        self._temp_dir: Optional[str] = None
+        if database_url is None:
+            self._temp_dir = tempfile.mkdtemp(prefix="altx-bench-")
+            database_url = f"sqlite:///{Path(self._temp_dir) / 'bench.db'}"
+
+        self.database_url = database_url
+        self.engine = create_engine(database_url, **engine_options(database_url))
+        self.async_engine = create_async_engine(
+            to_async_url(database_url),
+            **engine_options(database_url, is_async=True),
+        )
+        if self._temp_dir is not None:
+            Base.metadata.create_all(bind=self.engine)
+
+        self.session_factory = async_sessionmaker(
+            bind=self.async_engine, autoflush=False, expire_on_commit=False
+        )
+
+    def seed_users(self, count: int) -> List[str]:
+        """Ensure benchmark users bench-0 .. bench-(count-1) exist.
+
+        All users share one bcrypt hash of BENCH_PASSWORD, computed once, so
+        seeding cost does not depend on the bcrypt work factor.
+
+        Args:
+            count: Number of users
+
+        Returns:
+            Emails of the benchmark users
+        """
+        emails = [bench_email(index) for index in range(count)]
+        hashed_password = hash_password(BENCH_PASSWORD)
+        with sessionmaker(bind=self.engine, autoflush=False)() as db:
+            existing = set(
+                db.scalars(select(User.email).where(User.email.like("bench-%@example.com")))
+            )
+            missing = [email for email in emails if email not in existing]
+            for start in range(0, len(missing), SEED_BATCH_SIZE):
+                db.add_all(
+                    User.from_hashed_password(email=email, hashed_password=hashed_password)
+                    for email in missing[start:start + SEED_BATCH_SIZE]
+                )
+                db.commit()
+
+        return emails
+
+    def install(self, app: FastAPI) -> None:
+        """Route the app's database dependency to this database."""
+
+        async def override_get_async_db():
+            async with self.session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+
+    def uninstall(self, app: FastAPI) -> None:
+        """Remove the dependency override installed by install()."""
+        app.dependency_overrides.pop(get_async_db, None)
+
+    async def close(self) -> None:
+        """Dispose engines and remove the temporary database, if any."""
+        await self.async_engine.dispose()
+        self.engine.dispose()
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
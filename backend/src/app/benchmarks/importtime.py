@@ -0,0 +1,140 @@
+"""Import time of the application module, measured with ``python -X importtime``.
+
+Every worker pays this cost on a cold start, so it is reported per top-level
+package and checked against an optional budget.
+"""
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from app.benchmarks.results import BenchmarkResult
+
+DEFAULT_MODULE = "app.main"
+
+
+@dataclass
+class ImportTiming:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        """Top-level package the module belongs to."""
+        return self.module.split(".", 1)[0]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr output.
+
+    Args:
+        output: Lines like "import time:       207 |     259690 |   fastapi"
+
+    Returns:
+        Timings in the order the imports finished
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        stripped = name.lstrip()
+        timings.append(ImportTiming(
+            module=stripped.rstrip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=(len(name) - len(stripped) - 1) // 2,
+        ))
+    return timings
+
+
+def measure_imports(module: str = DEFAULT_MODULE) -> List[ImportTiming]:
+    """Import module in a fresh interpreter and collect its import timings.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Timings of every module imported on the way
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def total_us(timings: Sequence[ImportTiming], module: str = DEFAULT_MODULE) -> int:
+    """Cumulative import time of module in microseconds."""
+    for timing in timings:
+        if timing.module == module:
+            return timing.cumulative_us
+    return sum(timing.self_us for timing in timings)
+
+
+def by_package(timings: Sequence[ImportTiming]) -> List[Tuple[str, int]]:
+    """Self time summed per top-level package, slowest first."""
+    packages: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        packages[timing.package] += timing.self_us
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def format_report(timings: Sequence[ImportTiming], module: str, top: int = 15) -> str:
+    """Human readable breakdown of the import time.
+
+    Args:
+        timings: Timings from measure_imports
+        module: Module that was imported
+        top: Number of packages and modules to list
+
+    Returns:
+        Report text
+    """
+    lines = [f"import {module}: {total_us(timings, module) / 1000:.1f} ms "
+             f"({len(timings)} modules)", "", "Slowest packages (self time):"]
+    for package, self_us in by_package(timings)[:top]:
+        lines.append(f"  {self_us / 1000:8.1f} ms  {package}")
+    lines += ["", "Slowest modules (self time):"]
+    for timing in sorted(timings, key=lambda timing: timing.self_us, reverse=True)[:top]:
+        lines.append(f"  {timing.self_us / 1000:8.1f} ms  {timing.module}")
+    return "\n".join(lines)
+
+
+def run_importtime(
+    module: str = DEFAULT_MODULE, runs: int = 3
+) -> Tuple[BenchmarkResult, List[ImportTiming]]:
+    """Measure the import time of module over several fresh interpreters.
+
+    Args:
+        module: Module to import
+        runs: Number of interpreters to start
+
+    Returns:
+        Summary result (one sample per run) and the timings of the fastest run
+    """
+    totals = []
+    fastest: List[ImportTiming] = []
+    for _ in range(runs):
+        timings = measure_imports(module)
+        totals.append(total_us(timings, module) / 1e6)
+        if len(totals) == 1 or totals[-1] == min(totals):
+            fastest = timings
+    result = BenchmarkResult.from_samples(
+        f"import {module}", "startup", totals, sum(totals),
+        modules=len(fastest), fastest_ms=round(min(totals) * 1000, 3),
+    )
+    return result, fastest
@@ -0,0 +1,273 @@
+"""Concurrent load benchmark for the auth endpoints."""
+import asyncio
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import httpx
+
+from app.benchmarks.dataset import BENCH_PASSWORD, BenchmarkDatabase
+from app.benchmarks.results import BenchmarkResult
+
+ENDPOINTS = ("login", "refresh", "me")
+
+# A benchmark drives logins far faster than the default login throttling allows
+THROTTLING_HINT = (
+    "start the server with LOGIN_IP_RATE_PER_MINUTE=0 and "
+    "LOGIN_EMAIL_RATE_PER_MINUTE=0 to benchmark without login throttling"
+)
+# Logins wait at most PASSWORD_HASHER_QUEUE_TIMEOUT for a bcrypt slot, then get 503
+HASHER_BUSY_HINT = (
+    "password hashing was saturated; raise PASSWORD_HASHER_MAX_CONCURRENCY or "
+    "PASSWORD_HASHER_QUEUE_TIMEOUT, or lower --concurrency"
+)
+# Explanations of the rejections a benchmark run typically runs into
+STATUS_HINTS = {"429": THROTTLING_HINT, "503": HASHER_BUSY_HINT}
+
+RequestFactory = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    send_request: RequestFactory,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> BenchmarkResult:
+    """Issue requests from concurrent workers and summarize their latencies.
+
+    Args:
+        client: HTTP client (in-process ASGI transport or real network)
+        name: Benchmark name
+        send_request: Coroutine function issuing the index-th request
+        requests: Number of measured requests
+        concurrency: Number of concurrent workers
+        warmup: Number of unmeasured requests issued first
+
+    Returns:
+        Benchmark result; responses without a 2xx status (and transport errors)
+        count as errors and the per-status breakdown is stored in
+        ``extra["status_counts"]``
+    """
+    for index in range(warmup):
+        await send_request(client, index)
+
+    counter = itertools.count()
+    latencies: List[float] = []
+    status_counts: Dict[str, int] = {}
+
+    async def worker() -> None:
+        while (index := next(counter)) < requests:
+            start = time.perf_counter()
+            try:
+                response = await send_request(client, index)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - start
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if status.isdigit() and 200 <= int(status) < 300:
+                latencies.append(elapsed)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult.from_samples(
+        name, "load", latencies, duration,
+        errors=requests - len(latencies),
+        concurrency=concurrency,
+        status_counts=status_counts,
+    )
+
+
+async def _login(client: httpx.AsyncClient, email: str) -> Dict[str, str]:
+    """Log in and return the token response.
+
+    Raises:
+        RuntimeError: The server throttled the login or its password hashing was busy
+    """
+    response = await client.post(
+        "/api/auth/login", json={"email": email, "password": BENCH_PASSWORD}
+    )
+    hint = STATUS_HINTS.get(str(response.status_code))
+    if hint is not None:
+        raise RuntimeError(f"Login for {email} was rejected ({response.status_code}): {hint}")
+    response.raise_for_status()
+    return response.json()
+
+
+def failed_responses(results: Sequence[BenchmarkResult]) -> Dict[str, int]:
+    """Count the unsuccessful responses of all results by status.
+
+    Args:
+        results: Results of run_scenario
+
+    Returns:
+        Number of responses per non-2xx status (or transport error name)
+    """
+    failures: Dict[str, int] = {}
+    for result in results:
+        for status, count in result.extra.get("status_counts", {}).items():
+            if not (status.isdigit() and 200 <= int(status) < 300):
+                failures[status] = failures.get(status, 0) + count
+    return failures
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    emails: Sequence[str],
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    endpoints: Sequence[str] = ENDPOINTS,
+    token_users: int = 20,
+) -> List[BenchmarkResult]:
+    """Benchmark the selected auth endpoints one after another.
+
+    Args:
+        client: HTTP client
+        emails: Seeded benchmark users
+        requests: Measured requests per endpoint
+        concurrency: Concurrent workers per endpoint
+        warmup: Unmeasured requests per endpoint
+        endpoints: Subset of ENDPOINTS to run
+        token_users: Number of sessions (users) driving refresh/me
+
+    Returns:
+        One result per endpoint
+    """
+    results = []
+
+    if "login" in endpoints:
+        async def login(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            return await client.post(
+                "/api/auth/login",
+                json={"email": emails[index % len(emails)], "password": BENCH_PASSWORD},
+            )
+
+        results.append(await run_scenario(
+            client, "POST /api/auth/login", login, requests, concurrency, warmup
+        ))
+
+    if "refresh" in endpoints or "me" in endpoints:
+        tokens = [await _login(client, email) for email in emails[:token_users]]
+
+    if "refresh" in endpoints:
+        # Refresh tokens are single use: each slot is one client session that
+        # exchanges its current token and keeps the rotated one
+        slot_locks = [asyncio.Lock() for _ in tokens]
+        refresh_tokens = [token["refresh_token"] for token in tokens]
+
+        async def refresh(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            slot = index % len(refresh_tokens)
+            async with slot_locks[slot]:
+                response = await client.post(
+                    "/api/auth/refresh", json={"refresh_token": refresh_tokens[slot]}
+                )
+                if response.status_code == 200:
+                    refresh_tokens[slot] = response.json()["refresh_token"]
+                return response
+
+        results.append(await run_scenario(
+            client, "POST /api/auth/refresh", refresh, requests, concurrency, warmup
+        ))
+
+    if "me" in endpoints:
+        async def me(client: httpx.AsyncClient, index: int) -> httpx.Response:
+            access_token = tokens[index % len(tokens)]["access_token"]
+            return await client.get(
+                "/api/auth/me", headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+        results.append(await run_scenario(
+            client, "GET /api/auth/me", me, requests, concurrency, warmup
+        ))
+
+    return results
+
+
+async def run_in_process(
+    users: int,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    endpoints: Sequence[str] = ENDPOINTS,
+    database_url: Optional[str] = None,
+) -> List[BenchmarkResult]:
+    """Seed users and benchmark the app in-process over the ASGI transport.
+
+    All requests share one client address, so login throttling is switched off
+    for the run to measure the endpoints themselves. Logins also wait for a
+    free password hashing slot instead of failing with 503 after
+    PASSWORD_HASHER_QUEUE_TIMEOUT, so login latencies include the queueing
+    behind bcrypt.
+
+    Args:
+        users: Number of benchmark users to seed
+        requests: Measured requests per endpoint
+        concurrency: Concurrent workers per endpoint
+        warmup: Unmeasured requests per endpoint
+        endpoints: Subset of ENDPOINTS to run
+        database_url: Database to use, or None for a temporary SQLite file
+    """
+    from app.main import app
+    from app.utils.password import password_hasher
+    from app.utils.rate_limit import login_email_limiter, login_ip_limiter
+
+    limiters = [(limiter, limiter.rate) for limiter in (login_ip_limiter, login_email_limiter)]
+    queue_timeout = password_hasher.queue_timeout
+    database = BenchmarkDatabase(database_url)
+    try:
+        for limiter, _ in limiters:
+            limiter.rate = 0
+        password_hasher.queue_timeout = None
+        emails = database.seed_users(users)
+        database.install(app)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await run_load(client, emails, requests, concurrency, warmup, endpoints)
+    finally:
+        for limiter, rate in limiters:
+            limiter.rate = rate
+        password_hasher.queue_timeout = queue_timeout
+        database.uninstall(app)
+        password_hasher.shutdown()
+        await database.close()
+
+
+async def run_against_server(
+    base_url: str,
+    users: int,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    endpoints: Sequence[str] = ENDPOINTS,
+    database_url: Optional[str] = None,
+) -> List[BenchmarkResult]:
+    """Seed users into the server's database and benchmark a running server.
+
+    Every request comes from this machine, so the server's login throttling
+    must be disabled (see THROTTLING_HINT) or most logins are rejected with 429.
+
+    Args:
+        base_url: Server URL, e.g. http://localhost:8000
+        users: Number of benchmark users to seed
+        requests: Measured requests per endpoint
+        concurrency: Concurrent workers per endpoint
+        warmup: Unmeasured requests per endpoint
+        endpoints: Subset of ENDPOINTS to run
+        database_url: Database the server uses (defaults to settings.DATABASE_URL)
+    """
+    from app.config import settings
+
+    database = BenchmarkDatabase(database_url or settings.DATABASE_URL)
+    try:
+        emails = database.seed_users(users)
+    finally:
+        await database.close()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        return await run_load(client, emails, requests, concurrency, warmup, endpoints)
@@ -0,0 +1,298 @@
+"""Micro-benchmarks for token, password, response and user lookup hot paths."""
+import asyncio
+import time
+import tracemalloc
+import uuid
+from typing import Any, Awaitable, Callable, List, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.benchmarks.dataset import BENCH_PASSWORD, BenchmarkDatabase
+from app.benchmarks.results import BenchmarkResult
+from app.models.user import User
+from app.schemas.auth import TokenResponse, UserResponse
+from app.services.user_queries import load_credentials, load_identity
+from app.utils import jwt_keys
+from app.utils.jwt import CODECS, create_access_token, decode_token
+from app.utils.rate_limit import TokenBucketLimiter
+from app.utils.responses import token_response, user_response
+from app.utils.token_cache import token_cache
+from app.utils.token_denylist import TokenDenylist
+
+
+def time_callable(
+    name: str, func: Callable[[], object], iterations: int, warmup: int = 10
+) -> BenchmarkResult:
+    """Time repeated calls of a synchronous function.
+
+    Args:
+        name: Benchmark name
+        func: Function under test
+        iterations: Number of measured calls
+        warmup: Number of unmeasured calls issued first
+    """
+    for _ in range(warmup):
+        func()
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_start)
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult.from_samples(name, "micro", latencies, duration)
+
+
+async def time_coroutine(
+    name: str, func: Callable[[], Awaitable[object]], iterations: int, warmup: int = 10
+) -> BenchmarkResult:
+    """Time repeated awaits of a coroutine function (see time_callable)."""
+    for _ in range(warmup):
+        await func()
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        await func()
+        latencies.append(time.perf_counter() - call_start)
+    duration = time.perf_counter() - start
+
+    return BenchmarkResult.from_samples(name, "micro", latencies, duration)
+
+
+async def peak_allocation_kib(func: Callable[[], Awaitable[object]], calls: int = 200) -> float:
+    """Mean peak memory allocated while awaiting func once, in KiB (tracemalloc).
+
+    Args:
+        func: Coroutine function under test
+        calls: Number of measured calls
+    """
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(calls):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await func()
+            total += tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return round(total / calls / 1024, 3)
+
+
+def bench_tokens(iterations: int) -> List[BenchmarkResult]:
+    """Benchmark token creation and verification with and without the token cache."""
+    token = create_access_token({"sub": "00000000-0000-0000-0000-000000000000"})
+    results = [
+        time_callable(
+            "create_access_token",
+            lambda: create_access_token({"sub": "00000000-0000-0000-0000-000000000000"}),
+            iterations,
+        )
+    ]
+
+    max_entries = token_cache.max_entries
+    token_cache.max_entries = 0
+    try:
+        results.append(time_callable(
+            "decode_token (uncached)", lambda: decode_token(token, "access"), iterations
+        ))
+    finally:
+        token_cache.max_entries = max_entries
+
+    if token_cache.enabled:
+        results.append(time_callable(
+            "decode_token (cached)", lambda: decode_token(token, "access"), iterations
+        ))
+    return results + bench_codecs(iterations)
+
+
+def bench_codecs(iterations: int) -> List[BenchmarkResult]:
+    """Benchmark raw encode/decode of every codec usable with the configured key ring."""
+    claims = {"sub": "00000000-0000-0000-0000-000000000000", "exp": int(time.time()) + 3600}
+    results = []
+    for name, codec_class in CODECS.items():
+        try:
+            codec = codec_class(jwt_keys.key_ring)
+        except ValueError:
+            continue
+        token = codec.encode(dict(claims))
+        results.append(time_callable(
+            f"codec encode ({name})", lambda: codec.encode(dict(claims)), iterations
+        ))
+        results.append(time_callable(
+            f"codec decode ({name})", lambda: codec.decode(token), iterations
+        ))
+    return results
+
+
+def bench_denylist(iterations: int, size: int = 100_000) -> List[BenchmarkResult]:
+    """Benchmark the revocation check against a large denylist, with and without Bloom front."""
+    expires_at = time.time() + 3600
+    results = []
+    for name, bloom_bits in (("dict", 0), ("bloom", size * 16)):
+        denylist = TokenDenylist(bloom_bits=bloom_bits)
+        for i in range(size):
+            denylist.add(f"revoked-{i}", expires_at)
+        jti = "not-revoked-jti"
+        results.append(time_callable(
+            f"denylist miss ({name})", lambda: denylist.is_revoked(jti), iterations
+        ))
+    return results
+
+
+def bench_rate_limit(iterations: int) -> List[BenchmarkResult]:
+    """Benchmark the login limiter decision for an allowed and a throttled key."""
+    limiter = TokenBucketLimiter("bench", rate=1e9, burst=10**9, max_keys=100_000)
+    throttled = TokenBucketLimiter("bench", rate=1e-9, burst=1, max_keys=100_000)
+    throttled.hit("attacker")
+    return [
+        time_callable("login limiter (allowed)", lambda: limiter.hit("client"), iterations),
+        time_callable("login limiter (throttled)", lambda: throttled.hit("attacker"), iterations),
+    ]
+
+
+def bench_responses(iterations: int) -> List[BenchmarkResult]:
+    """Benchmark building auth responses via response_model vs pre-serialized orjson."""
+    user_id = uuid.uuid4()
+    email = "micro@example.com"
+    access_token = create_access_token({"sub": str(user_id)})
+    refresh_token = create_access_token({"sub": str(user_id), "type": "refresh"})
+    token_adapter = TypeAdapter(TokenResponse)
+    user_adapter = TypeAdapter(UserResponse)
+
+    def via_response_model(adapter: TypeAdapter, value: Any) -> bytes:
+        # What FastAPI does for a returned model: validate, dump to JSON-able
+        # data, then encode with the stdlib json module
+        model = adapter.validate_python(value, from_attributes=True)
+        return JSONResponse(adapter.dump_python(model, mode="json")).body
+
+    tokens = TokenResponse(access_token=access_token, refresh_token=refresh_token)
+    user = UserResponse(id=user_id, email=email)
+    return [
+        time_callable(
+            "token response (response_model)",
+            lambda: via_response_model(token_adapter, tokens),
+            iterations,
+        ),
+        time_callable(
+            "token response (orjson)",
+            lambda: token_response(access_token, refresh_token).body,
+            iterations,
+        ),
+        time_callable(
+            "user response (response_model)",
+            lambda: via_response_model(user_adapter, user),
+            iterations,
+        ),
+        time_callable(
+            "user response (orjson)",
+            lambda: user_response(user_id, email).body,
+            iterations,
+        ),
+    ]
+
+
+def bench_password(iterations: int) -> List[BenchmarkResult]:
+    """Benchmark bcrypt verification at the configured work factor."""
+    user = User(email="micro@example.com", password=BENCH_PASSWORD)
+    return [
+        time_callable(
+            "User.verify_password",
+            lambda: user.verify_password(BENCH_PASSWORD),
+            iterations,
+            warmup=1,
+        )
+    ]
+
+
+async def bench_user_lookup(
+    iterations: int, users: int, database_url: Optional[str] = None
+) -> List[BenchmarkResult]:
+    """Benchmark the per-request user lookups, each in a fresh session.
+
+    Full ORM loads are compared with the projection queries used by the auth
+    endpoints; each result also records the peak memory allocated per lookup.
+
+    Args:
+        iterations: Number of measured lookups per query
+        users: Number of seeded users to look up from
+        database_url: Database to use, or None for a temporary SQLite file
+    """
+    database = BenchmarkDatabase(database_url)
+    try:
+        emails = database.seed_users(users)
+        async with database.session_factory() as db:
+            rows = await db.execute(select(User.id, User.email).where(User.email.in_(emails)))
+            user_ids = [row.id for row in rows]
+
+        position = 0
+
+        async def lookup_by_id() -> None:
+            nonlocal position
+            position += 1
+            async with database.session_factory() as db:
+                await db.get(User, user_ids[position % len(user_ids)])
+
+        async def lookup_by_email() -> None:
+            nonlocal position
+            position += 1
+            async with database.session_factory() as db:
+                result = await db.execute(
+                    select(User).where(User.email == emails[position % len(emails)])
+                )
+                result.scalars().first()
+
+        async def identity_by_id() -> None:
+            nonlocal position
+            position += 1
+            async with database.session_factory() as db:
+                await load_identity(db, user_ids[position % len(user_ids)])
+
+        async def credentials_by_email() -> None:
+            nonlocal position
+            position += 1
+            async with database.session_factory() as db:
+                await load_credentials(db, emails[position % len(emails)])
+
+        results = []
+        for name, func in (
+            ("user lookup by id (Session.get)", lookup_by_id),
+            ("user identity by id (projection)", identity_by_id),
+            ("user lookup by email (select)", lookup_by_email),
+            ("user credentials by email (projection)", credentials_by_email),
+        ):
+            result = await time_coroutine(name, func, iterations)
+            result.extra["peak_alloc_kib"] = await peak_allocation_kib(func)
+            results.append(result)
+        return results
+    finally:
+        await database.close()
+
+
+def run_micro(
+    iterations: int,
+    password_iterations: int,
+    users: int,
+    database_url: Optional[str] = None,
+) -> List[BenchmarkResult]:
+    """Run all micro-benchmarks.
+
+    Args:
+        iterations: Iterations for token and lookup benchmarks
+        password_iterations: Iterations for bcrypt verification
+        users: Number of seeded users for lookup benchmarks
+        database_url: Database to use, or None for a temporary SQLite file
+    """
+    results = bench_tokens(iterations)
+    results += bench_denylist(iterations)
+    results += bench_rate_limit(iterations)
+    results += bench_responses(iterations)
+    results += bench_password(password_iterations)
+    results += asyncio.run(bench_user_lookup(iterations, users, database_url))
+    return results
@@ -0,0 +1,165 @@
+"""Benchmark result model, statistics and JSON persistence."""
+import json
+import math
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def percentile(samples: Sequence[float], percent: float) -> float:
+    """Nearest-rank percentile of samples.
+
+    Args:
+        samples: Observed values (any order)
+        percent: Percentile in [0, 100]
+
+    Returns:
+        Percentile value, or 0.0 for no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency and throughput summary of one benchmark."""
+
+    name: str
+    kind: str
+    iterations: int
+    errors: int
+    concurrency: int
+    duration_s: float
+    throughput_per_s: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(
+        cls,
+        name: str,
+        kind: str,
+        latencies_s: Sequence[float],
+        duration_s: float,
+        errors: int = 0,
+        concurrency: int = 1,
+        **extra: Any,
+    ) -> "BenchmarkResult":
+        """Summarize per-iteration latencies.
+
+        Args:
+            name: Benchmark name (e.g. "POST /api/auth/login")
+            kind: "load", "micro" or "startup"
+            latencies_s: Latency of each successful iteration in seconds
+            duration_s: Wall clock time of the whole run in seconds
+            errors: Number of failed iterations
+            concurrency: Number of concurrent clients
+            **extra: Additional values stored with the result
+        """
+        count = len(latencies_s)
+        to_ms = 1000.0
+        return cls(
+            name=name,
+            kind=kind,
+            iterations=count,
+            errors=errors,
+            concurrency=concurrency,
+            duration_s=round(duration_s, 6),
+            throughput_per_s=round(count / duration_s, 3) if duration_s > 0 else 0.0,
+            mean_ms=round(sum(latencies_s) / count * to_ms, 6) if count else 0.0,
+            p50_ms=round(percentile(latencies_s, 50) * to_ms, 6),
+            p95_ms=round(percentile(latencies_s, 95) * to_ms, 6),
+            p99_ms=round(percentile(latencies_s, 99) * to_ms, 6),
+            max_ms=round(max(latencies_s, default=0.0) * to_ms, 6),
+            extra=dict(extra),
+        )
+
+    def summary_line(self) -> str:
+        """Human readable one-line summary."""
+        return (
+            f"{self.name:<40} n={self.iterations:<6} err={self.errors:<4} "
+            f"{self.throughput_per_s:>10.1f}/s  p50={self.p50_ms:.3f}ms "
+            f"p95={self.p95_ms:.3f}ms p99={self.p99_ms:.3f}ms"
+        )
+
+
+def _git_revision() -> Optional[str]:
+    """Current git commit, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_results(path: Path, results: List[BenchmarkResult], config: Dict[str, Any]) -> None:
+    """Write results and run metadata as JSON.
+
+    Args:
+        path: Output file
+        results: Benchmark results
+        config: Parameters the run was started with
+    """
+    document = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "git_revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "config": config,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, default=str))
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load results written by write_results, keyed by benchmark name."""
+    document = json.loads(path.read_text())
+    return {result["name"]: result for result in document["results"]}
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, Any]],
+    candidate: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Find regressions between two result sets.
+
+    A benchmark regresses when its p95 latency grows, or its throughput drops,
+    by more than ``threshold`` (a fraction, e.g. 0.1 for 10%).
+
+    Returns:
+        Human readable regression descriptions (empty when none)
+    """
+    regressions = []
+    for name, base in baseline.items():
+        new = candidate.get(name)
+        if new is None:
+            continue
+        if base["p95_ms"] > 0 and new["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {base['p95_ms']:.3f}ms -> {new['p95_ms']:.3f}ms"
+            )
+        if base["throughput_per_s"] > 0 and (
+            new["throughput_per_s"] < base["throughput_per_s"] * (1 - threshold)
+        ):
+            regressions.append(
+                f"{name}: throughput {base['throughput_per_s']:.1f}/s "
+                f"-> {new['throughput_per_s']:.1f}/s"
+            )
+    return regressions
@@ -1,25 +1,312 @@
 """Database configuration and session management."""
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Dict, List, Optional
 
-from app.config import settings
+from fastapi import Depends, Request
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+
+from app.config import Settings, settings
+from app.utils.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_status
+from app.utils.metrics import db_replica_ejections_total, instrument_engine
+
+logger = logging.getLogger(__name__)
+
+# Async drivers used for each sync database URL scheme
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Convert a sync database URL into its async driver equivalent.
+
+    Args:
+        database_url: Database URL using a sync driver (e.g. postgresql://...)
+
+    Returns:
+        Database URL using the matching async driver (e.g. postgresql+asyncpg://...)
+    """
+    scheme, separator, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}"
+
+
+def engine_options(
+    database_url: str, is_async: bool = False, config: Optional[Settings] = None
+) -> Dict[str, Any]:
+    """Build engine keyword arguments for the connection pool from settings.
+
+    SQLite URLs keep SQLAlchemy's defaults since they have no server-side pool.
+
+    Args:
+        database_url: Database URL the engine is created for
+        is_async: Whether the options are for an async engine
+        config: Settings to read pool options from (defaults to app.config.settings)
+
+    Returns:
+        Keyword arguments for create_engine/create_async_engine
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+
+    config = config or settings
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+    if config.DB_STATEMENT_TIMEOUT_MS > 0 and database_url.startswith("postgresql"):
+        timeout = str(config.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+
+    return options
+
+
+def is_unavailable_error(exc: BaseException) -> bool:
+    """Whether exc means the database could not be reached (not a query error)."""
+    if isinstance(exc, (OSError, TimeoutError, OperationalError, InterfaceError)):
+        return True
+    return isinstance(exc, DBAPIError) and exc.connection_invalidated
+
+
+class ReplicaSet:
+    """Read replicas used round-robin, each taken out of rotation for a while after failing.
+
+    Engines are created on first use like the primary's. A replica that could
+    not be reached is skipped for ``eject_seconds`` and then tried again.
+    """
+
+    def __init__(self, urls: List[str], config: Settings):
+        """Initialize replica set.
+
+        Args:
+            urls: Sync database URLs of the replicas
+            config: Settings with pool options and DB_REPLICA_EJECT_SECONDS
+        """
+        self.urls = urls
+        self.config = config
+        self.eject_seconds = config.DB_REPLICA_EJECT_SECONDS
+        self._engines: List[Optional[AsyncEngine]] = [None] * len(urls)
+        self._session_factories: List[Optional[async_sessionmaker]] = [None] * len(urls)
+        self._ejected_until = [0.0] * len(urls)
+        self._next = 0
+
+    def __len__(self) -> int:
+        """Number of configured replicas."""
+        return len(self.urls)
+
+    def choose(self) -> Optional[int]:
+        """Index of the next replica in rotation, or None if all are ejected."""
+        now = time.monotonic()
+        for offset in range(len(self.urls)):
+            index = (self._next + offset) % len(self.urls)
+            if self._ejected_until[index] <= now:
+                self._next = index + 1
+                return index
+        return None
+
+    def session_factory(self, index: int) -> async_sessionmaker:
+        """Async session factory of a replica, creating its engine on first use."""
+        factory = self._session_factories[index]
+        if factory is None:
+            url = self.urls[index]
+            engine = create_async_engine(
+                to_async_url(url), **engine_options(url, is_async=True, config=self.config)
+            )
+            instrument_engine(engine.sync_engine)
+            factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+            self._engines[index] = engine
+            self._session_factories[index] = factory
+        return factory
+
+    def eject(self, index: int) -> None:
+        """Take a replica out of rotation for eject_seconds."""
+        self._ejected_until[index] = time.monotonic() + self.eject_seconds
+        db_replica_ejections_total.inc(replica=str(index))
+        logger.warning(
+            "Read replica %s unavailable, ejected for %ss", self._display_url(index),
+            self.eject_seconds,
+        )
+
+    def _display_url(self, index: int) -> str:
+        """Replica URL without its password."""
+        return make_url(self.urls[index]).render_as_string(hide_password=True)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Rotation state and pool statistics of each replica."""
+        now = time.monotonic()
+        replicas = []
+        for index, engine in enumerate(self._engines):
+            replicas.append({
+                "url": self._display_url(index),
+                "ejected_for_seconds": round(max(0.0, self._ejected_until[index] - now), 3),
+                "pool": pool_status(engine.pool) if engine is not None else None,
+            })
+        return replicas
+
+    def reset_after_fork(self) -> None:
+        """Drop pooled connections inherited from a parent process."""
+        for engine in self._engines:
+            if engine is not None:
+                engine.sync_engine.dispose(close=False)
+
+    async def dispose(self) -> None:
+        """Close all replica connections; engines are recreated on next use."""
+        for engine in self._engines:
+            if engine is not None:
+                await engine.dispose()
+        self._engines = [None] * len(self.urls)
+        self._session_factories = [None] * len(self.urls)
+
+
+class Database:
+    """Engines and session factories of one application, created on first use.
+
+    Nothing is built when the object is created, so importing the app or
+    constructing it before workers fork does not load drivers or open pools.
+    The app's lifespan disposes the engines on shutdown.
+    """
+
+    def __init__(self, config: Optional[Settings] = None):
+        """Initialize database.
+
+        Args:
+            config: Settings with DATABASE_URL and pool options
+                (defaults to app.config.settings)
+        """
+        self.config = config or settings
+        self.database_url = self.config.DATABASE_URL
+        self._engine: Optional[Engine] = None
+        self._session_factory: Optional[sessionmaker] = None
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_session_factory: Optional[async_sessionmaker] = None
+        self.replicas = ReplicaSet(self.config.DATABASE_REPLICA_URLS, self.config)
+
+    @property
+    def engine(self) -> Engine:
+        """Sync engine (scripts and migrations)."""
+        if self._engine is None:
+            self._engine = create_engine(
+                self.database_url, **engine_options(self.database_url, config=self.config)
+            )
+        return self._engine
+
+    @property
+    def session_factory(self) -> sessionmaker:
+        """Sync session factory."""
+        if self._session_factory is None:
+            self._session_factory = sessionmaker(
+                autocommit=False, autoflush=False, bind=self.engine
+            )
+        return self._session_factory
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """Async engine used by the API."""
+        if self._async_engine is None:
+            self._async_engine = create_async_engine(
+                to_async_url(self.database_url),
+                **engine_options(self.database_url, is_async=True, config=self.config),
+            )
+            instrument_engine(self._async_engine.sync_engine)
+        return self._async_engine
+
+    @property
+    def async_session_factory(self) -> async_sessionmaker:
+        """Async session factory used by the API."""
+        if self._async_session_factory is None:
+            self._async_session_factory = async_sessionmaker(
+                bind=self.async_engine, autoflush=False, expire_on_commit=False
+            )
+        return self._async_session_factory
+
+    def pool_status(self) -> Optional[Dict[str, Any]]:
+        """Async pool statistics, or None if the async engine was never used."""
+        if self._async_engine is None:
+            return None
+        return pool_status(self._async_engine.pool)
+
+    def reset_after_fork(self) -> None:
+        """Drop pooled connections inherited from a parent process.
+
+        Called in forked workers: the parent's connections are abandoned
+        without being closed (closing them would break them for the parent),
+        and the engines open fresh connections on next use.
+        """
+        if self._engine is not None:
+            self._engine.dispose(close=False)
+        if self._async_engine is not None:
+            self._async_engine.sync_engine.dispose(close=False)
+        self.replicas.reset_after_fork()
+
+    async def dispose(self) -> None:
+        """Close all pooled connections; engines are recreated on next use."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+        if self._engine is not None:
+            self._engine.dispose()
+        await self.replicas.dispose()
+        self._engine = self._async_engine = None
+        self._session_factory = self._async_session_factory = None
 
-# Only create engine if not in test environment
-if os.getenv("TESTING") != "true":
-    engine = create_engine(settings.DATABASE_URL)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-else:
-    engine = None
-    SessionLocal = None
 
 Base = declarative_base()
 
 
-def get_db():
-    """Get database session."""
-    db = SessionLocal()
+def get_db(request: Request) -> Iterator[Session]:
+    """Get database session from the app's database."""
+    db = request.app.state.database.session_factory()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """Get async database session from the app's database."""
+    async with request.app.state.database.async_session_factory() as db:
+        yield db
+
+
+async def get_async_read_db(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> AsyncIterator[AsyncSession]:
+    """Get async session for read-only queries.
+
+    Sessions go to the read replicas round-robin. Without replicas, or while
+    all of them are ejected, the request's primary session is shared instead,
+    so a request never holds two primary connections. A replica that cannot
+    be reached is ejected; that request fails and later ones go elsewhere.
+    Reads may lag behind the primary by the replication delay.
+    """
+    replicas: ReplicaSet = request.app.state.database.replicas
+    index = replicas.choose() if replicas else None
+    if index is None:
+        yield db
+        return
+
+    async with replicas.session_factory(index)() as read_db:
+        try:
+            yield read_db
+        except Exception as exc:
+            if is_unavailable_error(exc):
+                replicas.eject(index)
+            raise
@@ -1,35 +1,164 @@
 """Main FastAPI application."""
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from app import config
+from app.config import PROCESS_WIDE_SETTINGS, Settings
+from app.database import Database
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.blocking import BlockingCallMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.routers import auth, health, internal, metrics, posts, profiles, well_known
+from app.services.health import ReadinessProbe
+from app.services.token_revocation import run_token_maintenance
+from app.utils.blocking_detector import BlockingCallDetector
+from app.utils.loop_monitor import EventLoopLagMonitor
+from app.utils.password import password_hasher
+from app.utils.profiling import ProfileStore
+from app.utils.structured_logging import LogPipeline
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    settings: Settings = app.state.settings
+    database: Database = app.state.database
+    log_pipeline = LogPipeline(settings)
+    log_pipeline.start()
+    loop_monitor: EventLoopLagMonitor = app.state.loop_monitor
+    background_tasks = []
+    if settings.TOKEN_DENYLIST_SYNC_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(run_token_maintenance(
+            database.async_session_factory, settings.TOKEN_DENYLIST_SYNC_SECONDS
+        )))
+    if loop_monitor.enabled:
+        background_tasks.append(asyncio.create_task(loop_monitor.run()))
+    if settings.LOOP_BLOCK_DETECTOR_ENABLED:
+        app.state.blocking_detector.start()
+
+    yield
+
+    app.state.blocking_detector.stop()
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await database.dispose()
+    password_hasher.shutdown()
+    log_pipeline.stop()
+
+
+def _check_process_wide_settings(settings: Settings) -> None:
+    """Reject settings that the process-wide components would silently ignore.
+
+    Args:
+        settings: Settings the app is built with
+
+    Raises:
+        ValueError: If a setting in PROCESS_WIDE_SETTINGS differs from app.config.settings
+    """
+    conflicts = [
+        name for name in PROCESS_WIDE_SETTINGS
+        if getattr(settings, name) != getattr(config.settings, name)
+    ]
+    if conflicts:
+        raise ValueError(
+            "These settings are shared by every app in the process and must match "
+            f"app.config.settings: {', '.join(conflicts)}"
+        )
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """Build the application.
+
+    Building the app does not connect to the database: engines are created by
+    ``app.state.database`` on first use and disposed when the lifespan ends.
+    The database, middleware, endpoints and background tasks follow
+    ``settings``; JWT keys, caches, login limiters, the password hasher and
+    the auth event log are shared by the process (see PROCESS_WIDE_SETTINGS).
+
+    Args:
+        settings: Application settings (defaults to app.config.settings)
+
+    Returns:
+        FastAPI application
+
+    Raises:
+        ValueError: If settings disagree with app.config.settings on a process-wide setting
+    """
+    settings = settings or config.settings
+    _check_process_wide_settings(settings)
+    app = FastAPI(
+        title="Alt X API",
+        description="Authentication API for Alt X",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    app.state.settings = settings
+    app.state.database = Database(settings)
+    app.state.loop_monitor = EventLoopLagMonitor(settings.HEALTH_LOOP_LAG_INTERVAL_MS / 1000)
+    app.state.readiness = ReadinessProbe(
+        app.state.database, app.state.loop_monitor, settings
+    )
+    app.state.blocking_detector = BlockingCallDetector(settings.LOOP_BLOCK_THRESHOLD_MS / 1000)
+    app.state.profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173", "http://localhost:3000"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Request metrics
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
 
-from app.routers import auth
+    # Event loop stall attribution (opt-in, for staging and load tests)
+    if settings.LOOP_BLOCK_DETECTOR_ENABLED:
+        app.add_middleware(BlockingCallMiddleware, detector=app.state.blocking_detector)
 
-app = FastAPI(
-    title="Alt X API",
-    description="Authentication API for Alt X",
-    version="0.1.0"
-)
+    # On-demand request profiling (opt-in)
+    if settings.PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=app.state.profile_store,
+            token=settings.PROFILING_TOKEN,
+            sample_rate=settings.PROFILING_SAMPLE_RATE,
+        )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    # Structured access log (outermost, so it times the whole request)
+    if settings.ACCESS_LOG_ENABLED:
+        app.add_middleware(
+            AccessLogMiddleware, success_sample_rate=settings.LOG_SUCCESS_SAMPLE_RATE
+        )
 
-# Include routers
-app.include_router(auth.router)
+    # Include routers
+    app.include_router(auth.router)
+    app.include_router(health.router)
+    app.include_router(posts.router)
+    app.include_router(well_known.router)
+    app.include_router(internal.router)
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics.router)
+    if settings.PROFILING_ENABLED:
+        app.include_router(profiles.router)
 
+    @app.get("/")
+    async def root():
+        """Root endpoint."""
+        return {"message": "Alt X API is running"}
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {"message": "Alt X API is running"}
+    return app
 
 
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+app = create_app()
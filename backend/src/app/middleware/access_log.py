@@ -0,0 +1,55 @@
+"""Structured access log."""
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.metrics import method_label, route_template
+from app.utils.structured_logging import request_log_fields, sampled
+
+logger = logging.getLogger("app.access")
+
+
+class AccessLogMiddleware:
+    """Log one JSON line per request.
+
+    Error responses (status >= 400) are always logged; successful ones are
+    kept at ``success_sample_rate`` (the line records the rate so counts can
+    be scaled back up). Handlers add fields such as ``user_id`` or
+    ``auth_failure`` with ``annotate_request``.
+    """
+
+    def __init__(self, app: ASGIApp, success_sample_rate: float = 1.0):
+        self.app = app
+        self.success_sample_rate = success_sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        fields = {}
+        token = request_log_fields.set(fields)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            request_log_fields.reset(token)
+            if status_code >= 400 or sampled(self.success_sample_rate):
+                logger.info("request", extra={"fields": {
+                    "method": method_label(scope),
+                    "route": route_template(scope),
+                    "status": status_code,
+                    "duration_ms": round(duration * 1000, 3),
+                    "sample_rate": 1.0 if status_code >= 400 else self.success_sample_rate,
+                    **fields,
+                }})
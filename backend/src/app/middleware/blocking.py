@@ -0,0 +1,27 @@
+"""Request attribution for the blocking call detector."""
+import asyncio
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.middleware.metrics import method_label, route_template
+from app.utils.blocking_detector import BlockingCallDetector
+
+
+class BlockingCallMiddleware:
+    """Record which route the current task serves so stalls can be attributed."""
+
+    def __init__(self, app: ASGIApp, detector: BlockingCallDetector):
+        self.app = app
+        self.detector = detector
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        self.detector.routes[task] = (method_label(scope), route_template(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.detector.routes.pop(task, None)
@@ -0,0 +1,108 @@
+"""Request metrics middleware."""
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+OTHER_METHOD = "OTHER"
+
+STANDARD_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE"}
+)
+
+# Key under scope["state"] caching the resolved route template of a request
+_ROUTE_STATE_KEY = "route_template"
+
+
+def method_label(scope: Scope) -> str:
+    """HTTP method of a request as a bounded label value.
+
+    The method is chosen by the client, so anything outside the standard
+    methods is reported as "OTHER" to keep metric cardinality bounded.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        Standard method name or "OTHER"
+    """
+    method = scope["method"]
+    return method if method in STANDARD_METHODS else OTHER_METHOD
+
+
+def _match_route(scope: Scope) -> str:
+    """Scan the app's routes for the one serving scope."""
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    if router is None:
+        return UNMATCHED_ROUTE
+
+    partial = None
+    for route in router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+        if match == Match.PARTIAL and partial is None:
+            partial = getattr(route, "path", None)
+    return partial or UNMATCHED_ROUTE
+
+
+def route_template(scope: Scope) -> str:
+    """Resolve the route template (e.g. "/api/posts/{id}") serving a request.
+
+    Raw paths are never used as labels so metric cardinality stays bounded.
+    The result is cached in ``scope["state"]`` (the dict behind
+    ``request.state``), so the route list is scanned once per request however
+    many middlewares ask.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        Path template of the matching route, or "unmatched"
+    """
+    state = scope.setdefault("state", {})
+    route = state.get(_ROUTE_STATE_KEY)
+    if route is None:
+        route = state[_ROUTE_STATE_KEY] = _match_route(scope)
+    return route
+
+
+class MetricsMiddleware:
+    """Record per-route request counts, latency and in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = method_label(scope)
+        route = route_template(scope)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method=method, route=route)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_request_duration_seconds.observe(
+                time.perf_counter() - start, method=method, route=route
+            )
+            http_requests_in_flight.dec(method=method, route=route)
+            http_requests_total.inc(method=method, route=route, status=str(status_code))
@@ -0,0 +1,86 @@
+"""On-demand cProfile capture of individual requests."""
+import asyncio
+import cProfile
+import hmac
+import random
+import time
+import uuid
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.metrics import method_label, route_template
+from app.utils.profiling import PROFILES_PATH, ProfileStore, profile_name
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+class ProfilingMiddleware:
+    """Profile requests carrying the profiling token, or a random sample.
+
+    A request is profiled when its ``X-Profile`` header matches the
+    configured token or, failing that, with probability ``sample_rate``.
+    cProfile hooks the whole thread, so one capture runs at a time per worker
+    (further candidates are served unprofiled) and a capture also contains
+    whatever other requests ran on the event loop meanwhile. The capture name
+    is returned in the ``X-Profile-Id`` response header. Requests fetching
+    the stored captures (which send the same token) are not profiled.
+
+    Only added to the app when profiling is enabled, so disabled profiling
+    costs nothing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        token: Optional[str] = None,
+        sample_rate: float = 0.0,
+    ):
+        self.app = app
+        self.store = store
+        self.token = token.encode() if token else None
+        self.sample_rate = sample_rate
+        self._active = False
+
+    def _wants_profile(self, scope: Scope) -> bool:
+        """Whether the request asked for, or was sampled for, a capture."""
+        if scope["path"].startswith(PROFILES_PATH):
+            return False
+        if self.token is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self.token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        name = profile_name(
+            time.time(), method_label(scope), route_template(scope), uuid.uuid4().hex[:8]
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [*message.get("headers", []), (PROFILE_ID_HEADER, name.encode())]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger) already owns the thread
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            self._active = False
+            await asyncio.to_thread(self.store.save, profiler, name)
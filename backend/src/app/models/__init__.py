@@ -1,4 +1,7 @@
 """Database models."""
+from app.models.post import Post
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
 from app.models.user import User
 
-__all__ = ["User"]
+__all__ = ["Post", "RefreshToken", "RevokedToken", "User"]
@@ -0,0 +1,26 @@
+"""Post model."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class Post(Base):
+    """Text post shown in the timeline, newest first."""
+
+    __tablename__ = "posts"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC with a
+        # (created_at, id) < (cursor) seek is served from this index alone
+        Index("ix_posts_created_at_id", "created_at", "id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
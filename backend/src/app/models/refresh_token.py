@@ -0,0 +1,24 @@
+"""Refresh token model."""
+from sqlalchemy import Column, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class RefreshToken(Base):
+    """Issued refresh token, looked up by the SHA-256 digest of its ``jti``.
+
+    Each login starts a token family; every refresh marks the presented token
+    as used and issues the next token of the same family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    jti_hash = Column(LargeBinary(32), primary_key=True)
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    expires_at = Column(DateTime, nullable=False, index=True)
+    # Set when the token has been exchanged; presenting it again is a reuse
+    used_at = Column(DateTime, nullable=True)
@@ -0,0 +1,17 @@
+"""Revoked token model."""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String
+
+from app.database import Base
+
+
+class RevokedToken(Base):
+    """Token ID (``jti``) revoked before its expiry, e.g. on logout."""
+
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key=True)
+    # Expiry of the revoked token; the row can be deleted afterwards
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
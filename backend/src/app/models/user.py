@@ -2,12 +2,17 @@
 import re
 import uuid
 from datetime import datetime
+from typing import Optional
 
-import bcrypt
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Integer, String, event, inspect
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database import Base
+from app.utils.password import check_password, hash_password
+
+PASSWORD_REQUIREMENTS_MESSAGE = (
+    "Password must be at least 8 characters long and contain both letters and numbers"
+)
 
 
 class User(Base):
@@ -20,31 +25,75 @@ class User(Base):
     hashed_password = Column(String(60), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Incremented whenever claims embedded in access tokens (e.g. email) change
+    version = Column(Integer, default=1, server_default="1", nullable=False)
 
-    def __init__(self, email: str, password: str, **kwargs):
+    def __init__(self, email: str, password: Optional[str], **kwargs):
         """Initialize user with email and password.
 
         Args:
             email: User's email address
-            password: Plain text password (will be hashed)
+            password: Plain text password (will be hashed); may be None only when
+                ``hashed_password`` is passed in kwargs
             **kwargs: Additional keyword arguments
 
         Raises:
             ValueError: If email format is invalid or password requirements not met
         """
         # Validate email format
-        if not email or not self._is_valid_email(email):
-            raise ValueError("Invalid email format")
+        self.validate_email(email)
 
-        # Validate password requirements
-        if not self._is_valid_password(password):
-            raise ValueError(
-                "Password must be at least 8 characters long and contain both letters and numbers"
-            )
+        hashed_password = kwargs.pop("hashed_password", None)
+        if hashed_password is None:
+            self.validate_password(password)
+            hashed_password = self._hash_password(password)
 
         super().__init__(**kwargs)
         self.email = email
-        self.hashed_password = self._hash_password(password)
+        self.hashed_password = hashed_password
+
+    @classmethod
+    def from_hashed_password(cls, email: str, hashed_password: str, **kwargs) -> "User":
+        """Create user from an already computed bcrypt hash.
+
+        Args:
+            email: User's email address
+            hashed_password: bcrypt hash of the user's password
+            **kwargs: Additional keyword arguments
+
+        Returns:
+            New, unsaved User instance
+
+        Raises:
+            ValueError: If email format is invalid
+        """
+        return cls(email, None, hashed_password=hashed_password, **kwargs)
+
+    @classmethod
+    def validate_email(cls, email: Optional[str]) -> None:
+        """Ensure email has a valid format.
+
+        Args:
+            email: Email address to validate
+
+        Raises:
+            ValueError: If email format is invalid
+        """
+        if not email or not cls._is_valid_email(email):
+            raise ValueError("Invalid email format")
+
+    @classmethod
+    def validate_password(cls, password: Optional[str]) -> None:
+        """Ensure password meets requirements.
+
+        Args:
+            password: Password to validate
+
+        Raises:
+            ValueError: If password requirements not met
+        """
+        if password is None or not cls._is_valid_password(password):
+            raise ValueError(PASSWORD_REQUIREMENTS_MESSAGE)
 
     @staticmethod
     def _is_valid_email(email: str) -> bool:
@@ -91,10 +140,7 @@ class User(Base):
         Returns:
             Hashed password as a string
         """
-        password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        return hashed.decode('utf-8')
+        return hash_password(password)
 
     def verify_password(self, password: str) -> bool:
         """Verify password against hashed password.
@@ -105,6 +151,11 @@ class User(Base):
         Returns:
             True if password matches, False otherwise
         """
-        password_bytes = password.encode('utf-8')
-        hashed_bytes = self.hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        return check_password(password, self.hashed_password)
+
+
+@event.listens_for(User, "before_update")
+def _bump_version_on_email_change(mapper, connection, target: User) -> None:
+    """Increment the user version when the email embedded in tokens changes."""
+    if inspect(target).attrs.email.history.has_changes():
+        target.version = (target.version or 1) + 1
@@ -1,82 +1,196 @@
 """Authentication router."""
-from typing import Annotated
-from uuid import UUID
+import math
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from jose import JWTError
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import ExpiredSignatureError, JWTError
+from sqlalchemy import Row, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_async_db, get_async_read_db
 from app.models.user import User
 from app.schemas.auth import (
-    AccessTokenResponse,
     LoginRequest,
+    LogoutRequest,
     RefreshTokenRequest,
     TokenResponse,
     UserResponse,
 )
-from app.services.auth import get_current_user
-from app.utils.jwt import create_access_token, create_refresh_token, decode_token
+from app.services.auth import access_token_claims, get_current_principal, get_user_identity
+from app.services.auth_events import auth_event
+from app.services.refresh_tokens import (
+    RefreshTokenError,
+    RefreshTokenReuseError,
+    issue_refresh_token,
+    revoke_refresh_token_family,
+    rotate_refresh_token,
+)
+from app.services.token_revocation import revoke_token
+from app.services.user_cache import UserIdentity
+from app.services.user_queries import load_credentials
+from app.utils.jwt import create_access_token, decode_token
+from app.utils.metrics import login_throttled_total
+from app.utils.password import PasswordHasherBusyError, needs_rehash, password_hasher
+from app.utils.rate_limit import login_email_limiter, login_ip_limiter
+from app.utils.responses import token_response, user_response
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+optional_security = HTTPBearer(auto_error=False)
+
+
+def _throttle_login(request: Request, email: str) -> None:
+    """Reject the attempt if its client IP or email is over the login rate limit.
+
+    Runs before the user lookup and bcrypt so rejected attempts cost microseconds.
+    Behind a proxy listed in ``FORWARDED_ALLOW_IPS`` the server has already set
+    the client to the address from X-Forwarded-For, so each end user gets their
+    own IP bucket instead of all of them sharing the proxy's.
+
+    Args:
+        request: Incoming request (for the client IP)
+        email: Email the login is attempted for
+
+    Raises:
+        HTTPException: 429 Too Many Requests with Retry-After
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    for limiter, key in (
+        (login_ip_limiter, client_ip),
+        (login_email_limiter, email.strip().lower()),
+    ):
+        retry_after = limiter.hit(key)
+        if retry_after > 0:
+            login_throttled_total.inc(scope=limiter.name)
+            auth_event("login", reason=f"throttled_{limiter.name}")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, please retry later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+
+async def _upgrade_password_hash(db: AsyncSession, user: Row, password: str) -> None:
+    """Rehash a verified password whose bcrypt cost differs from BCRYPT_ROUNDS.
+
+    Failures are swallowed so the login still succeeds; the upgrade is simply
+    retried on the user's next login.
+
+    Args:
+        db: Primary database session
+        user: Credentials row of the authenticated user (possibly from a read replica)
+        password: Verified plain text password
+    """
+    if not needs_rehash(user.hashed_password):
+        return
+
+    try:
+        hashed_password = await password_hasher.hash(password)
+        await db.execute(
+            update(User).where(User.id == user.id).values(hashed_password=hashed_password)
+        )
+        await db.commit()
+    except PasswordHasherBusyError:
+        return
+    except SQLAlchemyError:
+        await db.rollback()
+
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
-) -> TokenResponse:
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db)
+) -> ORJSONResponse:
     """Authenticate user and return JWT tokens.
 
+    The user is looked up on a read replica when configured; the password
+    rehash and the new refresh token are written to the primary.
+
     Args:
         login_data: Login credentials (email and password)
-        db: Database session
+        request: Incoming request
+        db: Primary database session
+        read_db: Read-only database session
 
     Returns:
         TokenResponse with access_token, refresh_token, and token_type
 
     Raises:
-        HTTPException: 401 Unauthorized if credentials are invalid
+        HTTPException: 401 Unauthorized if credentials are invalid,
+            429 Too Many Requests if the client IP or email is throttled,
+            503 Service Unavailable if password hashing capacity is exhausted
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == login_data.email).first()
+    _throttle_login(request, login_data.email)
 
-    # Verify user exists and password is correct
-    if not user or not user.verify_password(login_data.password):
+    # Find user by email (only the columns needed to authenticate and issue tokens)
+    user = await load_credentials(read_db, login_data.email)
+
+    # Verify user exists and password is correct (bcrypt runs off the event loop)
+    try:
+        password_valid = user is not None and await password_hasher.verify(
+            login_data.password, user.hashed_password
+        )
+    except PasswordHasherBusyError:
+        auth_event("login", user_id=user.id, reason="hasher_busy")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry later",
+            headers={"Retry-After": "1"},
+        )
+
+    if not password_valid:
+        if user is None:
+            auth_event("login", reason="unknown_email")
+        else:
+            auth_event("login", user_id=user.id, reason="invalid_password")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Create tokens
-    token_data = {"sub": str(user.id)}
-    access_token = create_access_token(token_data)
-    refresh_token = create_refresh_token(token_data)
+    # Transparently move the stored hash to the configured work factor
+    await _upgrade_password_hash(db, user, login_data.password)
 
-    return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer"
-    )
+    # Create tokens (the refresh token starts a new token family)
+    access_token = create_access_token(access_token_claims(user))
+    refresh_token = issue_refresh_token(db, user.id)
+    await db.commit()
+
+    auth_event("login", user_id=user.id)
+    return token_response(access_token, refresh_token)
 
 
-@router.post("/refresh", response_model=AccessTokenResponse)
+@router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
-) -> AccessTokenResponse:
-    """Issue new access token using refresh token.
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db)
+) -> ORJSONResponse:
+    """Issue new access and refresh tokens using a refresh token.
+
+    Refresh tokens are single use: the presented token is exchanged for the
+    next token of its family, and presenting it again revokes the family
+    (except within a short grace period, which returns the same next token).
+    The user needs no separate lookup, since its refresh tokens are deleted
+    along with it; only claims-only mode loads the identity for its claims.
 
     Args:
         refresh_data: Refresh token data
-        db: Database session
+        db: Primary database session
+        read_db: Read-only database session (identity lookup in claims-only mode)
 
     Returns:
-        AccessTokenResponse with new access_token and token_type
+        TokenResponse with new access_token, rotated refresh_token and token_type
 
     Raises:
-        HTTPException: 401 Unauthorized if refresh token is invalid
+        HTTPException: 401 Unauthorized if refresh token is invalid, used or expired
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -88,49 +202,85 @@ async def refresh_token(
         # Decode and validate the refresh token
         payload = decode_token(refresh_data.refresh_token, expected_type="refresh")
 
-        # Extract user ID from token
-        user_id_str: str = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
+        # Exchange it for the next token of its family
+        user_id, new_refresh_token = await rotate_refresh_token(db, payload)
 
-        # Convert string to UUID
-        user_id = UUID(user_id_str)
-
-    except (JWTError, ValueError):
+    except ExpiredSignatureError:
+        auth_event("refresh", reason="token_expired")
         raise credentials_exception
-
-    # Verify user still exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    except JWTError:
+        auth_event("refresh", reason="invalid_token")
+        raise credentials_exception
+    except RefreshTokenReuseError:
+        auth_event("refresh", user_id=payload.get("sub"), reason="refresh_token_reused")
+        raise credentials_exception
+    except RefreshTokenError:
+        auth_event("refresh", user_id=payload.get("sub"), reason="refresh_token_invalid")
         raise credentials_exception
 
     # Create new access token
-    token_data = {"sub": str(user.id)}
-    access_token = create_access_token(token_data)
+    if settings.AUTH_CLAIMS_ONLY:
+        identity = await get_user_identity(read_db, user_id)
+        if identity is None:
+            auth_event("refresh", user_id=user_id, reason="unknown_user")
+            raise credentials_exception
+        access_token = create_access_token(access_token_claims(identity))
+    else:
+        access_token = create_access_token({"sub": str(user_id)})
 
-    return AccessTokenResponse(
-        access_token=access_token,
-        token_type="bearer"
-    )
+    await db.commit()
+
+    auth_event("refresh", user_id=user_id)
+    return token_response(access_token, new_refresh_token)
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout():
-    """Logout endpoint - instructs client to delete tokens.
+async def logout(
+    credentials: Annotated[
+        Optional[HTTPAuthorizationCredentials], Depends(optional_security)
+    ],
+    logout_data: Optional[LogoutRequest] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Logout endpoint - revokes the presented tokens until they expire.
 
-    This endpoint returns 204 No Content as the actual logout is handled
-    client-side by deleting the stored tokens.
+    The Bearer access token and, if given, the refresh token in the body are
+    added to the revocation list, and the refresh token's family is revoked.
+    Missing or already invalid tokens are ignored, so logout always succeeds.
+
+    Args:
+        credentials: Optional Bearer access token to revoke
+        logout_data: Optional refresh token to revoke
+        db: Database session
 
     Returns:
         204 No Content
     """
+    tokens = []
+    if credentials is not None:
+        tokens.append((credentials.credentials, "access"))
+    if logout_data is not None and logout_data.refresh_token:
+        tokens.append((logout_data.refresh_token, "refresh"))
+
+    revoked = False
+    for token, token_type in tokens:
+        try:
+            payload = decode_token(token, expected_type=token_type)
+        except JWTError:
+            continue
+        revoked = await revoke_token(db, payload) or revoked
+        if token_type == "refresh":
+            revoked = await revoke_refresh_token_family(db, payload) or revoked
+
+    if revoked:
+        await db.commit()
     return None
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: Annotated[User, Depends(get_current_user)]
-) -> UserResponse:
+    current_user: Annotated[UserIdentity, Depends(get_current_principal)]
+) -> ORJSONResponse:
     """Get current authenticated user information.
 
     Args:
@@ -139,7 +289,4 @@ async def get_me(
     Returns:
         UserResponse with user id and email
     """
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email
-    )
+    return user_response(current_user.id, current_user.email)
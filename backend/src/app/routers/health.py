@@ -0,0 +1,34 @@
+"""Liveness and readiness endpoints for orchestrators and load balancers."""
+from typing import Dict
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import ORJSONResponse
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health")
+@router.get("/health/live")
+async def live() -> Dict[str, str]:
+    """Liveness: the process is up and serving requests.
+
+    Does not touch dependencies, so a slow database never gets a worker restarted.
+    """
+    return {"status": "healthy"}
+
+
+@router.get("/health/ready")
+async def ready(request: Request) -> ORJSONResponse:
+    """Readiness: the worker can serve requests without queueing.
+
+    Returns:
+        200 with status "ready", or 503 with status "degraded" when the
+        database ping fails or times out, the connection pool is exhausted
+        or the event loop lag exceeds HEALTH_MAX_LOOP_LAG_MS; the body lists
+        the result of each check
+    """
+    result = await request.app.state.readiness.check()
+    return ORJSONResponse(
+        {"status": "ready" if result["ready"] else "degraded", "checks": result["checks"]},
+        status_code=status.HTTP_200_OK if result["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
@@ -0,0 +1,56 @@
+"""Internal operational endpoints (not part of the public API)."""
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Request
+
+from app.services.auth import require_internal_token
+from app.services.user_cache import user_cache
+from app.utils.rate_limit import login_email_limiter, login_ip_limiter
+from app.utils.token_cache import token_cache
+from app.utils.token_denylist import token_denylist
+
+# Every endpoint requires the X-Internal-Token header
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get("/stats")
+async def get_stats(request: Request) -> Dict[str, Any]:
+    """Get in-process cache statistics.
+
+    Returns:
+        Counters and hit ratios of the token and user identity caches, the
+        size of the token revocation denylist, login limiter counters and
+        event loop lag and stall detections
+    """
+    return {
+        "token_cache": token_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "token_denylist": token_denylist.stats(),
+        "login_rate_limit": {
+            "ip": login_ip_limiter.stats(),
+            "email": login_email_limiter.stats(),
+        },
+        "event_loop": {
+            "lag": request.app.state.loop_monitor.stats(),
+            "blocking_calls": request.app.state.blocking_detector.stats(),
+        },
+    }
+
+
+@router.get("/db-pool")
+async def get_db_pool(request: Request) -> Dict[str, Any]:
+    """Get database connection pool statistics.
+
+    Returns:
+        Checked-out/idle/overflow counts and cumulative checkout wait time
+        of the async engine pool (null until the engine is first used), and
+        the rotation state and pools of the read replicas
+    """
+    database = request.app.state.database
+    return {"pool": database.pool_status(), "replicas": database.replicas.status()}
+
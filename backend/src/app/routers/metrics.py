@@ -0,0 +1,74 @@
+"""Prometheus metrics endpoint."""
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+
+from app.database import Database
+from app.services.auth import require_metrics_token
+from app.services.user_cache import user_cache
+from app.utils.metrics import registry
+from app.utils.rate_limit import login_email_limiter, login_ip_limiter
+from app.utils.token_cache import token_cache
+from app.utils.token_denylist import token_denylist
+
+# Scrapes must send "Authorization: Bearer <METRICS_TOKEN>"
+router = APIRouter(
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_token)],
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+cache_events_total = registry.collected_counter(
+    "cache_events_total", "Cache lookups and evictions by cache and outcome.",
+    ("cache", "event"),
+)
+cache_entries = registry.gauge("cache_entries", "Current number of cache entries.", ("cache",))
+db_pool_connections = registry.gauge(
+    "db_pool_connections", "Database pool connections by state.", ("state",),
+)
+db_pool_checkout_wait_seconds_total = registry.collected_counter(
+    "db_pool_checkout_wait_seconds_total", "Time spent checking out pool connections.",
+)
+db_pool_checkout_timeouts_total = registry.collected_counter(
+    "db_pool_checkout_timeouts_total", "Pool checkouts that timed out.",
+)
+
+
+def _collect_cache_stats() -> None:
+    """Copy cache sizes into gauges and cache event counts into counters."""
+    caches = (
+        ("token", token_cache.stats()),
+        ("user", user_cache.stats()),
+        ("token_denylist", token_denylist.stats()),
+        ("login_rate_limit_ip", login_ip_limiter.stats()),
+        ("login_rate_limit_email", login_email_limiter.stats()),
+    )
+    for name, stats in caches:
+        cache_entries.set(stats["size"], cache=name)
+        for event in ("hits", "negative_hits", "misses", "evictions", "invalidations", "purged"):
+            if event in stats:
+                cache_events_total.set(stats[event], cache=name, event=event)
+
+
+def _collect_pool_stats(database: Database) -> None:
+    """Copy the app's async engine pool occupancy and checkout totals."""
+    status = database.pool_status()
+    if status is None:
+        return
+    for state in ("checked_out", "idle", "overflow"):
+        if state in status:
+            db_pool_connections.set(status[state], state=state)
+    if "checkout_wait_seconds_total" in status:
+        db_pool_checkout_wait_seconds_total.set(status["checkout_wait_seconds_total"])
+        db_pool_checkout_timeouts_total.set(status["checkout_timeouts"])
+
+
+registry.add_collector(_collect_cache_stats)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request) -> PlainTextResponse:
+    """Expose metrics in the Prometheus text exposition format."""
+    _collect_pool_stats(request.app.state.database)
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
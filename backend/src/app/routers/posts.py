@@ -0,0 +1,49 @@
+"""Posts router."""
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_read_db
+from app.schemas.post import PostPage
+from app.services.auth import get_current_principal
+from app.services.posts import InvalidCursorError, list_posts
+from app.utils.responses import post_page_response
+
+router = APIRouter(prefix="/api/posts", tags=["posts"])
+
+
+@router.get("", response_model=PostPage, dependencies=[Depends(get_current_principal)])
+async def get_posts(
+    limit: Annotated[int, Query(ge=1, le=100, description="Page size")] = 20,
+    cursor: Annotated[
+        Optional[str], Query(description="next_cursor of the previous page")
+    ] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> ORJSONResponse:
+    """List posts newest first, one page at a time (timeline lazy loading).
+
+    Pagination is keyset based: pass the ``next_cursor`` of a page to get the
+    next one. Every page costs the same regardless of how deep it is, and
+    posts created meanwhile never shift later pages.
+
+    Requires a valid access token.
+
+    Args:
+        limit: Page size
+        cursor: Cursor from the previous page (omit for the first page)
+        db: Read-only database session
+
+    Returns:
+        PostPage with the posts and the cursor of the next page
+
+    Raises:
+        HTTPException: 400 Bad Request if the cursor is invalid
+    """
+    try:
+        rows, next_cursor = await list_posts(db, limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    return post_page_response(rows, next_cursor)
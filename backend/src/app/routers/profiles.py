@@ -0,0 +1,42 @@
+"""Download of stored request profiles (only mounted while profiling is enabled)."""
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse
+
+from app.services.auth import require_profiling_token
+from app.utils.profiling import PROFILES_PATH
+
+# Every endpoint requires the same X-Profile token that triggers a capture
+router = APIRouter(
+    prefix=PROFILES_PATH,
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_profiling_token)],
+)
+
+
+@router.get("")
+async def list_profiles(request: Request) -> Dict[str, Any]:
+    """List stored request profiles.
+
+    Returns:
+        Names and sizes of the captures, newest first
+    """
+    return {"profiles": request.app.state.profile_store.list()}
+
+
+@router.get("/{name}")
+async def get_profile(name: str, request: Request) -> FileResponse:
+    """Download a stored request profile.
+
+    The file is in pstats format: open it with ``python -m pstats <file>``
+    or ``snakeviz <file>``.
+
+    Raises:
+        HTTPException: 404 if there is no capture with that name
+    """
+    path = request.app.state.profile_store.path(name)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
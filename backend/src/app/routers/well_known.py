@@ -0,0 +1,34 @@
+"""Well-known discovery endpoints."""
+from fastapi import APIRouter, Request, Response
+
+from app.utils import jwt_keys
+
+router = APIRouter(prefix="/.well-known", tags=["auth"])
+
+
+@router.get("/jwks.json")
+async def get_jwks(request: Request) -> Response:
+    """Get the public keys that verify issued tokens.
+
+    The document is cacheable so gateways and sidecars can verify tokens
+    locally without calling this service on every request.
+
+    Args:
+        request: Incoming request (for If-None-Match revalidation and the app's settings)
+
+    Returns:
+        JWK set (empty when tokens are signed with a shared HMAC secret),
+        or 304 Not Modified if the client's copy is current
+    """
+    key_ring = jwt_keys.key_ring
+    headers = {
+        "Cache-Control": f"public, max-age={request.app.state.settings.JWKS_MAX_AGE_SECONDS}",
+        "ETag": key_ring.jwks_etag,
+    }
+    if request.headers.get("if-none-match") == key_ring.jwks_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=key_ring.jwks_body,
+        media_type="application/jwk-set+json",
+        headers=headers,
+    )
@@ -1,4 +1,5 @@
 """Authentication schemas."""
+from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
@@ -24,6 +25,12 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str = Field(..., description="JWT refresh token")
 
 
+class LogoutRequest(BaseModel):
+    """Logout request schema."""
+
+    refresh_token: Optional[str] = Field(default=None, description="JWT refresh token to revoke")
+
+
 class AccessTokenResponse(BaseModel):
     """Access token response schema."""
 
@@ -0,0 +1,23 @@
+"""Post schemas."""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class PostResponse(BaseModel):
+    """Post in the timeline."""
+
+    id: UUID = Field(..., description="Post ID")
+    content: str = Field(..., description="Post body")
+    created_at: datetime = Field(..., description="Creation time (UTC)")
+
+
+class PostPage(BaseModel):
+    """One page of the timeline, newest first."""
+
+    items: List[PostResponse] = Field(..., description="Posts on this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page; null on the last page"
+    )
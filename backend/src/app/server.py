@@ -0,0 +1,131 @@
+"""Production server: gunicorn managing uvicorn workers, configured from Settings.
+
+Run with ``python -m app``. The master process binds the socket, optionally
+imports the app once (``SERVER_PRELOAD``) and forks ``SERVER_WORKERS`` workers.
+Workers are recycled after ``SERVER_MAX_REQUESTS`` requests and, on SIGTERM,
+stop accepting connections and drain in-flight requests for up to
+``SERVER_GRACEFUL_TIMEOUT`` seconds.
+"""
+import argparse
+import os
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from gunicorn.app.base import BaseApplication
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+from uvicorn_worker import UvicornWorker
+
+from app import config
+from app.config import Settings
+
+# Seconds of the graceful timeout reserved for lifespan shutdown (disposing
+# engines) after in-flight requests have drained
+SHUTDOWN_MARGIN_SECONDS = 5
+
+
+class DrainingUvicornWorker(UvicornWorker):
+    """Uvicorn worker that bounds request draining by gunicorn's graceful timeout.
+
+    Without a limit uvicorn waits for in-flight requests indefinitely and the
+    master kills the worker before the lifespan shutdown can run.
+    """
+
+    CONFIG_KWARGS = {"loop": "auto", "http": "auto", "lifespan": "on"}
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize worker."""
+        super().__init__(*args, **kwargs)
+        self.config.timeout_graceful_shutdown = max(
+            1, self.cfg.graceful_timeout - SHUTDOWN_MARGIN_SECONDS
+        )
+
+
+def default_worker_count() -> int:
+    """One worker per CPU available to this process (respects CPU affinity)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def post_fork(arbiter: Arbiter, worker: Worker) -> None:
+    """Make a preloaded app's database safe to use in the forked worker."""
+    application: Optional[FastAPI] = getattr(arbiter.app, "application", None)
+    if application is not None:
+        application.state.database.reset_after_fork()
+
+
+def gunicorn_options(settings: Settings) -> Dict[str, Any]:
+    """Map settings to gunicorn configuration.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        gunicorn setting names and values
+    """
+    return {
+        "bind": f"{settings.BACKEND_HOST}:{settings.BACKEND_PORT}",
+        "workers": settings.SERVER_WORKERS or default_worker_count(),
+        "worker_class": f"{__name__}.DrainingUvicornWorker",
+        "preload_app": settings.SERVER_PRELOAD,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.SERVER_GRACEFUL_TIMEOUT,
+        "timeout": settings.SERVER_TIMEOUT,
+        "keepalive": settings.SERVER_KEEPALIVE,
+        "backlog": settings.SERVER_BACKLOG,
+        "forwarded_allow_ips": settings.FORWARDED_ALLOW_IPS,
+        "accesslog": "-" if settings.SERVER_ACCESS_LOG else None,
+        "errorlog": "-",
+        "post_fork": post_fork,
+    }
+
+
+class Server(BaseApplication):
+    """gunicorn application serving ``create_app(settings)``."""
+
+    def __init__(self, settings: Settings):
+        """Initialize server.
+
+        Args:
+            settings: Application settings
+        """
+        self.settings = settings
+        self.options = gunicorn_options(settings)
+        self.application: Optional[FastAPI] = None
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Apply options to the gunicorn configuration."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> FastAPI:
+        """Build the app (in the master when preloading, else in each worker)."""
+        from app.main import create_app
+
+        self.application = create_app(self.settings)
+        return self.application
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the production server."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app",
+        description="Run the API with multiple workers. Configured by SERVER_* settings.",
+    )
+    parser.add_argument(
+        "--print-config", action="store_true",
+        help="Print the resolved server configuration and exit",
+    )
+    args = parser.parse_args(argv)
+
+    server = Server(config.settings)
+    if args.print_config:
+        for key, value in server.options.items():
+            if not callable(value):
+                print(f"{key} = {value}")
+        return
+    server.run()
@@ -1,60 +1,280 @@
 """Authentication service and dependencies."""
-from typing import Annotated
+import hmac
+from typing import Annotated, Any, Dict, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
-from sqlalchemy.orm import Session
+from jose import ExpiredSignatureError, JWTError
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_async_db, get_async_read_db
 from app.models.user import User
+from app.services.auth_events import auth_event
+from app.services.user_cache import UserIdentity, user_cache
+from app.services.user_queries import load_identity
 from app.utils.jwt import decode_token
+from app.utils.structured_logging import annotate_request
 
 security = HTTPBearer()
+scrape_security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current user from Bearer token.
+async def get_user_identity(db: AsyncSession, user_id: UUID) -> Optional[UserIdentity]:
+    """Get user identity from the identity cache, loading it from the database on miss.
 
     Args:
-        credentials: HTTP authorization credentials containing Bearer token
         db: Database session
+        user_id: User's unique identifier
 
     Returns:
-        Current authenticated user
+        User identity, or None if the user does not exist
+    """
+    identity = user_cache.get(user_id)
+    if identity is not None:
+        return identity
 
-    Raises:
-        HTTPException: 401 Unauthorized if token is invalid or user not found
+    identity = await load_identity(db, user_id)
+    if identity is not None:
+        user_cache.put(identity)
+    return identity
+
+
+def access_token_claims(user: Union[User, UserIdentity, Row]) -> Dict[str, Any]:
+    """Claims to embed in an access token for user.
+
+    In claims-only mode the email and user version are included so that
+    ``get_current_principal`` can authenticate without a database lookup.
+
+    Args:
+        user: User, identity or credentials row (anything with id, email and version)
+
+    Returns:
+        Token claims (at least ``sub``)
+    """
+    claims: Dict[str, Any] = {"sub": str(user.id)}
+    if settings.AUTH_CLAIMS_ONLY:
+        claims["email"] = user.email
+        claims["ver"] = user.version
+    return claims
+
+
+def _credentials_exception(reason: str, user_id: Optional[UUID] = None) -> HTTPException:
+    """401 error raised for any authentication failure.
+
+    The specific reason is only logged; clients always get the same error.
+
+    Args:
+        reason: Failure reason for the auth event log
+        user_id: User the token was issued for, if known
     """
-    credentials_exception = HTTPException(
+    auth_event("token", user_id=user_id, reason=reason)
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _decode_access_token(credentials: HTTPAuthorizationCredentials) -> Tuple[UUID, Dict]:
+    """Validate a Bearer access token.
+
+    Args:
+        credentials: HTTP authorization credentials containing Bearer token
+
+    Returns:
+        Tuple of (user id, token payload)
+
+    Raises:
+        HTTPException: 401 Unauthorized if token is invalid
+    """
     try:
         # Decode and validate the access token
-        token = credentials.credentials
-        payload = decode_token(token, expected_type="access")
+        payload = decode_token(credentials.credentials, expected_type="access")
 
         # Extract user ID from token
         user_id_str: str = payload.get("sub")
         if user_id_str is None:
-            raise credentials_exception
+            raise _credentials_exception("missing_subject")
 
         # Convert string to UUID
-        user_id = UUID(user_id_str)
+        return UUID(user_id_str), payload
+
+    except ExpiredSignatureError:
+        raise _credentials_exception("token_expired")
+    except JWTError:
+        raise _credentials_exception("invalid_token")
+    except ValueError:
+        raise _credentials_exception("malformed_subject")
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: AsyncSession = Depends(get_async_read_db)
+) -> UserIdentity:
+    """Get current user from Bearer token.
+
+    Args:
+        credentials: HTTP authorization credentials containing Bearer token
+        db: Read-only database session (a replica when configured)
+
+    Returns:
+        Identity of the current authenticated user
+
+    Raises:
+        HTTPException: 401 Unauthorized if token is invalid or user not found
+    """
+    user_id, _ = _decode_access_token(credentials)
+
+    # Fetch user identity (cached, falling back to the database)
+    identity = await get_user_identity(db, user_id)
+    if identity is None:
+        raise _credentials_exception("unknown_user", user_id)
+
+    annotate_request(user_id=str(user_id))
+    return identity
 
-    except (JWTError, ValueError):
-        raise credentials_exception
 
-    # Fetch user from database
-    user = db.query(User).filter(User.id == user_id).first()
+async def get_current_principal(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: AsyncSession = Depends(get_async_read_db)
+) -> UserIdentity:
+    """Get current user for lightweight endpoints, trusting token claims if possible.
+
+    In claims-only mode the identity is built from the verified ``email`` and
+    ``ver`` claims without touching the database; a deleted or changed user is
+    only noticed once the access token expires. Otherwise (or for tokens issued
+    without those claims) this behaves like ``get_current_user``. The database
+    session is opened lazily, so no connection is checked out on the claims path.
+
+    Args:
+        credentials: HTTP authorization credentials containing Bearer token
+        db: Read-only database session (a replica when configured)
+
+    Returns:
+        Identity of the current authenticated user
+
+    Raises:
+        HTTPException: 401 Unauthorized if token is invalid or user not found
+    """
+    user_id, payload = _decode_access_token(credentials)
+
+    if settings.AUTH_CLAIMS_ONLY:
+        email = payload.get("email")
+        version = payload.get("ver")
+        if isinstance(email, str) and isinstance(version, int):
+            annotate_request(user_id=str(user_id))
+            return UserIdentity(id=user_id, email=email, updated_at=None, version=version)
+
+    identity = await get_user_identity(db, user_id)
+    if identity is None:
+        raise _credentials_exception("unknown_user", user_id)
+
+    annotate_request(user_id=str(user_id))
+    return identity
+
+
+async def get_current_user_row(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Get the full User row for endpoints that need more than the identity.
+
+    Tokens whose ``ver`` claim no longer matches the user's version are rejected.
+    The row is loaded from the primary, so the version check never sees
+    replication lag and the row can be modified in the same session.
+
+    Args:
+        credentials: HTTP authorization credentials containing Bearer token
+        db: Database session
+
+    Returns:
+        Current authenticated user loaded from the database
+
+    Raises:
+        HTTPException: 401 Unauthorized if token is invalid, stale or user not found
+    """
+    user_id, payload = _decode_access_token(credentials)
+
+    user = await db.get(User, user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception("unknown_user", user_id)
 
+    version = payload.get("ver")
+    if version is not None and version != user.version:
+        raise _credentials_exception("stale_token_version", user_id)
+
+    annotate_request(user_id=str(user_id))
     return user
+
+
+def secret_matches(presented: Optional[str], expected: Optional[str]) -> bool:
+    """Compare a presented secret with the configured one in constant time.
+
+    Args:
+        presented: Value sent by the client (None if absent)
+        expected: Configured secret (None or empty if not configured)
+
+    Returns:
+        True only if a secret is configured and the presented value equals it
+    """
+    if not expected or presented is None:
+        return False
+    return hmac.compare_digest(presented.encode(), expected.encode())
+
+
+async def require_internal_token(
+    request: Request,
+    x_internal_token: Annotated[Optional[str], Header()] = None,
+) -> None:
+    """Restrict internal operational endpoints to holders of INTERNAL_API_TOKEN.
+
+    Args:
+        request: Incoming request (for the app's settings)
+        x_internal_token: Value of the X-Internal-Token header
+
+    Raises:
+        HTTPException: 404 Not Found if no token is configured or it does not
+            match, so the endpoints are not advertised to other clients
+    """
+    if not secret_matches(x_internal_token, request.app.state.settings.INTERNAL_API_TOKEN):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+async def require_metrics_token(
+    request: Request,
+    credentials: Annotated[
+        Optional[HTTPAuthorizationCredentials], Depends(scrape_security)
+    ] = None,
+) -> None:
+    """Restrict the metrics endpoint to scrapers holding METRICS_TOKEN.
+
+    Args:
+        request: Incoming request (for the app's settings)
+        credentials: Bearer token from the Authorization header, if any
+
+    Raises:
+        HTTPException: 404 Not Found if no token is configured or it does not match
+    """
+    presented = credentials.credentials if credentials is not None else None
+    if not secret_matches(presented, request.app.state.settings.METRICS_TOKEN):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+async def require_profiling_token(
+    request: Request,
+    x_profile: Annotated[Optional[str], Header()] = None,
+) -> None:
+    """Restrict access to stored request profiles to holders of PROFILING_TOKEN.
+
+    Args:
+        request: Incoming request (for the app's settings)
+        x_profile: Value of the X-Profile header
+
+    Raises:
+        HTTPException: 404 Not Found if no token is configured or it does not match
+    """
+    if not secret_matches(x_profile, request.app.state.settings.PROFILING_TOKEN):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
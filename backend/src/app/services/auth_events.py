@@ -0,0 +1,39 @@
+"""Authentication event log."""
+import logging
+from typing import Optional, Union
+from uuid import UUID
+
+from app.config import settings
+from app.utils.structured_logging import annotate_request, sampled
+
+logger = logging.getLogger("app.auth")
+
+
+def auth_event(
+    event: str, user_id: Optional[Union[UUID, str]] = None, reason: Optional[str] = None
+) -> None:
+    """Record an authentication event.
+
+    Failures (events with a reason) are always logged and their reason is
+    added to the request's access log line; successes are sampled at
+    LOG_SUCCESS_SAMPLE_RATE, as logins and refreshes are the bulk of traffic.
+
+    Args:
+        event: Event name, e.g. "login" or "token"
+        user_id: User the event concerns, if known
+        reason: Failure reason, e.g. "invalid_password" (None for a success)
+    """
+    user = str(user_id) if user_id is not None else None
+    if reason is not None:
+        annotate_request(user_id=user, auth_failure=reason)
+    elif user is not None:
+        annotate_request(user_id=user)
+
+    if reason is None and not sampled(settings.LOG_SUCCESS_SAMPLE_RATE):
+        return
+    logger.info(event, extra={"fields": {
+        "event": event,
+        "outcome": "failure" if reason is not None else "success",
+        "user_id": user,
+        "reason": reason,
+    }})
@@ -0,0 +1,101 @@
+"""Readiness checks: database reachability, pool headroom and event loop lag."""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import Settings
+from app.database import Database
+from app.utils.loop_monitor import EventLoopLagMonitor
+
+
+def pool_has_capacity(status: Optional[Dict[str, Any]]) -> bool:
+    """Whether a connection can be checked out without waiting for a release.
+
+    Args:
+        status: Result of ``Database.pool_status()`` (None before first use)
+
+    Returns:
+        False only for a queue pool whose connections and overflow are all in use
+    """
+    if not status or "checked_out" not in status:
+        return True
+    if status["max_overflow"] < 0:
+        return True
+    return status["checked_out"] < status["size"] + status["max_overflow"]
+
+
+class ReadinessProbe:
+    """Decide whether a worker should receive traffic.
+
+    The database ping is skipped while the pool has no free connection (the
+    pool check already fails and the ping would only queue behind requests),
+    is bounded by a timeout, and its result is reused for a short time so
+    frequent balancer probes cost at most one ``SELECT 1`` per interval.
+    """
+
+    def __init__(self, database: Database, loop_monitor: EventLoopLagMonitor, config: Settings):
+        """Initialize probe.
+
+        Args:
+            database: The app's database
+            loop_monitor: The app's event loop lag monitor
+            config: Settings with the HEALTH_* thresholds
+        """
+        self.database = database
+        self.loop_monitor = loop_monitor
+        self.db_timeout = config.HEALTH_DB_TIMEOUT_MS / 1000
+        self.db_cache_seconds = config.HEALTH_DB_CACHE_SECONDS
+        self.max_loop_lag = config.HEALTH_MAX_LOOP_LAG_MS / 1000
+        self._db_checked_at = float("-inf")
+        self._db_result: Dict[str, Any] = {}
+        self._db_lock = asyncio.Lock()
+
+    async def _ping(self) -> Dict[str, Any]:
+        """Run ``SELECT 1`` within the timeout."""
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.db_timeout):
+                async with self.database.async_engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except (TimeoutError, OSError, SQLAlchemyError) as exc:
+            return {"ok": False, "error": type(exc).__name__}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+    async def _check_database(self) -> Dict[str, Any]:
+        """Ping result, reused for db_cache_seconds and shared by concurrent probes."""
+        async with self._db_lock:
+            if time.monotonic() - self._db_checked_at >= self.db_cache_seconds:
+                self._db_result = await self._ping()
+                self._db_checked_at = time.monotonic()
+            return self._db_result
+
+    async def check(self) -> Dict[str, Any]:
+        """Run all checks.
+
+        Returns:
+            ``ready`` flag and the result of each check
+        """
+        pool = self.database.pool_status()
+        pool_ok = pool_has_capacity(pool)
+        if pool_ok:
+            database = await self._check_database()
+        else:
+            database = {"ok": False, "error": "skipped: pool exhausted"}
+
+        lag = self.loop_monitor.lag_seconds
+        checks = {
+            "database": database,
+            "pool": {
+                "ok": pool_ok,
+                "checked_out": pool.get("checked_out") if pool else None,
+            },
+            "event_loop": {
+                "ok": lag <= self.max_loop_lag,
+                "lag_ms": round(lag * 1000, 3),
+                "max_lag_ms": round(self.max_loop_lag * 1000, 3),
+            },
+        }
+        return {"ready": all(check["ok"] for check in checks.values()), "checks": checks}
@@ -0,0 +1,110 @@
+"""Timeline queries with keyset (cursor) pagination.
+
+Pages are ordered by ``(created_at, id)`` descending, and the next page starts
+strictly after the last row of the previous one. Unlike ``OFFSET``, which
+reads and discards every skipped row, the seek goes straight to the cursor
+position through the ``(created_at, id)`` index, so a page deep in the
+history costs the same as the first. ``id`` breaks ties between posts
+created in the same instant, so no post is skipped or repeated.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import Row, bindparam, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.post import Post
+
+Cursor = Tuple[datetime, UUID]
+
+_COLUMNS = (Post.id, Post.content, Post.created_at)
+_ORDER = (Post.created_at.desc(), Post.id.desc())
+
+FIRST_PAGE = select(*_COLUMNS).order_by(*_ORDER).limit(bindparam("limit"))
+NEXT_PAGE = (
+    select(*_COLUMNS)
+    .where(
+        tuple_(Post.created_at, Post.id)
+        < tuple_(bindparam("created_at", type_=Post.created_at.type),
+                 bindparam("id", type_=Post.id.type))
+    )
+    .order_by(*_ORDER)
+    .limit(bindparam("limit"))
+)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, post_id: UUID) -> str:
+    """Opaque cursor pointing just after a post.
+
+    Args:
+        created_at: Creation time of the last post on the page
+        post_id: ID of the last post on the page
+
+    Returns:
+        URL-safe string
+    """
+    raw = orjson.dumps([created_at.isoformat(), post_id.hex])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Position encoded by encode_cursor.
+
+    ``created_at`` is stored naive (UTC), so a timestamp with a UTC offset
+    cannot have come from encode_cursor and could not be compared with it.
+
+    Raises:
+        InvalidCursorError: If the cursor was not produced by encode_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, post_id = orjson.loads(raw)
+        position = datetime.fromisoformat(created_at), UUID(hex=post_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if position[0].tzinfo is not None:
+        raise InvalidCursorError("Invalid cursor")
+    return position
+
+
+async def list_posts(
+    db: AsyncSession, limit: int, cursor: Optional[str] = None
+) -> Tuple[List[Row], Optional[str]]:
+    """Load one timeline page.
+
+    One extra row is fetched to know whether another page follows, so the
+    last page is recognised without a count query.
+
+    Args:
+        db: Database session
+        limit: Page size
+        cursor: Cursor returned with the previous page (None for the first page)
+
+    Returns:
+        Rows with id, content and created_at, and the next page's cursor
+        (None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    if cursor is None:
+        result = await db.execute(FIRST_PAGE, {"limit": limit + 1})
+    else:
+        created_at, post_id = decode_cursor(cursor)
+        result = await db.execute(
+            NEXT_PAGE, {"created_at": created_at, "id": post_id, "limit": limit + 1}
+        )
+
+    rows = result.all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
@@ -0,0 +1,194 @@
+"""Refresh token rotation with reuse detection."""
+import base64
+import hashlib
+import secrets
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.refresh_token import RefreshToken
+from app.services.token_revocation import utcnow
+from app.utils.jwt import create_refresh_token
+
+
+class RefreshTokenError(Exception):
+    """Raised when a refresh token is unknown, expired or already used."""
+
+
+class RefreshTokenReuseError(RefreshTokenError):
+    """Raised when an already used refresh token is presented again.
+
+    The whole token family has been revoked when this is raised.
+    """
+
+
+def jti_digest(jti: str) -> bytes:
+    """SHA-256 digest under which a refresh token is stored."""
+    return hashlib.sha256(jti.encode("utf-8")).digest()
+
+
+def successor_jti(jti: str) -> str:
+    """jti of the token that replaces the token with jti when it is exchanged.
+
+    It is derived rather than random, so within the reuse grace period the
+    successor can be encoded again without being stored. A known jti does not
+    help forge a token, which must still be signed.
+    """
+    digest = hashlib.sha256(b"successor:" + jti.encode("utf-8")).digest()
+    return base64.urlsafe_b64encode(digest[:16]).decode().rstrip("=")
+
+
+def _encode_refresh_token(
+    user_id: UUID, family_id: UUID, jti: str, expires_at: datetime
+) -> str:
+    """Encode the refresh token recorded with these values."""
+    return create_refresh_token(
+        {"sub": str(user_id), "fam": str(family_id), "jti": jti},
+        expires_at=int(expires_at.replace(tzinfo=UTC).timestamp()),
+    )
+
+
+def issue_refresh_token(
+    db: AsyncSession,
+    user_id: UUID,
+    family_id: Optional[UUID] = None,
+    jti: Optional[str] = None,
+) -> str:
+    """Create a refresh token and record it; the caller commits.
+
+    Args:
+        db: Database session
+        user_id: User the token is issued to
+        family_id: Family to continue, or None to start a new one (login)
+        jti: Token ID, or None for a random one (login)
+
+    Returns:
+        Encoded JWT refresh token
+    """
+    family_id = family_id or uuid.uuid4()
+    jti = jti or secrets.token_urlsafe(16)
+    # Whole seconds, so the token's exp claim can be rebuilt from the row
+    expires_at = utcnow().replace(microsecond=0) + timedelta(
+        days=settings.REFRESH_TOKEN_EXPIRE_DAYS
+    )
+    db.add(RefreshToken(
+        jti_hash=jti_digest(jti),
+        family_id=family_id,
+        user_id=user_id,
+        expires_at=expires_at,
+    ))
+    return _encode_refresh_token(user_id, family_id, jti, expires_at)
+
+
+async def _reissue_successor(
+    db: AsyncSession, used: Row, jti: str, now: datetime
+) -> Optional[str]:
+    """Encode the successor of a token exchanged within the reuse grace period again.
+
+    Args:
+        db: Database session
+        used: family_id, user_id and used_at of the exchanged token
+        jti: ID of the exchanged token
+        now: Current time
+
+    Returns:
+        The successor token, or None once the grace period is over or the
+        successor has been exchanged or has expired itself
+    """
+    grace = timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+    if now - used.used_at >= grace:
+        return None
+    next_jti = successor_jti(jti)
+    result = await db.execute(
+        select(RefreshToken.expires_at).where(
+            RefreshToken.jti_hash == jti_digest(next_jti),
+            RefreshToken.used_at.is_(None),
+            RefreshToken.expires_at > now,
+        )
+    )
+    expires_at = result.scalar_one_or_none()
+    if expires_at is None:
+        return None
+    return _encode_refresh_token(used.user_id, used.family_id, next_jti, expires_at)
+
+
+async def rotate_refresh_token(db: AsyncSession, payload: Dict[str, Any]) -> Tuple[UUID, str]:
+    """Exchange a verified refresh token for the next token of its family.
+
+    The presented token is marked used with a single conditional UPDATE, so of
+    two concurrent requests with the same token only one exchanges it. Within
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS of the exchange, presenting the token
+    again returns the same successor as long as that is still unused, so
+    parallel tabs and retried requests keep the session. Any other reuse
+    revokes (and commits the removal of) the whole family. The caller commits
+    on success.
+
+    Args:
+        db: Database session
+        payload: Verified refresh token payload
+
+    Returns:
+        Tuple of (user id, new encoded refresh token)
+
+    Raises:
+        RefreshTokenReuseError: If the token was already used (outside the grace period)
+        RefreshTokenError: If the token is unknown or expired
+    """
+    jti = payload.get("jti")
+    if not isinstance(jti, str):
+        raise RefreshTokenError("Refresh token has no jti")
+
+    digest = jti_digest(jti)
+    now = utcnow()
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.jti_hash == digest,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.expires_at > now,
+        )
+        .values(used_at=now)
+        .returning(RefreshToken.family_id, RefreshToken.user_id)
+    )
+    row = result.first()
+    if row is None:
+        result = await db.execute(
+            select(RefreshToken.family_id, RefreshToken.user_id, RefreshToken.used_at)
+            .where(RefreshToken.jti_hash == digest)
+        )
+        existing = result.first()
+        if existing is not None and existing.used_at is not None:
+            successor = await _reissue_successor(db, existing, jti, now)
+            if successor is not None:
+                return existing.user_id, successor
+            await revoke_family(db, existing.family_id)
+            await db.commit()
+            raise RefreshTokenReuseError("Refresh token reuse detected")
+        raise RefreshTokenError("Unknown or expired refresh token")
+
+    family_id, user_id = row
+    return user_id, issue_refresh_token(db, user_id, family_id, successor_jti(jti))
+
+
+async def revoke_family(db: AsyncSession, family_id: UUID) -> None:
+    """Delete every token of a family so none of them can be exchanged again."""
+    await db.execute(delete(RefreshToken).where(RefreshToken.family_id == family_id))
+
+
+async def revoke_refresh_token_family(db: AsyncSession, payload: Dict[str, Any]) -> bool:
+    """Revoke the family of a verified refresh token (e.g. on logout); the caller commits.
+
+    Returns:
+        True if the payload named a family
+    """
+    try:
+        family_id = UUID(payload.get("fam") or "")
+    except ValueError:
+        return False
+    await revoke_family(db, family_id)
+    return True
@@ -0,0 +1,145 @@
+"""Server-side token revocation backed by the revoked_tokens table."""
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+from app.utils.token_denylist import token_denylist
+
+logger = logging.getLogger(__name__)
+
+# Expired rows are deleted at most this often, PURGE_BATCH_SIZE rows per statement
+PURGE_INTERVAL_SECONDS = 300
+PURGE_BATCH_SIZE = 1000
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the DateTime columns."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _to_timestamp(value: datetime) -> float:
+    """Unix timestamp of a naive UTC datetime."""
+    return value.replace(tzinfo=UTC).timestamp()
+
+
+async def revoke_token(db: AsyncSession, payload: Dict[str, Any]) -> bool:
+    """Revoke a verified token until it expires.
+
+    The token is added to this process's denylist immediately and persisted so
+    other workers pick it up on their next sync. The caller commits.
+
+    Args:
+        db: Database session
+        payload: Verified token payload with ``jti`` and ``exp`` claims
+
+    Returns:
+        True if the token could be revoked (it has ``jti`` and ``exp``)
+    """
+    jti = payload.get("jti")
+    exp = payload.get("exp")
+    if not isinstance(jti, str) or not isinstance(exp, int):
+        return False
+
+    token_denylist.add(jti, exp)
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    await db.execute(
+        dialect.insert(RevokedToken)
+        .values(jti=jti, expires_at=datetime.fromtimestamp(exp, UTC).replace(tzinfo=None))
+        .on_conflict_do_nothing(index_elements=["jti"])
+    )
+    return True
+
+
+async def load_revocations(db: AsyncSession, since: Optional[datetime] = None) -> int:
+    """Add unexpired revocations from the database to the in-memory denylist.
+
+    Args:
+        db: Database session
+        since: Only load revocations made at or after this time (naive UTC)
+
+    Returns:
+        Number of rows read
+    """
+    statement = select(RevokedToken.jti, RevokedToken.expires_at).where(
+        RevokedToken.expires_at > utcnow()
+    )
+    if since is not None:
+        statement = statement.where(RevokedToken.revoked_at >= since)
+
+    count = 0
+    for jti, expires_at in await db.execute(statement):
+        token_denylist.add(jti, _to_timestamp(expires_at))
+        count += 1
+    return count
+
+
+async def purge_expired(
+    db: AsyncSession, model: Any, batch_size: int = PURGE_BATCH_SIZE
+) -> int:
+    """Delete rows whose ``expires_at`` has passed, in bounded batches.
+
+    Each batch is committed separately so no single statement holds locks on
+    a large number of rows.
+
+    Args:
+        db: Database session
+        model: Mapped class with an ``expires_at`` column and a single primary key
+        batch_size: Maximum rows deleted per statement
+
+    Returns:
+        Number of deleted rows
+    """
+    key = model.__mapper__.primary_key[0]
+    deleted = 0
+    while True:
+        expired = (
+            select(key).where(model.expires_at <= utcnow()).limit(batch_size).scalar_subquery()
+        )
+        result = await db.execute(delete(model).where(key.in_(expired)))
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
+async def run_token_maintenance(
+    session_factory: Callable[[], AsyncSession], interval: float
+) -> None:
+    """Keep the denylist in sync with the database until cancelled.
+
+    Loads all unexpired revocations once, then every ``interval`` seconds only
+    the ones made since the previous sync (with an ``interval`` overlap to absorb
+    clock skew between workers). Expired denylist entries and expired
+    revoked_tokens/refresh_tokens rows are purged periodically.
+
+    Args:
+        session_factory: Async session factory
+        interval: Seconds between syncs
+    """
+    since: Optional[datetime] = None
+    last_purge = time.monotonic()
+    while True:
+        started = utcnow()
+        try:
+            async with session_factory() as db:
+                await load_revocations(db, since)
+                if time.monotonic() - last_purge >= PURGE_INTERVAL_SECONDS:
+                    await purge_expired(db, RevokedToken)
+                    await purge_expired(db, RefreshToken)
+                    last_purge = time.monotonic()
+            since = started - timedelta(seconds=interval)
+        except (SQLAlchemyError, OSError):
+            # Drivers raise OSError (e.g. ConnectionRefusedError) when the database
+            # is unreachable; keep looping so syncing resumes once it is back
+            logger.warning("Token revocation sync failed", exc_info=True)
+        token_denylist.purge()
+        await asyncio.sleep(interval)
@@ -0,0 +1,147 @@
+"""In-process cache of authenticated user identities."""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+
+from app.config import settings
+from app.models.user import User
+
+
+class UserIdentity:
+    """Compact snapshot of the user fields needed for authentication.
+
+    Never carries the password hash.
+    """
+
+    __slots__ = ("id", "email", "updated_at", "version")
+
+    def __init__(
+        self, id: UUID, email: str, updated_at: Optional[datetime], version: int = 1
+    ):
+        """Initialize identity.
+
+        Args:
+            id: User's unique identifier
+            email: User's email address
+            updated_at: Last update time of the user row (None when built from claims)
+            version: User version counter
+        """
+        self.id = id
+        self.email = email
+        self.updated_at = updated_at
+        self.version = version
+
+    def __repr__(self) -> str:
+        return f"UserIdentity(id={self.id!r}, email={self.email!r})"
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserIdentity":
+        """Build identity from a User row."""
+        return cls(
+            id=user.id, email=user.email, updated_at=user.updated_at, version=user.version
+        )
+
+
+class UserIdentityCache:
+    """Size-bounded LRU cache of UserIdentity records with a TTL."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached identities (0 disables the cache)
+            ttl: Seconds an identity may be served before it is reloaded
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, tuple[float, UserIdentity]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, user_id: UUID) -> Optional[UserIdentity]:
+        """Look up a cached identity.
+
+        Args:
+            user_id: User's unique identifier
+
+        Returns:
+            Cached identity, or None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or time.monotonic() >= entry[0]:
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, identity: UserIdentity) -> None:
+        """Cache identity, evicting least recently used entries beyond max_entries."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[identity.id] = (time.monotonic() + self.ttl, identity)
+            self._entries.move_to_end(identity.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop a cached identity, e.g. after the user row changed."""
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+user_cache = UserIdentityCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    """Invalidate cached identity whenever a user row is updated or deleted via the ORM.
+
+    Bulk ``UPDATE``/``DELETE`` statements bypass these hooks and must call
+    ``user_cache.invalidate`` explicitly.
+    """
+    user_cache.invalidate(target.id)
@@ -0,0 +1,50 @@
+"""Lean user queries for the authentication hot path.
+
+The statements are built once at import and select only the columns a caller
+needs, returning plain rows instead of ORM instances: no identity-map entry,
+no attribute instrumentation and, outside login, no password hash is loaded.
+SQLAlchemy caches their compiled form, so each call only binds parameters.
+"""
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Row, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.services.user_cache import UserIdentity
+
+# Column order matches UserIdentity's constructor
+IDENTITY_BY_ID = select(User.id, User.email, User.updated_at, User.version).where(
+    User.id == bindparam("user_id")
+)
+CREDENTIALS_BY_EMAIL = select(
+    User.id, User.email, User.updated_at, User.version, User.hashed_password
+).where(User.email == bindparam("email"))
+
+
+async def load_identity(db: AsyncSession, user_id: UUID) -> Optional[UserIdentity]:
+    """Load the identity fields of a user by primary key.
+
+    Args:
+        db: Database session
+        user_id: User's unique identifier
+
+    Returns:
+        User identity, or None if the user does not exist
+    """
+    row = (await db.execute(IDENTITY_BY_ID, {"user_id": user_id})).first()
+    return UserIdentity(*row) if row is not None else None
+
+
+async def load_credentials(db: AsyncSession, email: str) -> Optional[Row]:
+    """Load what login needs for a user by email, including the password hash.
+
+    Args:
+        db: Database session
+        email: User's email address
+
+    Returns:
+        Row with id, email, updated_at, version and hashed_password, or None
+    """
+    return (await db.execute(CREDENTIALS_BY_EMAIL, {"email": email})).first()
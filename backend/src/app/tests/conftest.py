@@ -1,4 +1,6 @@
 """Test configuration and fixtures."""
+import os
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -27,3 +29,56 @@ def db_session():
     finally:
         session.close()
         Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def reset_login_limiters():
+    """Start every test with empty login rate limit buckets."""
+    from app.utils.rate_limit import login_email_limiter, login_ip_limiter
+
+    login_ip_limiter.clear()
+    login_email_limiter.clear()
+    yield
+    login_ip_limiter.clear()
+    login_email_limiter.clear()
+
+
+INTERNAL_API_TOKEN = "test-internal-token"
+METRICS_TOKEN = "test-metrics-token"
+
+
+@pytest.fixture
+def internal_headers():
+    """Headers authorizing requests to the /internal endpoints of test apps."""
+    return {"X-Internal-Token": INTERNAL_API_TOKEN}
+
+
+@pytest.fixture
+def metrics_headers():
+    """Headers authorizing scrapes of /metrics on test apps."""
+    return {"Authorization": f"Bearer {METRICS_TOKEN}"}
+
+
+@pytest.fixture
+def app_factory():
+    """Build apps with per-test settings overrides.
+
+    The background token sync is off unless a test turns it on, so apps that
+    are not given a test database never try to reach one. The /internal
+    endpoints accept the ``internal_headers`` fixture and /metrics the
+    ``metrics_headers`` fixture.
+    """
+    from app.config import Settings
+    from app.main import create_app
+
+    def factory(**overrides: str):
+        environ = {
+            **os.environ,
+            "TOKEN_DENYLIST_SYNC_SECONDS": "0",
+            "INTERNAL_API_TOKEN": INTERNAL_API_TOKEN,
+            "METRICS_TOKEN": METRICS_TOKEN,
+            **overrides,
+        }
+        return create_app(Settings(environ))
+
+    return factory
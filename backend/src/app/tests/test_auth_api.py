@@ -3,21 +3,25 @@ import pytest
 from datetime import timedelta, datetime
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
-from app.database import Base, get_db
+from app.database import Base, to_async_url
 from app.models.user import User
+from app.schemas.auth import TokenResponse, UserResponse
 
 
 @pytest.fixture(scope="function")
-def test_db():
+def database_url(tmp_path):
+    """SQLite database file shared by the sync fixtures and the async app session."""
+    return f"sqlite:///{tmp_path / 'test.db'}"
+
+
+@pytest.fixture(scope="function")
+def test_db(database_url):
     """Create a test database."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    engine = create_engine(database_url, connect_args={"check_same_thread": False})
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     Base.metadata.create_all(bind=engine)
 
@@ -27,26 +31,17 @@ def test_db():
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+        engine.dispose()
 
 
 @pytest.fixture(scope="function")
-def client(test_db):
-    """Create a test client with database override."""
-    from app.main import app
-
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
+def client(test_db, database_url, app_factory):
+    """Create a test client for an app using the test database."""
+    app = app_factory(DATABASE_URL=database_url)
 
     with TestClient(app) as test_client:
         yield test_client
 
-    app.dependency_overrides.clear()
-
 
 @pytest.fixture(scope="function")
 def test_user(test_db):
@@ -219,3 +214,455 @@ def test_get_current_user_unauthenticated_returns_401(client):
     )
 
     assert response.status_code == 401
+
+
+def test_login_returns_503_when_password_hasher_is_saturated(client, test_user, monkeypatch):
+    """Test: POST /api/auth/login - bcrypt実行枠が枯渇している場合は503返却."""
+    from app.utils.password import PasswordHasherBusyError, password_hasher
+
+    async def busy_verify(password, hashed_password):
+        raise PasswordHasherBusyError("Password hashing capacity exhausted")
+
+    monkeypatch.setattr(password_hasher, "verify", busy_verify)
+
+    response = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_get_current_user_is_served_from_identity_cache(client, test_user, internal_headers):
+    """Test: GET /api/auth/me - 2回目以降はユーザーキャッシュから返ること."""
+    from app.services.user_cache import user_cache
+
+    user_cache.clear()
+    login_response = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    for _ in range(3):
+        response = client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+
+    stats = client.get("/internal/stats", headers=internal_headers).json()["user_cache"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+
+def test_login_rehashes_password_with_outdated_cost(client, test_db, monkeypatch):
+    """Test: POST /api/auth/login - コストが古いハッシュはログイン時に再ハッシュされる."""
+    from app.config import settings
+    from app.utils.password import hash_password, hash_rounds
+
+    user = User.from_hashed_password(
+        "legacy@example.com", hash_password("TestPass123", rounds=4)
+    )
+    test_db.add(user)
+    test_db.commit()
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+    response = client.post(
+        "/api/auth/login",
+        json={
+            "email": "legacy@example.com",
+            "password": "TestPass123"
+        }
+    )
+
+    assert response.status_code == 200
+    test_db.expire_all()
+    rehashed = test_db.get(User, user.id).hashed_password
+    assert hash_rounds(rehashed) == 5
+
+    # The upgraded hash still accepts the same password
+    response = client.post(
+        "/api/auth/login",
+        json={
+            "email": "legacy@example.com",
+            "password": "TestPass123"
+        }
+    )
+    assert response.status_code == 200
+
+
+def test_get_me_in_claims_only_mode_skips_database(client, test_user, monkeypatch):
+    """Test: GET /api/auth/me - クレームのみモードではDBを参照せずに返ること."""
+    from app.config import settings
+    from app.services.user_cache import user_cache
+    from app.utils.jwt import decode_token
+
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_ONLY", True)
+    login_response = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    )
+    access_token = login_response.json()["access_token"]
+    payload = decode_token(access_token, expected_type="access")
+    assert payload["email"] == "test@example.com"
+    assert payload["ver"] == 1
+
+    user_cache.clear()
+    response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {access_token}"})
+
+    assert response.status_code == 200
+    assert response.json() == {"id": str(test_user.id), "email": "test@example.com"}
+    stats = user_cache.stats()
+    assert stats["hits"] == 0
+    assert stats["misses"] == 0
+
+
+async def test_get_current_user_row_rejects_stale_version(test_db, test_user, database_url):
+    """Test: ユーザーのバージョンが変わったトークンでは完全な行を取得できないこと."""
+    from fastapi import HTTPException
+    from fastapi.security import HTTPAuthorizationCredentials
+
+    from app.services.auth import get_current_user_row
+    from app.utils.jwt import create_access_token
+
+    def bearer(version):
+        token = create_access_token({"sub": str(test_user.id), "ver": version})
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    async_engine = create_async_engine(to_async_url(database_url), poolclass=NullPool)
+    try:
+        async with async_sessionmaker(bind=async_engine)() as db:
+            user = await get_current_user_row(bearer(1), db)
+            assert user.email == "test@example.com"
+            assert user.hashed_password.startswith("$2b$")
+
+            test_user.email = "renamed@example.com"
+            test_db.commit()
+            db.expire_all()
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user_row(bearer(1), db)
+            assert exc_info.value.status_code == 401
+            assert (await get_current_user_row(bearer(2), db)).version == 2
+    finally:
+        await async_engine.dispose()
+
+
+def test_logout_revokes_access_and_refresh_tokens(client, test_user, test_db):
+    """Test: POST /api/auth/logout - ログアウト後はトークンが使えなくなること."""
+    from app.models.revoked_token import RevokedToken
+
+    tokens = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    ).json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+    response = client.post(
+        "/api/auth/logout",
+        headers=headers,
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+
+    assert response.status_code == 204
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+    refresh_response = client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert refresh_response.status_code == 401
+    assert test_db.query(RevokedToken).count() == 2
+
+    # Logging out again with the revoked tokens still succeeds
+    assert client.post("/api/auth/logout", headers=headers).status_code == 204
+
+
+async def test_revocations_are_loaded_and_purged_from_database(test_db, database_url):
+    """Test: 失効情報をDBから読み込み、期限切れの行を削除できること."""
+    import time
+
+    from app.models.revoked_token import RevokedToken
+    from app.services.token_revocation import load_revocations, purge_expired, revoke_token
+    from app.utils.token_denylist import token_denylist
+
+    now = int(time.time())
+    async_engine = create_async_engine(to_async_url(database_url), poolclass=NullPool)
+    try:
+        async with async_sessionmaker(bind=async_engine)() as db:
+            assert await revoke_token(db, {"jti": "live-jti", "exp": now + 60}) is True
+            assert await revoke_token(db, {"jti": "no-exp"}) is False
+            expired_at = datetime.utcnow() - timedelta(minutes=1)
+            db.add(RevokedToken(jti="expired-jti", expires_at=expired_at))
+            await db.commit()
+
+            token_denylist.clear()
+            assert await load_revocations(db) == 1
+            assert token_denylist.is_revoked("live-jti") is True
+
+            assert await purge_expired(db, RevokedToken, batch_size=1) == 1
+            assert await load_revocations(db) == 1
+    finally:
+        token_denylist.clear()
+        await async_engine.dispose()
+
+
+def test_refresh_rotates_token_and_detects_reuse(client, test_user, test_db):
+    """Test: POST /api/auth/refresh - トークンがローテーションされ、再利用で系列ごと失効すること."""
+    from app.models.refresh_token import RefreshToken
+
+    first = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    ).json()["refresh_token"]
+
+    response = client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert response.status_code == 200
+    second = response.json()["refresh_token"]
+    assert second != first
+
+    third = client.post("/api/auth/refresh", json={"refresh_token": second}).json()["refresh_token"]
+    assert test_db.query(RefreshToken).count() == 3
+
+    # Replaying an exchanged token revokes the whole family, including the latest token
+    reuse = client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert reuse.status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": third}).status_code == 401
+    assert test_db.query(RefreshToken).count() == 0
+
+
+def test_refresh_retry_within_grace_period_returns_same_token(client, test_user, test_db):
+    """Test: POST /api/auth/refresh - 猶予時間内の再送には同じ後継トークンが返ること."""
+    from app.models.refresh_token import RefreshToken
+
+    first = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    ).json()["refresh_token"]
+
+    response = client.post("/api/auth/refresh", json={"refresh_token": first})
+    retry = client.post("/api/auth/refresh", json={"refresh_token": first})
+    assert response.status_code == 200
+    assert retry.status_code == 200
+    assert retry.json()["refresh_token"] == response.json()["refresh_token"]
+    assert test_db.query(RefreshToken).count() == 2
+
+    # The returned successor is still valid and rotates normally
+    successor = retry.json()["refresh_token"]
+    assert client.post("/api/auth/refresh", json={"refresh_token": successor}).status_code == 200
+
+
+def test_refresh_reuse_after_grace_period_revokes_family(
+    client, test_user, test_db, monkeypatch
+):
+    """Test: POST /api/auth/refresh - 猶予時間を過ぎた再利用で系列ごと失効すること."""
+    from app.models.refresh_token import RefreshToken
+    from app.services import refresh_tokens
+
+    first = client.post(
+        "/api/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123"
+        }
+    ).json()["refresh_token"]
+    second = client.post("/api/auth/refresh", json={"refresh_token": first}).json()["refresh_token"]
+
+    later = datetime.utcnow() + timedelta(
+        seconds=refresh_tokens.settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS + 1
+    )
+    monkeypatch.setattr(refresh_tokens, "utcnow", lambda: later)
+
+    assert client.post("/api/auth/refresh", json={"refresh_token": first}).status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": second}).status_code == 401
+    assert test_db.query(RefreshToken).count() == 0
+
+
+async def test_expired_refresh_tokens_are_purged_in_batches(test_db, test_user, database_url):
+    """Test: 期限切れのリフレッシュトークンがバッチで削除されること."""
+    import uuid
+
+    from app.models.refresh_token import RefreshToken
+    from app.services.refresh_tokens import jti_digest
+    from app.services.token_revocation import purge_expired
+
+    now = datetime.utcnow()
+    for i in range(5):
+        test_db.add(RefreshToken(
+            jti_hash=jti_digest(f"jti-{i}"),
+            family_id=uuid.uuid4(),
+            user_id=test_user.id,
+            expires_at=now + timedelta(days=-1 if i < 3 else 1),
+        ))
+    test_db.commit()
+
+    async_engine = create_async_engine(to_async_url(database_url), poolclass=NullPool)
+    try:
+        async with async_sessionmaker(bind=async_engine)() as db:
+            assert await purge_expired(db, RefreshToken, batch_size=2) == 3
+    finally:
+        await async_engine.dispose()
+    assert test_db.query(RefreshToken).count() == 2
+
+
+def test_login_is_throttled_before_password_verification(client, test_user, monkeypatch):
+    """Test: POST /api/auth/login - 試行回数超過時はbcryptを実行せずに429を返すこと."""
+    from app.utils.metrics import login_throttled_total
+    from app.utils.password import password_hasher
+    from app.utils.rate_limit import login_email_limiter
+
+    monkeypatch.setattr(login_email_limiter, "burst", 2)
+    verified = []
+    original_verify = password_hasher.verify
+
+    async def counting_verify(password, hashed_password):
+        verified.append(password)
+        return await original_verify(password, hashed_password)
+
+    monkeypatch.setattr(password_hasher, "verify", counting_verify)
+    throttled_before = login_throttled_total.value(scope="email")
+
+    statuses = [
+        client.post(
+            "/api/auth/login",
+            json={"email": "test@example.com", "password": "WrongPass123"},
+        ).status_code
+        for _ in range(3)
+    ]
+    # Emails are normalized, so changing the case does not get a fresh bucket
+    response = client.post(
+        "/api/auth/login",
+        json={"email": "TEST@example.com", "password": "TestPass123"},
+    )
+
+    assert statuses == [401, 401, 429]
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert len(verified) == 2
+    assert login_throttled_total.value(scope="email") == throttled_before + 2
+
+
+def test_login_throttle_keys_on_forwarded_client_ip(
+    test_db, database_url, app_factory, monkeypatch
+):
+    """Test: 信頼するプロキシ経由ではX-Forwarded-ForのIPごとにログイン制限されること."""
+    from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+    from app.utils.rate_limit import login_email_limiter, login_ip_limiter
+
+    monkeypatch.setattr(login_ip_limiter, "burst", 1)
+    monkeypatch.setattr(login_email_limiter, "rate", 0.0)
+    app = app_factory(DATABASE_URL=database_url)
+    # The test client connects from "testclient", standing in for the proxy
+    proxied = ProxyHeadersMiddleware(app, trusted_hosts="testclient")
+
+    def login(forwarded_for):
+        return client.post(
+            "/api/auth/login",
+            json={"email": "nobody@example.com", "password": "WrongPass123"},
+            headers={"X-Forwarded-For": forwarded_for},
+        ).status_code
+
+    with TestClient(proxied) as client:
+        statuses = [login("203.0.113.1"), login("203.0.113.1"), login("203.0.113.2")]
+
+    assert statuses == [401, 429, 401]
+
+
+def test_auth_responses_match_response_models(client, test_user):
+    """Test: 事前シリアライズしたレスポンスがスキーマと同じ形で返る."""
+    login = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "TestPass123"}
+    )
+    assert login.headers["content-type"] == "application/json"
+    tokens = TokenResponse.model_validate_json(login.content)
+    assert set(login.json()) == set(TokenResponse.model_fields)
+
+    refresh = client.post("/api/auth/refresh", json={"refresh_token": tokens.refresh_token})
+    assert refresh.headers["content-type"] == "application/json"
+    assert set(refresh.json()) == set(TokenResponse.model_fields)
+
+    me = client.get(
+        "/api/auth/me",
+        headers={"Authorization": f"Bearer {tokens.access_token}"}
+    )
+    assert me.headers["content-type"] == "application/json"
+    assert me.json() == {"id": str(test_user.id), "email": test_user.email}
+    assert UserResponse.model_validate_json(me.content).id == test_user.id
+
+
+def test_reads_are_routed_to_replica_and_writes_to_primary(
+    test_db, test_user, database_url, app_factory, tmp_path
+):
+    """Test: ユーザー検索はレプリカ、リフレッシュトークンの保存はプライマリで行われること."""
+    import shutil
+    import sqlite3
+
+    from app.models.refresh_token import RefreshToken
+    from app.services.user_cache import user_cache
+
+    # The replica is a copy of the primary whose user has a different email
+    replica_path = tmp_path / "replica.db"
+    shutil.copy(database_url.removeprefix("sqlite:///"), replica_path)
+    with sqlite3.connect(replica_path) as replica:
+        replica.execute("UPDATE users SET email = 'replica@example.com'")
+    user_cache.clear()
+
+    app = app_factory(
+        DATABASE_URL=database_url, DATABASE_REPLICA_URLS=f"sqlite:///{replica_path}"
+    )
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/auth/login",
+            json={"email": "replica@example.com", "password": "TestPass123"}
+        )
+        assert response.status_code == 200
+        access_token = response.json()["access_token"]
+
+        me = client.get("/api/auth/me", headers={"Authorization": f"Bearer {access_token}"})
+        assert me.json()["email"] == "replica@example.com"
+
+    assert test_db.query(RefreshToken).count() == 1
+    with sqlite3.connect(replica_path) as replica:
+        assert replica.execute("SELECT COUNT(*) FROM refresh_tokens").fetchone()[0] == 0
+
+
+def test_unreachable_replica_is_ejected_and_reads_fall_back_to_primary(
+    test_db, test_user, database_url, app_factory, tmp_path, internal_headers
+):
+    """Test: 接続できないレプリカが除外され、以降の読み取りがプライマリに戻ること."""
+    from app.services.user_cache import user_cache
+    from app.utils.jwt import create_access_token
+
+    user_cache.clear()
+    missing_replica = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+    app = app_factory(DATABASE_URL=database_url, DATABASE_REPLICA_URLS=missing_replica)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(test_user.id)})}"}
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        assert client.get("/api/auth/me", headers=headers).status_code == 500
+
+        response = client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+
+        replicas = client.get("/internal/db-pool", headers=internal_headers).json()["replicas"]
+        assert replicas[0]["ejected_for_seconds"] > 0
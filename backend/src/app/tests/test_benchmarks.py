@@ -0,0 +1,88 @@
+"""Tests for the benchmark suite."""
+import httpx
+import pytest
+
+from app.benchmarks.importtime import by_package, parse_importtime, total_us
+from app.benchmarks.load import failed_responses, run_in_process, run_load
+from app.benchmarks.results import BenchmarkResult, compare_results, percentile
+
+
+def test_percentile_uses_nearest_rank():
+    """Test: パーセンタイルが nearest-rank 法で計算されること."""
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_compare_results_flags_latency_regression():
+    """Test: p95 レイテンシの悪化が回帰として検出されること."""
+    baseline = BenchmarkResult.from_samples("GET /api/auth/me", "load", [0.01] * 10, 1.0)
+    candidate = BenchmarkResult.from_samples("GET /api/auth/me", "load", [0.02] * 10, 1.0)
+
+    regressions = compare_results(
+        {baseline.name: vars(baseline)}, {candidate.name: vars(candidate)}, threshold=0.1
+    )
+
+    assert len(regressions) == 1
+    assert "p95" in regressions[0]
+
+
+async def test_in_process_load_benchmark_reports_all_endpoints():
+    """Test: プロセス内負荷ベンチマークが全エンドポイントの結果を返すこと."""
+    results = await run_in_process(users=2, requests=4, concurrency=2)
+
+    assert [result.name for result in results] == [
+        "POST /api/auth/login",
+        "POST /api/auth/refresh",
+        "GET /api/auth/me",
+    ]
+    for result in results:
+        assert result.iterations + result.errors == 4
+        assert result.p50_ms <= result.p95_ms <= result.p99_ms
+    assert failed_responses(results) == {}
+
+
+async def test_throttled_session_login_explains_how_to_disable_throttling():
+    """Test: セッション用ログインが429で拒否されたとき、制限の無効化方法を示して失敗すること."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(429))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        with pytest.raises(RuntimeError, match="LOGIN_IP_RATE_PER_MINUTE=0"):
+            await run_load(client, ["bench@example.com"], 1, 1, endpoints=["me"])
+
+
+def test_failed_responses_count_every_non_2xx_status():
+    """Test: 2xx以外のレスポンスと通信エラーがすべて失敗として数えられること."""
+    results = [
+        BenchmarkResult.from_samples(
+            "login", "load", [0.1], 1.0, errors=3,
+            status_counts={"200": 1, "503": 2, "ConnectTimeout": 1},
+        ),
+        BenchmarkResult.from_samples(
+            "me", "load", [0.1], 1.0, errors=1, status_counts={"200": 1, "503": 1, "304": 1},
+        ),
+    ]
+
+    assert failed_responses(results) == {"503": 3, "ConnectTimeout": 1, "304": 1}
+
+
+def test_importtime_output_is_parsed_per_module_and_package():
+    """Test: -X importtime の出力がモジュール・パッケージ単位で集計されること."""
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     sqlalchemy.sql",
+        "import time:        30 |        150 |   sqlalchemy",
+        "import time:        50 |         50 |   app.config",
+        "import time:        10 |        210 | app.main",
+    ])
+
+    timings = parse_importtime(output)
+
+    assert [timing.module for timing in timings] == [
+        "sqlalchemy.sql", "sqlalchemy", "app.config", "app.main",
+    ]
+    assert [timing.depth for timing in timings] == [2, 1, 1, 0]
+    assert total_us(timings, "app.main") == 210
+    assert by_package(timings) == [("sqlalchemy", 150), ("app", 60)]
@@ -0,0 +1,83 @@
+"""Tests for the blocking call detector."""
+import asyncio
+import logging
+import time
+
+from fastapi.testclient import TestClient
+
+from app.utils.blocking_detector import BlockingCallDetector
+from app.utils.metrics import event_loop_blocked_seconds, event_loop_blocked_total
+
+
+def _block_loop(seconds: float) -> None:
+    """Hold the event loop with a synchronous sleep."""
+    time.sleep(seconds)
+
+
+async def test_detects_blocking_call_with_stack(caplog):
+    """Test: イベントループを閾値以上ブロックした処理がスタック付きで記録されること."""
+    detector = BlockingCallDetector(0.05)
+    detector.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="app.utils.blocking_detector"):
+            _block_loop(0.3)
+            await asyncio.sleep(0.05)
+    finally:
+        detector.stop()
+
+    assert detector.detections == 1
+    assert detector.last["route"] == "-"
+    assert "_block_loop" in detector.last["stack"]
+    assert "Event loop blocked" in caplog.text
+    assert detector.stats()["running"] is False
+    assert "stack" not in detector.stats()["last"]
+
+
+async def test_ignores_short_callbacks():
+    """Test: 閾値未満の処理では検出されないこと."""
+    detector = BlockingCallDetector(0.2)
+    detector.start()
+    try:
+        for _ in range(5):
+            _block_loop(0.01)
+            await asyncio.sleep(0.02)
+    finally:
+        detector.stop()
+
+    assert detector.detections == 0
+
+
+def test_attributes_stall_to_route(app_factory, internal_headers):
+    """Test: 検出されたブロックがリクエストのルートに紐づけられ、メトリクスに出力されること."""
+    app = app_factory(LOOP_BLOCK_DETECTOR_ENABLED="true", LOOP_BLOCK_THRESHOLD_MS="50")
+
+    @app.get("/test/blocking/{item}")
+    async def blocking_endpoint(item: str):
+        _block_loop(0.3)
+        return {"item": item}
+
+    labels = {"method": "GET", "route": "/test/blocking/{item}"}
+    before = event_loop_blocked_total.value(**labels)
+    with TestClient(app) as client:
+        assert client.get("/test/blocking/1").status_code == 200
+        time.sleep(0.05)
+        stats = client.get("/internal/stats", headers=internal_headers).json()
+    stats = stats["event_loop"]["blocking_calls"]
+
+    assert event_loop_blocked_total.value(**labels) == before + 1
+    assert event_loop_blocked_seconds.count(**labels) >= 1
+    assert stats["running"] is True
+    assert stats["last"]["route"] == "/test/blocking/{item}"
+    assert app.state.blocking_detector.routes == {}
+
+
+def test_detector_is_off_by_default(app_factory, internal_headers):
+    """Test: 検出器がデフォルトでは起動しないこと."""
+    app = app_factory()
+    with TestClient(app) as client:
+        stats = client.get("/internal/stats", headers=internal_headers).json()
+    stats = stats["event_loop"]["blocking_calls"]
+
+    assert stats["running"] is False
+    assert stats["detections"] == 0
@@ -0,0 +1,88 @@
+"""Tests for the liveness and readiness endpoints."""
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.database import Base
+from app.services.health import pool_has_capacity
+from app.utils.loop_monitor import EventLoopLagMonitor
+
+
+def _sqlite_url(tmp_path) -> str:
+    database_url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return database_url
+
+
+def test_live_does_not_touch_database(app_factory, tmp_path):
+    """Test: ライブネスがDBに接続せず200を返すこと."""
+    app = app_factory(DATABASE_URL=f"sqlite:///{tmp_path / 'missing' / 'app.db'}")
+    with TestClient(app) as client:
+        assert client.get("/health/live").json() == {"status": "healthy"}
+        assert client.get("/health").status_code == 200
+        assert app.state.database.pool_status() is None
+
+
+def test_ready_when_dependencies_are_healthy(app_factory, tmp_path):
+    """Test: DB・プール・イベントループが正常ならレディネスが200を返すこと."""
+    app = app_factory(DATABASE_URL=_sqlite_url(tmp_path))
+    with TestClient(app) as client:
+        response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["checks"]["database"]["ok"] is True
+    assert body["checks"]["pool"]["ok"] is True
+    assert body["checks"]["event_loop"]["ok"] is True
+
+
+def test_ready_fails_when_database_is_unreachable(app_factory, tmp_path):
+    """Test: DBに接続できない場合にレディネスが503を返すこと."""
+    app = app_factory(DATABASE_URL=f"sqlite:///{tmp_path / 'missing' / 'app.db'}")
+    with TestClient(app) as client:
+        response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "degraded"
+    assert body["checks"]["database"] == {"ok": False, "error": "OperationalError"}
+
+
+def test_ready_fails_on_event_loop_lag(app_factory, tmp_path):
+    """Test: イベントループの遅延が閾値を超えるとレディネスが503を返すこと."""
+    app = app_factory(DATABASE_URL=_sqlite_url(tmp_path), HEALTH_MAX_LOOP_LAG_MS="10")
+    app.state.loop_monitor._samples.append(0.5)
+    with TestClient(app) as client:
+        response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["event_loop"] == {
+        "ok": False, "lag_ms": 500.0, "max_lag_ms": 10.0
+    }
+
+
+async def test_loop_monitor_detects_blocking_call():
+    """Test: イベントループをブロックする処理が遅延として計測されること."""
+    monitor = EventLoopLagMonitor(0.01)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+    time.sleep(0.2)
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    assert monitor.lag_seconds >= 0.15
+    assert EventLoopLagMonitor(0).enabled is False
+
+
+def test_pool_has_capacity():
+    """Test: プールの空きが使用中の接続数とオーバーフロー上限から判定されること."""
+    assert pool_has_capacity(None) is True
+    assert pool_has_capacity({"pool_class": "NullPool"}) is True
+    assert pool_has_capacity({"checked_out": 4, "size": 2, "max_overflow": 3}) is True
+    assert pool_has_capacity({"checked_out": 5, "size": 2, "max_overflow": 3}) is False
+    assert pool_has_capacity({"checked_out": 50, "size": 2, "max_overflow": -1}) is True
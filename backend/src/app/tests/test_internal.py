@@ -0,0 +1,33 @@
+"""Tests for access control of the internal operational endpoints."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.auth import secret_matches
+
+INTERNAL_PATHS = ["/internal/stats", "/internal/db-pool"]
+
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_require_token(app_factory, internal_headers, path):
+    """Test: 内部エンドポイントが正しいトークンのときだけ応答すること."""
+    with TestClient(app_factory()) as client:
+        assert client.get(path, headers=internal_headers).status_code == 200
+        assert client.get(path).status_code == 404
+        assert client.get(path, headers={"X-Internal-Token": "guess"}).status_code == 404
+
+
+@pytest.mark.parametrize("path", INTERNAL_PATHS)
+def test_internal_endpoints_are_off_without_token(app_factory, internal_headers, path):
+    """Test: トークン未設定時は内部エンドポイントが無効になること."""
+    with TestClient(app_factory(INTERNAL_API_TOKEN="")) as client:
+        assert client.get(path, headers=internal_headers).status_code == 404
+        assert client.get(path, headers={"X-Internal-Token": ""}).status_code == 404
+
+
+def test_secret_matches():
+    """Test: 設定された秘密値と一致するときだけ真になること."""
+    assert secret_matches("secret", "secret") is True
+    assert secret_matches("Secret", "secret") is False
+    assert secret_matches(None, "secret") is False
+    assert secret_matches("", "") is False
+    assert secret_matches("x", None) is False
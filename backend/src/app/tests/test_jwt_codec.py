@@ -0,0 +1,93 @@
+"""Tests for the JWT codecs."""
+import time
+
+import pytest
+from jose import ExpiredSignatureError, JWTError, jwt
+
+from app.utils.jwt import FastHS256Codec, JoseCodec, TokenCodec, build_codec
+from app.utils.jwt_keys import KeyRing, generate_private_key_pem
+
+SECRET = "test-secret"
+
+
+@pytest.fixture
+def key_ring():
+    """HS256 key ring."""
+    return KeyRing.from_secret(SECRET, "HS256")
+
+
+@pytest.mark.parametrize("claims", [
+    {"sub": "00000000-0000-0000-0000-000000000000", "type": "access"},
+    {"sub": "ユーザー", "type": "refresh", "note": "quote\" and \\ backslash"},
+    {"sub": "user-1", "type": "access", "scopes": ["a", "b"], "n": 1.5, "flag": None},
+])
+def test_fast_codec_is_byte_compatible_with_jose(key_ring, claims):
+    """Test: 高速コーデックの出力が python-jose と完全に一致すること."""
+    claims = {**claims, "exp": int(time.time()) + 60}
+
+    fast_token = FastHS256Codec(key_ring).encode(dict(claims))
+    jose_token = JoseCodec(key_ring).encode(dict(claims))
+
+    assert fast_token == jose_token
+    assert FastHS256Codec(key_ring).decode(jose_token) == claims
+    assert JoseCodec(key_ring).decode(fast_token) == claims
+
+
+def test_fast_codec_rejects_expired_and_tampered_tokens(key_ring):
+    """Test: 期限切れ・改ざん・不正な形式のトークンを拒否すること."""
+    codec = FastHS256Codec(key_ring)
+    expired = codec.encode({"sub": "user-1", "exp": int(time.time()) - 10})
+    with pytest.raises(ExpiredSignatureError):
+        codec.decode(expired)
+
+    token = codec.encode({"sub": "user-1", "exp": int(time.time()) + 60})
+    header, payload, signature = token.split(".")
+    forged_payload = jwt.encode({"sub": "admin"}, "other-secret").split(".")[1]
+    for bad in (
+        f"{header}.{forged_payload}.{signature}",
+        f"{header}.{payload}.{signature[:-2]}AA",
+        "not-a-token",
+        f"{header}.{payload}",
+    ):
+        with pytest.raises(JWTError):
+            codec.decode(bad)
+
+    other_key = KeyRing.from_secret("other-secret", "HS256")
+    with pytest.raises(JWTError):
+        codec.decode(FastHS256Codec(other_key).encode({"sub": "user-1"}))
+
+
+def test_fast_codec_rejects_other_algorithms(key_ring):
+    """Test: HS256 以外の alg ヘッダーを持つトークンを拒否すること."""
+    codec = FastHS256Codec(key_ring)
+    hs512 = jwt.encode({"sub": "user-1"}, SECRET, algorithm="HS512")
+
+    with pytest.raises(JWTError):
+        codec.decode(hs512)
+
+
+def test_build_codec_selects_backend(key_ring, tmp_path):
+    """Test: アルゴリズムと設定に応じてコーデックが選択されること."""
+    assert isinstance(build_codec(key_ring), FastHS256Codec)
+    assert isinstance(build_codec(key_ring, "jose"), JoseCodec)
+
+    (tmp_path / "key-1.pem").write_bytes(generate_private_key_pem("ES256"))
+    es256 = KeyRing.from_directory(str(tmp_path), "key-1", "ES256")
+    assert isinstance(build_codec(es256), JoseCodec)
+    with pytest.raises(ValueError):
+        build_codec(es256, "fast")
+    with pytest.raises(ValueError):
+        build_codec(key_ring, "unknown")
+
+
+def test_incomplete_codec_cannot_be_instantiated(key_ring):
+    """Test: encode/decode を実装していないコーデックは生成時にエラーになること."""
+
+    class EncodeOnlyCodec(TokenCodec):
+        def encode(self, claims):
+            return ""
+
+    with pytest.raises(TypeError):
+        TokenCodec(key_ring)
+    with pytest.raises(TypeError):
+        EncodeOnlyCodec(key_ring)
@@ -0,0 +1,105 @@
+"""Tests for asymmetric JWT signing, key rotation and the JWKS endpoint."""
+import pytest
+from fastapi.testclient import TestClient
+from jose import JWTError, jwt
+
+from app.utils import jwt_keys
+from app.utils.jwt import create_access_token, decode_token
+from app.utils.jwt_keys import KeyRing, generate_private_key_pem
+from app.utils.token_cache import token_cache
+
+
+def write_key(directory, kid):
+    """Write a fresh ES256 private key as <kid>.pem."""
+    (directory / f"{kid}.pem").write_bytes(generate_private_key_pem("ES256"))
+
+
+@pytest.fixture(autouse=True)
+def restore_key_ring():
+    """Restore the global key ring and token cache after each test."""
+    original = jwt_keys.key_ring
+    token_cache.clear()
+    yield
+    jwt_keys.key_ring = original
+    token_cache.clear()
+
+
+def test_es256_tokens_carry_kid_and_verify(tmp_path):
+    """Test: ES256 で署名したトークンに kid ヘッダーが付き、検証できること."""
+    write_key(tmp_path, "key-1")
+    jwt_keys.key_ring = KeyRing.from_directory(str(tmp_path), "key-1", "ES256")
+
+    token = create_access_token({"sub": "user-1"})
+
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == "ES256"
+    assert header["kid"] == "key-1"
+    assert decode_token(token, expected_type="access")["sub"] == "user-1"
+
+
+def test_tokens_signed_by_previous_key_verify_after_rotation(tmp_path):
+    """Test: 鍵のローテーション後も旧鍵で署名したトークンを検証できること."""
+    write_key(tmp_path, "key-1")
+    jwt_keys.key_ring = KeyRing.from_directory(str(tmp_path), "key-1", "ES256")
+    old_token = create_access_token({"sub": "user-1"})
+
+    write_key(tmp_path, "key-2")
+    jwt_keys.key_ring = KeyRing.from_directory(str(tmp_path), "key-2", "ES256")
+    new_token = create_access_token({"sub": "user-2"})
+
+    assert jwt.get_unverified_header(new_token)["kid"] == "key-2"
+    assert decode_token(old_token)["sub"] == "user-1"
+    assert decode_token(new_token)["sub"] == "user-2"
+
+    # Once the old key file is removed its tokens are rejected
+    (tmp_path / "key-1.pem").unlink()
+    jwt_keys.key_ring = KeyRing.from_directory(str(tmp_path), "key-2", "ES256")
+    token_cache.clear()
+    with pytest.raises(JWTError):
+        decode_token(old_token)
+
+
+def test_from_directory_rejects_missing_or_public_active_key(tmp_path):
+    """Test: 署名用の鍵が存在しない・公開鍵のみの場合はエラーになること."""
+    write_key(tmp_path, "key-1")
+    with pytest.raises(ValueError):
+        KeyRing.from_directory(str(tmp_path), "missing", "ES256")
+
+    ring = KeyRing.from_directory(str(tmp_path), "key-1", "ES256")
+    (tmp_path / "public.pem").write_bytes(ring.verification_keys["key-1"].to_pem())
+    with pytest.raises(ValueError):
+        KeyRing.from_directory(str(tmp_path), "public", "ES256")
+
+
+def test_jwks_endpoint_publishes_public_keys(tmp_path, app_factory):
+    """Test: GET /.well-known/jwks.json - 公開鍵がキャッシュ可能な形で返ること."""
+    write_key(tmp_path, "key-1")
+    write_key(tmp_path, "key-2")
+    jwt_keys.key_ring = KeyRing.from_directory(str(tmp_path), "key-2", "ES256")
+
+    with TestClient(app_factory()) as client:
+        response = client.get("/.well-known/jwks.json")
+        assert response.status_code == 200
+        assert "max-age=" in response.headers["Cache-Control"]
+        keys = response.json()["keys"]
+        assert sorted(key["kid"] for key in keys) == ["key-1", "key-2"]
+        assert all("d" not in key for key in keys)
+
+        cached = client.get(
+            "/.well-known/jwks.json",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        assert cached.status_code == 304
+
+    # Tokens verify against the published key
+    token = create_access_token({"sub": "user-1"})
+    published = next(key for key in keys if key["kid"] == "key-2")
+    assert jwt.decode(token, published, algorithms=["ES256"])["sub"] == "user-1"
+
+
+def test_jwks_is_empty_for_hmac_secret():
+    """Test: HS256 の場合は鍵を公開しないこと."""
+    ring = KeyRing.from_secret("secret", "HS256")
+
+    assert ring.jwks_body == b'{"keys":[]}'
+    assert ring.headers is None
@@ -0,0 +1,106 @@
+"""Tests for the metrics registry and /metrics endpoint."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app import config
+from app.middleware import metrics as metrics_middleware
+from app.utils.metrics import Registry, _Metric
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test: ヒストグラムが累積バケット形式で出力されること."""
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(5.0, route="/a")
+
+    output = registry.render()
+
+    assert "# TYPE latency_seconds histogram" in output
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in output
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in output
+    assert 'latency_seconds_count{route="/a"} 3' in output
+
+
+def test_collected_counters_are_exported_as_counters(app_factory, metrics_headers):
+    """Test: 累積値のキャッシュ・プール統計がcounter型の *_total として出力されること."""
+    with TestClient(app_factory()) as client:
+        body = client.get("/metrics", headers=metrics_headers).text
+
+    assert "# TYPE cache_events_total counter" in body
+    assert 'cache_events_total{cache="token",event="misses"}' in body
+    assert "# TYPE db_pool_checkout_timeouts_total counter" in body
+    assert "# TYPE db_pool_checkout_wait_seconds_total counter" in body
+    assert "# TYPE cache_entries gauge" in body
+
+
+def test_metric_without_samples_cannot_be_instantiated():
+    """Test: _samples を実装していないメトリクスは生成時にエラーになること."""
+
+    class SamplelessMetric(_Metric):
+        type_name = "gauge"
+
+    with pytest.raises(TypeError):
+        SamplelessMetric("sampleless", "No samples.")
+
+
+def test_metrics_endpoint_labels_requests_by_route_template(app_factory, metrics_headers):
+    """Test: GET /metrics - リクエストがルートテンプレート単位で集計されること."""
+    with TestClient(app_factory()) as client:
+        client.get("/health")
+        client.get("/no-such-page/12345")
+        response = client.get("/metrics", headers=metrics_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in body
+    assert "/no-such-page/12345" not in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/health",le="+Inf"}' in body
+
+
+def test_nonstandard_methods_share_one_label(app_factory, metrics_headers):
+    """Test: 標準外のHTTPメソッドがすべて "OTHER" ラベルに集約されること."""
+    with TestClient(app_factory()) as client:
+        client.request("FOO1", "/health")
+        client.request("FOO2", "/health")
+        body = client.get("/metrics", headers=metrics_headers).text
+
+    assert "FOO1" not in body
+    assert "FOO2" not in body
+    assert 'http_requests_total{method="OTHER",route="/health",status="405"} 2' in body
+
+
+def test_metrics_endpoint_requires_scrape_token(app_factory, metrics_headers):
+    """Test: GET /metrics - スクレイプ用トークンがない・誤っている・未設定の場合は404になること."""
+    with TestClient(app_factory()) as client:
+        missing = client.get("/metrics")
+        wrong = client.get("/metrics", headers={"Authorization": "Bearer guess"})
+    with TestClient(app_factory(METRICS_TOKEN="")) as client:
+        unconfigured = client.get("/metrics", headers=metrics_headers)
+
+    assert [missing.status_code, wrong.status_code, unconfigured.status_code] == [404] * 3
+
+
+def test_route_is_resolved_once_per_request(app_factory, monkeypatch, tmp_path):
+    """Test: 複数のミドルウェアがあってもルート解決が1リクエスト1回で済むこと."""
+    calls = []
+    match_route = metrics_middleware._match_route
+    monkeypatch.setattr(
+        metrics_middleware, "_match_route", lambda scope: calls.append(1) or match_route(scope)
+    )
+    monkeypatch.setattr(config.settings, "LOG_SUCCESS_SAMPLE_RATE", 1.0)
+    app = app_factory(
+        LOOP_BLOCK_DETECTOR_ENABLED="true",
+        PROFILING_ENABLED="true",
+        PROFILING_SAMPLE_RATE="1",
+        PROFILING_DIR=str(tmp_path),
+        LOG_SUCCESS_SAMPLE_RATE="1",
+    )
+    with TestClient(app) as client:
+        client.get("/health")
+
+    assert len(calls) == 1
@@ -0,0 +1,72 @@
+"""Tests for the password hashing executor."""
+import pytest
+
+from app.config import settings
+from app.utils.calibrate_bcrypt import MIN_ROUNDS, calibrate, recommend_rounds
+from app.utils.password import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    hash_password,
+    hash_rounds,
+    needs_rehash,
+)
+
+
+async def test_hash_and_verify_round_trip():
+    """Test: executor上でハッシュ化と検証ができること."""
+    hasher = PasswordHasher(max_workers=2, max_concurrency=2)
+    try:
+        hashed = await hasher.hash("ValidPass123")
+
+        assert hashed.startswith("$2b$")
+        assert await hasher.verify("ValidPass123", hashed) is True
+        assert await hasher.verify("WrongPass123", hashed) is False
+    finally:
+        hasher.shutdown()
+
+
+async def test_saturated_hasher_raises_busy():
+    """Test: 同時実行数の上限に達した場合はキュータイムアウト後にBusyとなること."""
+    hasher = PasswordHasher(max_workers=1, max_concurrency=1, queue_timeout=0.05)
+    try:
+        semaphore = hasher._get_semaphore()
+        await semaphore.acquire()
+
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.hash("ValidPass123")
+
+        semaphore.release()
+        assert (await hasher.hash("ValidPass123")).startswith("$2b$")
+    finally:
+        hasher.shutdown()
+
+
+def test_hash_blocking_from_sync_code():
+    """Test: 同期コードからexecutor経由でハッシュ化できること."""
+    hasher = PasswordHasher(max_workers=1, max_concurrency=1)
+    try:
+        hashed = hasher.hash_blocking("ValidPass123")
+        assert hasher.hash_blocking("ValidPass123") != hashed
+    finally:
+        hasher.shutdown()
+
+
+def test_hash_password_uses_configured_rounds(monkeypatch):
+    """Test: BCRYPT_ROUNDS がハッシュのコストに反映される."""
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+    hashed = hash_password("ValidPass123")
+
+    assert hash_rounds(hashed) == 5
+    assert needs_rehash(hashed) is False
+    assert needs_rehash(hashed, rounds=6) is True
+    assert needs_rehash("not-a-bcrypt-hash") is True
+
+
+def test_calibration_recommends_rounds_within_target():
+    """Test: キャリブレーションが目標時間内の最大コストを推奨する."""
+    timings = calibrate(target_ms=0.0, samples=1)
+
+    assert list(timings) == [MIN_ROUNDS]
+    assert recommend_rounds({4: 1.0, 5: 2.0, 6: 4.0}, target_ms=3.0) == 5
+    assert recommend_rounds({4: 10.0}, target_ms=3.0) == MIN_ROUNDS
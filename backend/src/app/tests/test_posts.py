@@ -0,0 +1,135 @@
+"""Tests for the posts timeline and its keyset pagination."""
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.post import Post
+from app.models.user import User
+from app.services.posts import NEXT_PAGE, InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.jwt import create_access_token
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def posts_database(tmp_path):
+    """SQLite database with one user and 25 posts, some created in the same instant."""
+    database_url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        user = User(email="posts@example.com", password="TestPass123")
+        session.add(user)
+        session.flush()
+        for i in range(25):
+            # Pairs of posts share a timestamp, so page boundaries fall inside ties
+            session.add(Post(user_id=user.id, content=f"post {i}",
+                             created_at=START + timedelta(minutes=i // 2)))
+        session.commit()
+        user_id = user.id
+    yield database_url, engine, user_id
+    engine.dispose()
+
+
+def _auth(user_id) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+def test_pages_cover_all_posts_in_order(app_factory, posts_database):
+    """Test: カーソルで辿ると全投稿が重複・欠落なく新しい順に取得できること."""
+    database_url, engine, user_id = posts_database
+    app = app_factory(DATABASE_URL=database_url)
+
+    pages = []
+    cursor = None
+    with TestClient(app) as client:
+        while True:
+            params = {"limit": 10} if cursor is None else {"limit": 10, "cursor": cursor}
+            response = client.get("/api/posts", params=params, headers=_auth(user_id))
+            assert response.status_code == 200
+            body = response.json()
+            pages.append(body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    items = [item for page in pages for item in page]
+    assert len({item["id"] for item in items}) == 25
+    keys = [(item["created_at"], item["id"]) for item in items]
+    assert keys == sorted(keys, reverse=True)
+    assert items[0]["content"] in {"post 23", "post 24"}
+
+
+def test_exact_last_page_has_no_cursor(app_factory, posts_database):
+    """Test: 件数がページサイズ丁度で終わる場合に次カーソルがnullになること."""
+    database_url, _, user_id = posts_database
+    app = app_factory(DATABASE_URL=database_url)
+    with TestClient(app) as client:
+        body = client.get("/api/posts", params={"limit": 25}, headers=_auth(user_id)).json()
+
+    assert len(body["items"]) == 25
+    assert body["next_cursor"] is None
+
+
+def test_invalid_cursor_and_auth(app_factory, posts_database):
+    """Test: 不正なカーソルは400、未認証はエラーになること."""
+    database_url, _, user_id = posts_database
+    app = app_factory(DATABASE_URL=database_url)
+    with TestClient(app) as client:
+        bad = client.get("/api/posts", params={"cursor": "not-a-cursor"}, headers=_auth(user_id))
+        too_large = client.get("/api/posts", params={"limit": 1000}, headers=_auth(user_id))
+        anonymous = client.get("/api/posts")
+
+    assert bad.status_code == 400
+    assert too_large.status_code == 422
+    assert anonymous.status_code in (401, 403)
+
+
+def test_cursor_round_trip():
+    """Test: カーソルのエンコード・デコードが往復できること."""
+    post_id = uuid.uuid4()
+    created_at = datetime(2026, 10, 17, 12, 30, 0, 123456)
+
+    assert decode_cursor(encode_cursor(created_at, post_id)) == (created_at, post_id)
+    for cursor in ("", "!!!", encode_cursor(created_at, post_id)[:-4]):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+def test_cursor_with_utc_offset_is_rejected(app_factory, posts_database):
+    """Test: タイムゾーン付きの時刻を持つカーソルは500ではなく400になること."""
+    database_url, _, user_id = posts_database
+    aware = datetime(2024, 1, 1, tzinfo=UTC)
+    cursor = encode_cursor(aware, uuid.uuid4())
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+    with TestClient(app_factory(DATABASE_URL=database_url)) as client:
+        response = client.get("/api/posts", params={"cursor": cursor}, headers=_auth(user_id))
+
+    assert response.status_code == 400
+
+
+def test_next_page_seeks_through_index(posts_database):
+    """Test: 次ページのクエリが(created_at, id)インデックスで検索され、ソートが発生しないこと."""
+    _, engine, _ = posts_database
+    compiled = NEXT_PAGE.compile(dialect=engine.dialect)
+    # Values in SQLite's storage format for DateTime and UUID columns
+    params = compiled.construct_params(
+        {"created_at": "2026-01-01 00:05:00.000000", "id": "0" * 32, "limit": 11}
+    )
+    with engine.connect() as connection:
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}",
+            tuple(params[name] for name in compiled.positiontup),
+        ).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_posts_created_at_id" in details
+    assert "TEMP B-TREE" not in details
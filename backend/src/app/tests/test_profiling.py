@@ -0,0 +1,117 @@
+"""Tests for on-demand request profiling."""
+import cProfile
+import pstats
+
+from fastapi.testclient import TestClient
+
+from app.middleware.profiling import ProfilingMiddleware
+from app.utils.profiling import ProfileStore, profile_name
+
+PROFILE_HEADERS = {"X-Profile": "secret-token"}
+
+
+def _profiling_app(app_factory, tmp_path, **overrides):
+    return app_factory(
+        PROFILING_ENABLED="true",
+        PROFILING_TOKEN="secret-token",
+        PROFILING_DIR=str(tmp_path / "profiles"),
+        **overrides,
+    )
+
+
+def test_profiles_request_with_token(app_factory, tmp_path):
+    """Test: 正しいトークン付きのリクエストがプロファイルされ、一覧・取得できること."""
+    app = _profiling_app(app_factory, tmp_path)
+    with TestClient(app) as client:
+        response = client.get("/health", headers=PROFILE_HEADERS)
+        name = response.headers["X-Profile-Id"]
+        listing = client.get("/internal/profiles", headers=PROFILE_HEADERS).json()["profiles"]
+        download = client.get(f"/internal/profiles/{name}", headers=PROFILE_HEADERS)
+        relisted = client.get("/internal/profiles", headers=PROFILE_HEADERS).json()["profiles"]
+
+    assert response.json() == {"status": "healthy"}
+    assert "-GET-health-" in name
+    assert [capture["name"] for capture in listing] == [name]
+    assert download.status_code == 200
+    assert "X-Profile-Id" not in download.headers
+    assert relisted == listing
+    path = tmp_path / "downloaded.prof"
+    path.write_bytes(download.content)
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_ignores_requests_without_valid_token(app_factory, tmp_path):
+    """Test: トークンがない・誤っているリクエストはプロファイルされないこと."""
+    app = _profiling_app(app_factory, tmp_path)
+    with TestClient(app) as client:
+        plain = client.get("/health")
+        wrong = client.get("/health", headers={"X-Profile": "guess"})
+        listing = client.get("/internal/profiles", headers=PROFILE_HEADERS).json()["profiles"]
+
+    assert "X-Profile-Id" not in plain.headers
+    assert "X-Profile-Id" not in wrong.headers
+    assert listing == []
+
+
+def test_stored_profiles_require_profiling_token(app_factory, tmp_path, internal_headers):
+    """Test: 保存済みプロファイルはX-Profileトークンなし・誤り・内部トークンでは取得できないこと."""
+    app = _profiling_app(app_factory, tmp_path)
+    with TestClient(app) as client:
+        name = client.get("/health", headers=PROFILE_HEADERS).headers["X-Profile-Id"]
+        responses = [
+            client.get(path, headers=headers)
+            for path in ("/internal/profiles", f"/internal/profiles/{name}")
+            for headers in ({}, {"X-Profile": "guess"}, internal_headers)
+        ]
+
+    assert [response.status_code for response in responses] == [404] * 6
+
+
+def test_samples_requests(app_factory, tmp_path):
+    """Test: サンプリング率の指定でトークンなしのリクエストもプロファイルされること."""
+    app = _profiling_app(app_factory, tmp_path, PROFILING_SAMPLE_RATE="1")
+    with TestClient(app) as client:
+        response = client.get("/")
+
+    assert response.headers["X-Profile-Id"].endswith(".prof")
+
+
+def test_disabled_profiling_adds_no_middleware(app_factory, tmp_path):
+    """Test: 無効時はミドルウェアが追加されず、ヘッダーがあってもプロファイルされないこと."""
+    app = app_factory(PROFILING_TOKEN="secret-token", PROFILING_DIR=str(tmp_path / "profiles"))
+    with TestClient(app) as client:
+        response = client.get("/health", headers={"X-Profile": "secret-token"})
+
+    assert all(middleware.cls is not ProfilingMiddleware for middleware in app.user_middleware)
+    assert "X-Profile-Id" not in response.headers
+    assert all(not route.path.startswith("/internal/profiles") for route in app.routes)
+    assert not (tmp_path / "profiles").exists()
+
+
+def test_store_keeps_newest_captures(tmp_path):
+    """Test: 保存数の上限を超えると古いプロファイルから削除されること."""
+    store = ProfileStore(str(tmp_path), max_files=2)
+    names = [profile_name(1_800_000_000 + i, "GET", "/api/posts/{id}", "abcd") for i in range(3)]
+    for name in names:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        profiler.disable()
+        store.save(profiler, name)
+
+    assert [capture["name"] for capture in store.list()] == [names[2], names[1]]
+    assert names[0].endswith("-GET-api-posts-id-abcd.prof")
+
+
+def test_store_rejects_path_traversal(app_factory, tmp_path):
+    """Test: ディレクトリ外のファイルを取得できないこと."""
+    (tmp_path / "secret.prof").write_bytes(b"x")
+    store = ProfileStore(str(tmp_path / "profiles"), max_files=2)
+
+    assert store.path("../secret.prof") is None
+    assert store.path("missing.prof") is None
+
+    app = _profiling_app(app_factory, tmp_path)
+    with TestClient(app) as client:
+        response = client.get("/internal/profiles/..%2Fsecret.prof", headers=PROFILE_HEADERS)
+
+    assert response.status_code == 404
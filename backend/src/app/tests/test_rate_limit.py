@@ -0,0 +1,45 @@
+"""Tests for the token bucket rate limiter."""
+import time
+
+from app.utils.rate_limit import TokenBucketLimiter
+
+
+def test_bucket_allows_burst_then_limits_with_retry_after(monkeypatch):
+    """Test: バースト分は許可され、超過時は待ち時間が返ること."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    limiter = TokenBucketLimiter("test", rate=1.0, burst=3, max_keys=10)
+
+    assert [limiter.hit("key") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.hit("key") == 1.0
+    assert limiter.hit("other") == 0.0
+
+    now[0] += 1.5
+    assert limiter.hit("key") == 0.0
+    assert 0 < limiter.hit("key") <= 1.0
+    assert limiter.stats()["limited"] == 2
+
+
+def test_key_count_is_bounded_and_refilled_buckets_expire(monkeypatch):
+    """Test: キー数が上限を超えず、満タンに戻ったバケットは削除されること."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    limiter = TokenBucketLimiter("test", rate=1.0, burst=2, max_keys=3)
+
+    for i in range(5):
+        limiter.hit(f"key-{i}")
+    assert limiter.stats()["size"] == 3
+    assert limiter.stats()["evictions"] == 2
+
+    now[0] += 10
+    limiter.hit("new-key")
+    assert limiter.stats()["size"] == 1
+    assert limiter.purge() == 0
+
+
+def test_disabled_limiter_allows_everything():
+    """Test: レートが0の場合は制限しないこと."""
+    limiter = TokenBucketLimiter("test", rate=0, burst=1, max_keys=1)
+
+    assert all(limiter.hit("key") == 0.0 for _ in range(10))
+    assert limiter.stats()["size"] == 0
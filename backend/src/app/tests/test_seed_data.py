@@ -1,8 +1,17 @@
 """Tests for seed data script."""
+import json
+
 import pytest
 
 from app.models.user import User
-from app.utils.seed_data import create_seed_user
+from app.utils.password import PasswordHasher
+from app.utils.seed_data import (
+    MAX_BATCH_SIZE,
+    build_parser,
+    bulk_import_users,
+    create_seed_user,
+    read_user_records,
+)
 
 
 def test_create_seed_user_success(db_session):
@@ -46,3 +55,100 @@ def test_create_seed_user_missing_password(db_session):
     """Test seed user creation fails without password."""
     with pytest.raises(ValueError, match="SEED_USER_PASSWORD environment variable is not set"):
         create_seed_user(db_session, "seed@example.com", None)
+
+
+def test_bulk_import_users_from_csv(db_session, tmp_path):
+    """Test: CSVから一括登録し、重複・不正行をスキップすること."""
+    existing_user = User(email="existing@example.com", password="ExistingPass123")
+    db_session.add(existing_user)
+    db_session.commit()
+
+    prehashed = User(email="hashed@example.com", password="HashedPass123").hashed_password
+    csv_file = tmp_path / "users.csv"
+    csv_file.write_text(
+        "email,password,hashed_password\n"
+        "bulk1@example.com,BulkPass123,\n"
+        "bulk2@example.com,BulkPass456,\n"
+        f"hashed@example.com,,{prehashed}\n"
+        "existing@example.com,ExistingPass123,\n"
+        "not-an-email,BulkPass123,\n"
+        "weak@example.com,short,\n"
+    )
+
+    hasher = PasswordHasher(max_workers=2, max_concurrency=2)
+    try:
+        stats = bulk_import_users(
+            db_session, read_user_records(csv_file), hasher=hasher, batch_size=2, progress=False
+        )
+    finally:
+        hasher.shutdown()
+
+    assert stats.read == 6
+    assert stats.inserted == 3
+    assert stats.duplicates == 1
+    assert stats.invalid == 2
+
+    bulk_user = db_session.query(User).filter(User.email == "bulk1@example.com").first()
+    assert bulk_user.verify_password("BulkPass123") is True
+    hashed_user = db_session.query(User).filter(User.email == "hashed@example.com").first()
+    assert hashed_user.hashed_password == prehashed
+
+
+def test_bulk_import_prehashed_jsonl_rejects_plain_passwords(db_session, tmp_path):
+    """Test: ハッシュ済みモードでは平文パスワードの行を不正として扱うこと."""
+    prehashed = User(email="hashed@example.com", password="HashedPass123").hashed_password
+    jsonl_file = tmp_path / "users.jsonl"
+    jsonl_file.write_text(
+        json.dumps({"email": "hashed@example.com", "hashed_password": prehashed}) + "\n"
+        + json.dumps({"email": "plain@example.com", "password": "PlainPass123"}) + "\n"
+    )
+
+    stats = bulk_import_users(db_session, read_user_records(jsonl_file), progress=False)
+
+    assert stats.inserted == 1
+    assert stats.invalid == 1
+    assert db_session.query(User).count() == 1
+
+
+def test_bulk_import_skips_jsonl_lines_that_are_not_json(db_session, tmp_path):
+    """Test: JSONとして読めない行は不正として数え、後続の行の登録を続けること."""
+    prehashed = User(email="hashed@example.com", password="HashedPass123").hashed_password
+    jsonl_file = tmp_path / "users.jsonl"
+    jsonl_file.write_text(
+        "not json\n"
+        + json.dumps({"email": "hashed@example.com", "hashed_password": prehashed}) + "\n"
+    )
+
+    stats = bulk_import_users(
+        db_session, read_user_records(jsonl_file), batch_size=1, progress=False
+    )
+
+    assert (stats.read, stats.inserted, stats.invalid) == (2, 1, 1)
+
+
+def test_bulk_import_skips_jsonl_values_that_are_not_objects(db_session, tmp_path):
+    """Test: オブジェクト以外のJSON値や型の違う項目は不正として数え、登録を続けること."""
+    prehashed = User(email="hashed@example.com", password="HashedPass123").hashed_password
+    jsonl_file = tmp_path / "users.jsonl"
+    jsonl_file.write_text(
+        '["x"]\n"text"\n{"email": 5, "hashed_password": "x"}\n'
+        + json.dumps({"email": "hashed@example.com", "hashed_password": prehashed}) + "\n"
+    )
+
+    stats = bulk_import_users(db_session, read_user_records(jsonl_file), progress=False)
+
+    assert (stats.read, stats.inserted, stats.invalid) == (4, 1, 3)
+
+
+@pytest.mark.parametrize("value", ["0", "-1", str(MAX_BATCH_SIZE + 1)])
+def test_batch_size_is_limited_to_the_insert_parameter_limit(value, capsys):
+    """Test: --batch-size は1以上、1回のINSERTのパラメータ上限に収まる値のみ受け付けること."""
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["--bulk", "users.csv", "--batch-size", value])
+
+    assert f"must be between 1 and {MAX_BATCH_SIZE}" in capsys.readouterr().err
+    assert build_parser().parse_args(["--batch-size", str(MAX_BATCH_SIZE)]).batch_size == (
+        MAX_BATCH_SIZE
+    )
+    with pytest.raises(ValueError, match="batch_size"):
+        bulk_import_users(None, [], batch_size=int(value), progress=False)
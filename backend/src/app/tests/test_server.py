@@ -0,0 +1,42 @@
+"""Tests for the production server configuration."""
+from types import SimpleNamespace
+
+from app.config import Settings
+from app.server import Server, default_worker_count, gunicorn_options, post_fork
+
+
+def test_gunicorn_options_follow_settings():
+    """Test: サーバー設定がSettingsから組み立てられ、ワーカー数0でCPU数になること."""
+    options = gunicorn_options(Settings({
+        "BACKEND_HOST": "127.0.0.1",
+        "BACKEND_PORT": "9000",
+        "SERVER_WORKERS": "3",
+        "SERVER_MAX_REQUESTS": "500",
+        "SERVER_KEEPALIVE": "15",
+        "SERVER_BACKLOG": "64",
+        "FORWARDED_ALLOW_IPS": "10.0.0.0/8,192.168.1.5",
+    }))
+
+    assert options["bind"] == "127.0.0.1:9000"
+    assert options["workers"] == 3
+    assert options["max_requests"] == 500
+    assert options["keepalive"] == 15
+    assert options["backlog"] == 64
+    assert options["forwarded_allow_ips"] == "10.0.0.0/8,192.168.1.5"
+    assert options["preload_app"] is True
+    assert options["worker_class"] == "app.server.DrainingUvicornWorker"
+    assert gunicorn_options(Settings({}))["workers"] == default_worker_count() >= 1
+    assert gunicorn_options(Settings({}))["forwarded_allow_ips"] == "127.0.0.1"
+
+
+def test_post_fork_discards_connections_of_preloaded_app(tmp_path):
+    """Test: preload したアプリのDB接続がフォーク後のワーカーで破棄されること."""
+    server = Server(Settings({"DATABASE_URL": f"sqlite:///{tmp_path / 'fork.db'}"}))
+    database = server.load().state.database
+    with database.engine.connect():
+        pass
+    inherited_pool = database.engine.pool
+
+    post_fork(SimpleNamespace(app=server), None)
+
+    assert database.engine.pool is not inherited_pool
@@ -0,0 +1,132 @@
+"""Tests for the structured access and auth event logs."""
+import json
+import logging
+import queue
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import config
+from app.database import Base
+from app.models.user import User
+from app.utils.metrics import log_records_dropped_total
+from app.utils.structured_logging import BoundedQueueHandler, JsonFormatter
+
+
+def _log_lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line]
+
+
+@pytest.fixture
+def user_database(tmp_path):
+    """SQLite database with one user (password "TestPass123")."""
+    database_url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        user = User(email="log@example.com", password="TestPass123")
+        session.add(user)
+        session.commit()
+        user_id = str(user.id)
+    engine.dispose()
+    return database_url, user_id
+
+
+def test_json_formatter_merges_fields_and_traceback():
+    """Test: 構造化フィールドと例外がJSONの1行として出力されること."""
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "app.test", logging.ERROR, __file__, 1, "failed %s", ("job",), sys.exc_info()
+        )
+    record.fields = {"route": "/api/auth/login", "status": 500}
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "failed job"
+    assert entry["level"] == "ERROR"
+    assert entry["route"] == "/api/auth/login"
+    assert entry["status"] == 500
+    assert "RuntimeError: boom" in entry["exc_info"]
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    """Test: キューが満杯のときにレコードを破棄して件数を数えること."""
+    handler = BoundedQueueHandler(queue.Queue(2))
+    logger = logging.getLogger("app.test.bounded")
+    logger.addHandler(handler)
+    logger.propagate = False
+    before = log_records_dropped_total.value()
+    try:
+        for i in range(5):
+            logger.warning("record %d", i)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.queue.qsize() == 2
+    assert handler.queue.get_nowait().msg == "record 0"
+    assert log_records_dropped_total.value() == before + 3
+
+
+def test_access_log_samples_successes_and_keeps_failures(app_factory, capsys, monkeypatch):
+    """Test: 成功リクエストはサンプリングされ、401は認証失敗理由付きで必ず記録されること."""
+    monkeypatch.setattr(config.settings, "LOG_SUCCESS_SAMPLE_RATE", 0.0)
+    app = app_factory(LOG_SUCCESS_SAMPLE_RATE="0")
+    with TestClient(app) as client:
+        client.get("/health")
+        client.get("/api/auth/me", headers={"Authorization": "Bearer not-a-token"})
+
+    lines = _log_lines(capsys)
+    access = [line for line in lines if line["logger"] == "app.access"]
+    assert len(access) == 1
+    assert access[0]["route"] == "/api/auth/me"
+    assert access[0]["status"] == 401
+    assert access[0]["auth_failure"] == "invalid_token"
+    assert access[0]["duration_ms"] >= 0
+    auth = [line for line in lines if line["logger"] == "app.auth"]
+    assert auth[0]["event"] == "token"
+    assert auth[0]["reason"] == "invalid_token"
+
+
+def test_login_events(app_factory, user_database, capsys, monkeypatch):
+    """Test: ログインの成功・失敗がユーザーIDと理由付きで記録されること."""
+    database_url, user_id = user_database
+    monkeypatch.setattr(config.settings, "LOG_SUCCESS_SAMPLE_RATE", 1.0)
+    app = app_factory(DATABASE_URL=database_url, LOG_SUCCESS_SAMPLE_RATE="1")
+    with TestClient(app) as client:
+        ok = client.post(
+            "/api/auth/login", json={"email": "log@example.com", "password": "TestPass123"}
+        )
+        client.post("/api/auth/login", json={"email": "log@example.com", "password": "Wrong123"})
+        client.post(
+            "/api/auth/login", json={"email": "nobody@example.com", "password": "Password123"}
+        )
+        token = ok.json()["access_token"]
+        client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+    lines = _log_lines(capsys)
+    auth = [(line["event"], line["user_id"], line["reason"])
+            for line in lines if line["logger"] == "app.auth"]
+    assert auth == [
+        ("login", user_id, None),
+        ("login", user_id, "invalid_password"),
+        ("login", None, "unknown_email"),
+    ]
+    access = [line for line in lines if line["logger"] == "app.access"]
+    assert [line["status"] for line in access] == [200, 401, 401, 200]
+    assert access[1]["auth_failure"] == "invalid_password"
+    assert access[3]["user_id"] == user_id
+
+
+def test_logging_pipeline_is_detached_after_shutdown(app_factory):
+    """Test: ライフスパン終了後にapp ロガーのハンドラーと伝播設定が元に戻ること."""
+    logger = logging.getLogger("app")
+    handlers = list(logger.handlers)
+    with TestClient(app_factory()):
+        assert logger.propagate is False
+    assert logger.handlers == handlers
+    assert logger.propagate is True
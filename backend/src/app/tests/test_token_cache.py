@@ -0,0 +1,84 @@
+"""Tests for the verified token cache."""
+import time
+
+import pytest
+from jose import ExpiredSignatureError, JWTError
+
+from app.utils.jwt import create_access_token, decode_token, get_codec
+from app.utils.token_cache import TokenCache, token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty global cache."""
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def test_decode_token_is_served_from_cache():
+    """Test: 同一トークンの2回目以降のデコードはキャッシュから返ること."""
+    token = create_access_token({"sub": "user-1"})
+
+    first = decode_token(token, expected_type="access")
+    second = decode_token(token, expected_type="access")
+
+    assert first == second
+    stats = token_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_cached_token_still_checks_type():
+    """Test: キャッシュヒット時もトークン種別が検証されること."""
+    token = create_access_token({"sub": "user-1"})
+    decode_token(token, expected_type="access")
+
+    with pytest.raises(JWTError):
+        decode_token(token, expected_type="refresh")
+
+
+def test_invalid_token_is_negatively_cached():
+    """Test: 無効トークンは短時間ネガティブキャッシュされること."""
+    for _ in range(3):
+        with pytest.raises(JWTError):
+            decode_token("invalid.token.here")
+
+    stats = token_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["negative_hits"] == 2
+
+
+def test_negative_cache_hit_keeps_error_class():
+    """Test: ネガティブキャッシュのヒット時も期限切れが ExpiredSignatureError になること."""
+    token = get_codec().encode({"sub": "user-1", "type": "access", "exp": int(time.time()) - 10})
+    for _ in range(2):
+        with pytest.raises(ExpiredSignatureError):
+            decode_token(token, expected_type="access")
+
+    assert token_cache.stats()["negative_hits"] == 1
+
+
+def test_entry_is_never_served_past_expiry():
+    """Test: exp を過ぎたエントリは返されないこと."""
+    cache = TokenCache(max_entries=10, negative_ttl=5)
+    key = cache.key("token")
+    cache.put_valid(key, {"sub": "user-1", "exp": time.time() - 1})
+
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test: 上限を超えると最も古いエントリが追い出されること."""
+    cache = TokenCache(max_entries=2, negative_ttl=5)
+    exp = time.time() + 60
+    keys = [cache.key(f"token-{i}") for i in range(3)]
+    cache.put_valid(keys[0], {"exp": exp})
+    cache.put_valid(keys[1], {"exp": exp})
+    cache.get(keys[0])
+    cache.put_valid(keys[2], {"exp": exp})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["evictions"] == 1
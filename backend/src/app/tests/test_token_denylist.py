@@ -0,0 +1,72 @@
+"""Tests for the token revocation denylist."""
+import time
+
+from app.utils.token_denylist import BloomFilter, TokenDenylist
+
+
+def test_revoked_tokens_are_denied_until_expiry(monkeypatch):
+    """Test: 失効したトークンは有効期限まで拒否され、その後自動で削除されること."""
+    denylist = TokenDenylist()
+    now = time.time()
+    denylist.add("jti-1", now + 10)
+    denylist.add("jti-2", now + 100)
+    denylist.add("already-expired", now - 1)
+
+    assert denylist.is_revoked("jti-1") is True
+    assert denylist.is_revoked("jti-2") is True
+    assert denylist.is_revoked("unknown") is False
+    assert denylist.stats()["size"] == 2
+
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+    assert denylist.is_revoked("jti-1") is False
+    assert denylist.purge() == 1
+    assert denylist.stats() == {"size": 1, "bloom_bits": 0, "purged": 1}
+
+
+def test_bloom_filter_front_has_no_false_negatives(monkeypatch):
+    """Test: Bloom フィルター併用時も失効済みトークンを見逃さないこと."""
+    denylist = TokenDenylist(bloom_bits=1 << 16)
+    now = time.time()
+    revoked = [f"revoked-{i}" for i in range(1000)]
+    for i, jti in enumerate(revoked):
+        denylist.add(jti, now + (10 if i % 2 else 100))
+
+    assert all(denylist.is_revoked(jti) for jti in revoked)
+    assert not any(denylist.is_revoked(f"other-{i}") for i in range(1000))
+
+    # Purging rebuilds the filter from the remaining entries
+    monkeypatch.setattr(time, "time", lambda: now + 50)
+    assert denylist.purge() == 500
+    assert all(denylist.is_revoked(jti) for jti in revoked[::2])
+
+
+def test_bloom_filter_is_rebuilt_only_when_mostly_stale(monkeypatch):
+    """Test: 期限切れが一定割合に達したときだけ Bloom フィルターが再構築されること."""
+    denylist = TokenDenylist(bloom_bits=1 << 12)
+    now = time.time()
+    for i in range(10):
+        denylist.add(f"jti-{i}", now + 10 * (i + 1))
+    original = denylist._bloom
+
+    # 3 of 10 expired: stale bits are kept and lookups stay correct
+    monkeypatch.setattr(time, "time", lambda: now + 35)
+    assert denylist.purge() == 3
+    assert denylist._bloom is original
+    assert denylist.is_revoked("jti-0") is False
+    assert all(denylist.is_revoked(f"jti-{i}") for i in range(3, 10))
+
+    # 5 of 10 expired: a complete new filter replaces the old one
+    monkeypatch.setattr(time, "time", lambda: now + 55)
+    assert denylist.purge() == 2
+    assert denylist._bloom is not original
+    assert all(f"jti-{i}" in denylist._bloom for i in range(5, 10))
+    assert all(denylist.is_revoked(f"jti-{i}") for i in range(5, 10))
+
+
+def test_bloom_filter_membership():
+    """Test: 追加した値は必ず含まれると判定されること."""
+    bloom = BloomFilter(1024)
+    bloom.add("a")
+
+    assert "a" in bloom
+    assert bloom.size_bits == 1024
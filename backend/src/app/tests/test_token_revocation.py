@@ -0,0 +1,24 @@
+"""Tests for the background token revocation maintenance."""
+import asyncio
+
+from app.services import token_revocation
+
+
+async def test_maintenance_survives_unreachable_database(caplog):
+    """Test: DBに接続できなくても同期ループが停止せず再試行を続けること."""
+    attempts = 0
+
+    def unreachable_session_factory():
+        nonlocal attempts
+        attempts += 1
+        raise ConnectionRefusedError(111, "Connect call failed")
+
+    task = asyncio.create_task(
+        token_revocation.run_token_maintenance(unreachable_session_factory, 0.01)
+    )
+    await asyncio.sleep(0.1)
+
+    assert not task.done()
+    task.cancel()
+    assert attempts >= 3
+    assert "Token revocation sync failed" in caplog.text
@@ -0,0 +1,63 @@
+"""Tests for the user identity cache."""
+import time
+import uuid
+
+import pytest
+
+from app.models.user import User
+from app.services.user_cache import UserIdentity, UserIdentityCache, user_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Start every test with an empty global cache."""
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+def test_identity_does_not_carry_password_hash(db_session):
+    """Test: キャッシュされるユーザー情報にパスワードハッシュが含まれないこと."""
+    user = User(email="cache@example.com", password="CachePass123")
+    db_session.add(user)
+    db_session.commit()
+
+    identity = UserIdentity.from_user(user)
+
+    assert identity.id == user.id
+    assert identity.email == "cache@example.com"
+    assert not hasattr(identity, "hashed_password")
+    assert not hasattr(identity, "__dict__")
+
+
+def test_user_update_and_delete_invalidate_cache(db_session):
+    """Test: ユーザーの更新・削除でキャッシュが無効化されること."""
+    user = User(email="cache@example.com", password="CachePass123")
+    db_session.add(user)
+    db_session.commit()
+
+    user_cache.put(UserIdentity.from_user(user))
+    user.email = "renamed@example.com"
+    db_session.commit()
+    assert user_cache.get(user.id) is None
+
+    user_cache.put(UserIdentity.from_user(user))
+    db_session.delete(user)
+    db_session.commit()
+    assert user_cache.get(user.id) is None
+    assert user_cache.stats()["invalidations"] == 2
+
+
+def test_expired_and_evicted_identities_are_not_served():
+    """Test: TTL切れ・上限超過のエントリが返されないこと."""
+    cache = UserIdentityCache(max_entries=1, ttl=0.01)
+    first = UserIdentity(id=uuid.uuid4(), email="a@example.com", updated_at=None)
+    second = UserIdentity(id=uuid.uuid4(), email="b@example.com", updated_at=None)
+
+    cache.put(first)
+    cache.put(second)
+    assert cache.get(first.id) is None
+    assert cache.stats()["evictions"] == 1
+
+    time.sleep(0.02)
+    assert cache.get(second.id) is None
@@ -84,3 +84,19 @@ def test_required_fields_validation(db_session):
     # Test password without letters - should raise ValueError
     with pytest.raises(ValueError, match="Password must be at least 8 characters"):
         user = User(email="test@example.com", password="12345678")
+
+
+def test_version_is_bumped_when_email_changes(db_session):
+    """Test: メールアドレス変更時にバージョンが増えること."""
+    user = User(email="version@example.com", password="Password123")
+    db_session.add(user)
+    db_session.commit()
+    assert user.version == 1
+
+    user.hashed_password = User._hash_password("Password456")
+    db_session.commit()
+    assert user.version == 1
+
+    user.email = "changed@example.com"
+    db_session.commit()
+    assert user.version == 2
@@ -0,0 +1,43 @@
+"""Tests for the lean user queries of the auth hot path."""
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, to_async_url
+from app.models.user import User
+from app.services.user_cache import UserIdentity
+from app.services.user_queries import load_credentials, load_identity
+
+
+async def test_projection_queries_return_rows_without_orm_instances(tmp_path):
+    """Test: 必要な列だけを読み込み、ORMインスタンスを作らずに返すこと."""
+    database_url = f"sqlite:///{tmp_path / 'users.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        user = User(email="lean@example.com", password="LeanPass123")
+        db.add(user)
+        db.commit()
+        user_id, hashed_password = user.id, user.hashed_password
+    engine.dispose()
+
+    async_engine = create_async_engine(to_async_url(database_url))
+    try:
+        async with async_sessionmaker(bind=async_engine)() as db:
+            identity = await load_identity(db, user_id)
+            credentials = await load_credentials(db, "lean@example.com")
+
+            assert isinstance(identity, UserIdentity)
+            assert (identity.id, identity.email, identity.version) == (
+                user_id, "lean@example.com", 1,
+            )
+            assert credentials.id == user_id
+            assert credentials.hashed_password == hashed_password
+            assert len(db.identity_map) == 0
+
+            assert await load_identity(db, uuid.uuid4()) is None
+            assert await load_credentials(db, "missing@example.com") is None
+    finally:
+        await async_engine.dispose()
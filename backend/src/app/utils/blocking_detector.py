@@ -0,0 +1,135 @@
+"""Detection of callbacks that block the event loop."""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, Optional, Tuple
+
+from app.utils.metrics import event_loop_blocked_seconds, event_loop_blocked_total
+
+logger = logging.getLogger(__name__)
+
+# Labels used when the blocked callback is not serving a request
+NO_ROUTE = ("-", "-")
+
+
+class BlockingCallDetector:
+    """Watchdog thread reporting event loop stalls with the offending stack.
+
+    Every ``interval`` seconds the watchdog schedules a no-op on the loop; if
+    it has not run after ``threshold`` seconds, whatever the loop thread is
+    executing is holding the loop. Its stack is captured from the watchdog
+    thread while the stall is still in progress and logged together with the
+    route of the request the current task serves (recorded by
+    ``BlockingCallMiddleware``). Each stall is reported once and its full
+    duration observed when the loop catches up.
+
+    The no-op also waits behind other ready callbacks, so a loop saturated by
+    many short callbacks is reported too; the stack then shows a bystander.
+    """
+
+    def __init__(self, threshold: float, interval: Optional[float] = None, stack_limit: int = 30):
+        """Initialize detector.
+
+        Args:
+            threshold: Seconds the loop may be held before a stall is reported
+            interval: Seconds between probes (defaults to a quarter of threshold)
+            stack_limit: Innermost frames included in the logged stack
+        """
+        self.threshold = threshold
+        self.interval = interval if interval is not None else threshold / 4
+        self.stack_limit = stack_limit
+        self.routes: Dict[asyncio.Task, Tuple[str, str]] = {}
+        self.detections = 0
+        self.last: Optional[Dict[str, Any]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start watching the running loop; must be called from the loop's thread."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="blocking-call-detector", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watchdog thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.threshold + self.interval + 1)
+            self._thread = None
+
+    def _watch(self) -> None:
+        """Watchdog thread body."""
+        while not self._stop.wait(self.interval):
+            ran = threading.Event()
+            posted = time.perf_counter()
+            try:
+                self._loop.call_soon_threadsafe(ran.set)
+            except RuntimeError:
+                return  # loop closed
+            if ran.wait(self.threshold):
+                continue
+
+            labels = self._report(time.perf_counter() - posted)
+            while not ran.wait(self.interval):
+                if self._stop.is_set():
+                    return
+            event_loop_blocked_seconds.observe(
+                time.perf_counter() - posted, method=labels[0], route=labels[1]
+            )
+
+    def _current_route(self) -> Tuple[str, str]:
+        """Method and route of the request the loop's current task is serving."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return NO_ROUTE
+        return self.routes.get(task, NO_ROUTE) if task is not None else NO_ROUTE
+
+    def _report(self, blocked: float) -> Tuple[str, str]:
+        """Log and count a stall that is still in progress.
+
+        Args:
+            blocked: Seconds the loop has been held so far
+
+        Returns:
+            Method and route labels of the stall
+        """
+        method, route = self._current_route()
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame, limit=self.stack_limit)) if frame else ""
+        del frame
+
+        self.detections += 1
+        self.last = {
+            "method": method,
+            "route": route,
+            "blocked_ms": round(blocked * 1000, 3),
+            "stack": stack,
+        }
+        event_loop_blocked_total.inc(method=method, route=route)
+        logger.warning(
+            "Event loop blocked for at least %.0f ms (%s %s)\n%s",
+            blocked * 1000, method, route, stack,
+        )
+        return method, route
+
+    def stats(self) -> Dict[str, Any]:
+        """Detection counters and the most recent stall (without its stack)."""
+        last = None
+        if self.last is not None:
+            last = {key: value for key, value in self.last.items() if key != "stack"}
+        return {
+            "running": self._thread is not None,
+            "threshold_ms": round(self.threshold * 1000, 3),
+            "detections": self.detections,
+            "last": last,
+        }
@@ -0,0 +1,92 @@
+"""Calibrate the bcrypt work factor for this machine.
+
+Usage:
+    python -m app.utils.calibrate_bcrypt --target-ms 250
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 20
+RECOMMENDED_MIN_ROUNDS = 10
+CALIBRATION_PASSWORD = b"CalibrationPass123"
+
+
+def measure_verify_ms(rounds: int, samples: int) -> float:
+    """Median bcrypt verification time at a work factor.
+
+    Args:
+        rounds: bcrypt work factor
+        samples: Number of timed verifications
+
+    Returns:
+        Median verification time in milliseconds
+    """
+    hashed = bcrypt.hashpw(CALIBRATION_PASSWORD, bcrypt.gensalt(rounds=rounds))
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.checkpw(CALIBRATION_PASSWORD, hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int = 3) -> Dict[int, float]:
+    """Measure verification time for increasing work factors.
+
+    Each extra round doubles the cost, so measuring stops at the first work
+    factor slower than the target.
+
+    Args:
+        target_ms: Target verification latency in milliseconds
+        samples: Timed verifications per work factor
+
+    Returns:
+        Median verification time in milliseconds by work factor
+    """
+    timings = {}
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        timings[rounds] = measure_verify_ms(rounds, samples)
+        if timings[rounds] > target_ms:
+            break
+    return timings
+
+
+def recommend_rounds(timings: Dict[int, float], target_ms: float) -> int:
+    """Highest work factor whose verification time fits the target."""
+    fitting = [rounds for rounds, elapsed in timings.items() if elapsed <= target_ms]
+    return max(fitting) if fitting else MIN_ROUNDS
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the calibration command."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.utils.calibrate_bcrypt",
+        description="Pick the highest bcrypt work factor fitting a target verify latency.",
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=250.0,
+        help="Target password verification latency in milliseconds (default: 250)",
+    )
+    parser.add_argument("--samples", type=int, default=3, help="Timed runs per work factor")
+    args = parser.parse_args(argv)
+
+    timings = calibrate(args.target_ms, args.samples)
+    for rounds, elapsed in timings.items():
+        print(f"rounds={rounds:<3} verify={elapsed:9.1f}ms")
+
+    recommended = recommend_rounds(timings, args.target_ms)
+    if recommended < RECOMMENDED_MIN_ROUNDS:
+        print(
+            f"Warning: only {recommended} rounds fit {args.target_ms:.0f}ms on this machine; "
+            f"fewer than {RECOMMENDED_MIN_ROUNDS} rounds is considered weak."
+        )
+    print(f"BCRYPT_ROUNDS={recommended}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Instrumented connection pools and pool statistics."""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolWaitStats:
+    """Cumulative checkout counters for a single pool."""
+
+    def __init__(self):
+        """Initialize counters."""
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool) -> None:
+        """Record one checkout attempt."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+
+class _WaitTimingMixin:
+    """Time every pool checkout, including time spent waiting for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.wait_stats.record(time.perf_counter() - start, timed_out)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """QueuePool that records checkout wait statistics."""
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait statistics."""
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Snapshot of a pool's occupancy and checkout wait statistics.
+
+    Args:
+        pool: Connection pool of an engine (``engine.pool``)
+
+    Returns:
+        Pool counters; occupancy fields are omitted for pools without a queue
+    """
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        })
+
+    wait_stats: Optional[PoolWaitStats] = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        status.update({
+            "checkouts": wait_stats.checkouts,
+            "checkout_timeouts": wait_stats.timeouts,
+            "checkout_wait_seconds_total": wait_stats.wait_seconds_total,
+            "checkout_wait_seconds_max": wait_stats.wait_seconds_max,
+        })
+
+    return status
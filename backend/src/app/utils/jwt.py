@@ -1,13 +1,210 @@
-"""JWT utility functions."""
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+"""JWT utility functions.
 
-from jose import JWTError, jwt
+Tokens are encoded and verified by a ``TokenCodec``. ``JoseCodec`` handles every
+algorithm through python-jose; ``FastHS256Codec`` produces byte-identical HS256
+tokens with a prepared HMAC key and a reusable JSON encoder. ``JWT_CODEC``
+selects the codec ("auto" uses the fast one whenever ALGORITHM is HS256).
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from jose import ExpiredSignatureError, JWTError, jwt
+from jose.exceptions import JWTClaimsError
 
 from app.config import settings
+from app.utils import jwt_keys
+from app.utils.jwt_keys import KeyRing
+from app.utils.metrics import jwt_decode_duration_seconds, jwt_encode_duration_seconds
+from app.utils.token_cache import token_cache
+from app.utils.token_denylist import token_denylist
+
+
+class TokenCodec(ABC):
+    """Encodes claims into signed tokens and verifies them back.
+
+    Subclasses must implement ``encode`` and ``decode``; an incomplete codec
+    cannot be instantiated.
+    """
+
+    name = ""
+
+    def __init__(self, key_ring: KeyRing):
+        """Initialize codec.
+
+        Args:
+            key_ring: Signing and verification keys
+        """
+        self.key_ring = key_ring
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims (``exp`` must already be an integer timestamp)."""
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verify signature and ``exp``, returning the claims.
+
+        Raises:
+            JWTError: If the token is malformed, has a bad signature or is expired
+        """
+
+
+class JoseCodec(TokenCodec):
+    """python-jose backed codec supporting every configured algorithm."""
+
+    name = "jose"
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims with the active key, adding its ``kid`` header if any."""
+        key_ring = self.key_ring
+        return jwt.encode(
+            claims, key_ring.signing_key, algorithm=key_ring.algorithm, headers=key_ring.headers
+        )
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verify token with the key named by its ``kid`` header."""
+        key_ring = self.key_ring
+        kid = jwt.get_unverified_header(token).get("kid") if key_ring.signing_kid else None
+        return jwt.decode(token, key_ring.verification_key(kid), algorithms=[key_ring.algorithm])
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Unpadded base64url encoding."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    """Decode unpadded base64url."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class FastHS256Codec(TokenCodec):
+    """HS256 codec without per-call key setup or generic JWS processing.
+
+    Output is byte-identical to python-jose: the header is encoded once, claims
+    use the same compact separators, and the HMAC key is prepared once and
+    copied per token.
+    """
+
+    name = "fast"
+    algorithm = "HS256"
+
+    def __init__(self, key_ring: KeyRing):
+        """Initialize codec.
+
+        Raises:
+            ValueError: If the key ring is not an HS256 key ring
+        """
+        if key_ring.algorithm != self.algorithm:
+            raise ValueError(f"Fast JWT codec only supports HS256, not {key_ring.algorithm}")
+        super().__init__(key_ring)
+        header = json.dumps(
+            {"alg": self.algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+        )
+        self._header_segment = _b64encode(header.encode("utf-8"))
+        self._json_encoder = json.JSONEncoder(separators=(",", ":"))
+        self._mac = hmac.new(key_ring.signing_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """HMAC-SHA256 of signing_input using the prepared key."""
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims."""
+        payload = self._json_encoder.encode(claims).encode("utf-8")
+        signing_input = self._header_segment + b"." + _b64encode(payload)
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verify signature and ``exp``/``nbf``, returning the claims."""
+        data = token.encode("utf-8")
+        try:
+            signing_input, signature_segment = data.rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+        except ValueError:
+            raise JWTError("Not enough segments")
+
+        try:
+            if header_segment != self._header_segment:
+                header = json.loads(_b64decode(header_segment))
+                if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+                    raise JWTError("The specified alg value is not allowed")
+            signature = _b64decode(signature_segment)
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid token encoding")
 
+        if not hmac.compare_digest(self._sign(signing_input), signature):
+            raise JWTError("Signature verification failed.")
 
-def create_access_token(data: Dict[str, str]) -> str:
+        try:
+            claims = json.loads(_b64decode(payload_segment))
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid payload string")
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+
+        now = int(time.time())
+        if "exp" in claims:
+            exp = claims["exp"]
+            if not isinstance(exp, int):
+                raise JWTClaimsError("Expiration Time claim (exp) must be an integer.")
+            if exp < now:
+                raise ExpiredSignatureError("Signature has expired.")
+        if "nbf" in claims:
+            nbf = claims["nbf"]
+            if not isinstance(nbf, int):
+                raise JWTClaimsError("Not Before claim (nbf) must be an integer.")
+            if nbf > now:
+                raise JWTClaimsError("The token is not yet valid (nbf)")
+        return claims
+
+
+CODECS = {codec.name: codec for codec in (JoseCodec, FastHS256Codec)}
+
+
+def build_codec(key_ring: KeyRing, name: str = "auto") -> TokenCodec:
+    """Create the codec for a key ring.
+
+    Args:
+        key_ring: Signing and verification keys
+        name: "jose", "fast", or "auto" (fast for HS256, jose otherwise)
+
+    Returns:
+        Token codec
+
+    Raises:
+        ValueError: If the codec name is unknown or unsupported for the algorithm
+    """
+    if name == "auto":
+        name = "fast" if key_ring.algorithm == FastHS256Codec.algorithm else "jose"
+    codec_class = CODECS.get(name)
+    if codec_class is None:
+        raise ValueError(f"Unsupported JWT codec: {name}")
+    return codec_class(key_ring)
+
+
+_codec: Optional[TokenCodec] = None
+
+
+def get_codec() -> TokenCodec:
+    """Codec for the current key ring, rebuilt when the key ring is replaced."""
+    global _codec
+    key_ring = jwt_keys.key_ring
+    if _codec is None or _codec.key_ring is not key_ring:
+        _codec = build_codec(key_ring, settings.JWT_CODEC)
+    return _codec
+
+
+def create_access_token(data: Dict[str, Any]) -> str:
     """Create JWT access token with 30 minute expiration.
 
     Args:
@@ -17,33 +214,42 @@ def create_access_token(data: Dict[str, str]) -> str:
         Encoded JWT access token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     to_encode.update({"exp": expire, "type": "access"})
+    to_encode.setdefault("jti", secrets.token_urlsafe(16))
 
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    with jwt_encode_duration_seconds.time(type="access"):
+        encoded_jwt = get_codec().encode(to_encode)
     return encoded_jwt
 
 
-def create_refresh_token(data: Dict[str, str]) -> str:
+def create_refresh_token(data: Dict[str, Any], expires_at: Optional[int] = None) -> str:
     """Create JWT refresh token with 7 day expiration.
 
     Args:
         data: Data to encode in the token (e.g., {"sub": user_id})
+        expires_at: Expiry as a Unix timestamp (defaults to REFRESH_TOKEN_EXPIRE_DAYS from now)
 
     Returns:
         Encoded JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = expires_at or int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.setdefault("jti", secrets.token_urlsafe(16))
 
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    with jwt_encode_duration_seconds.time(type="refresh"):
+        encoded_jwt = get_codec().encode(to_encode)
     return encoded_jwt
 
 
 def decode_token(token: str, expected_type: Optional[str] = None) -> Dict[str, str]:
     """Decode and validate JWT token.
 
+    Verification results are cached by token digest (see ``app.utils.token_cache``),
+    so repeated calls with the same token skip signature verification until it expires.
+    Tokens whose ``jti`` is on the revocation denylist are rejected.
+
     Args:
         token: JWT token to decode
         expected_type: Expected token type ("access" or "refresh"), optional
@@ -55,7 +261,11 @@ def decode_token(token: str, expected_type: Optional[str] = None) -> Dict[str, s
         JWTError: If token is invalid, expired, or type mismatch
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _verify_token(token)
+
+        jti = payload.get("jti")
+        if jti is not None and token_denylist.is_revoked(jti):
+            raise JWTError("Token has been revoked")
 
         # Verify token type if specified
         if expected_type is not None:
@@ -66,4 +276,38 @@ def decode_token(token: str, expected_type: Optional[str] = None) -> Dict[str, s
         return payload
 
     except JWTError as e:
-        raise JWTError(f"Token validation failed: {str(e)}")
+        # Keep the class (e.g. ExpiredSignatureError) so callers can tell failures apart
+        raise type(e)(f"Token validation failed: {str(e)}")
+
+
+def _verify_token(token: str) -> Dict[str, str]:
+    """Verify token signature and expiry, consulting the verified token cache.
+
+    Raises:
+        JWTError: If token is invalid or expired
+    """
+    start = time.perf_counter()
+    if not token_cache.enabled:
+        try:
+            return get_codec().decode(token)
+        finally:
+            jwt_decode_duration_seconds.observe(time.perf_counter() - start, cache="disabled")
+
+    key = token_cache.key(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        jwt_decode_duration_seconds.observe(time.perf_counter() - start, cache="hit")
+        if cached.payload is None:
+            raise (cached.error_type or JWTError)(cached.error)
+        return dict(cached.payload)
+
+    try:
+        payload = get_codec().decode(token)
+    except JWTError as e:
+        token_cache.put_invalid(key, e)
+        raise
+    finally:
+        jwt_decode_duration_seconds.observe(time.perf_counter() - start, cache="miss")
+
+    token_cache.put_valid(key, payload)
+    return dict(payload)
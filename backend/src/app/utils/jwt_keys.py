@@ -0,0 +1,197 @@
+"""JWT signing and verification keys.
+
+HS* algorithms sign with ``SECRET_KEY`` as before. Asymmetric algorithms
+(ES256, RS256, ...) load every ``<kid>.pem`` file in ``JWT_KEYS_DIR``: the key
+named by ``JWT_ACTIVE_KID`` signs new tokens, and all keys verify. Public keys
+are published as a JWKS so other services can verify tokens locally.
+
+Rotating keys:
+    1. python -m app.utils.jwt_keys generate --dir <JWT_KEYS_DIR> --kid <new-kid>
+    2. Deploy, then switch JWT_ACTIVE_KID to the new kid
+    3. Remove the old key file once all tokens it signed have expired
+"""
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from jose import JWTError, jwk
+from jose.backends.base import Key
+
+from app.config import settings
+
+# Key generators for asymmetric algorithms
+EC_CURVES = {"ES256": "SECP256R1", "ES384": "SECP384R1", "ES512": "SECP521R1"}
+RSA_KEY_SIZE = 2048
+
+
+def is_asymmetric(algorithm: str) -> bool:
+    """Whether algorithm signs with a private key (anything but HS*)."""
+    return not algorithm.startswith("HS")
+
+
+class KeyRing:
+    """Signing key plus every key accepted for verification, indexed by kid."""
+
+    def __init__(
+        self,
+        algorithm: str,
+        signing_key: Any,
+        signing_kid: Optional[str] = None,
+        verification_keys: Optional[Dict[Optional[str], Any]] = None,
+    ):
+        """Initialize key ring.
+
+        Args:
+            algorithm: JWT algorithm (e.g. "HS256", "ES256")
+            signing_key: Secret or private key used to sign new tokens
+            signing_kid: Key ID written to the token header (None for HS*)
+            verification_keys: Keys accepted for verification by kid
+        """
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.signing_kid = signing_kid
+        self.verification_keys = verification_keys or {signing_kid: signing_key}
+        self._jwks_body = json.dumps(self._build_jwks(), separators=(",", ":")).encode()
+        self.jwks_etag = '"' + hashlib.sha256(self._jwks_body).hexdigest()[:32] + '"'
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str) -> "KeyRing":
+        """Key ring for a shared HMAC secret; publishes no keys."""
+        return cls(algorithm, secret)
+
+    @classmethod
+    def from_directory(cls, keys_dir: str, active_kid: str, algorithm: str) -> "KeyRing":
+        """Load ``<kid>.pem`` keys from a directory.
+
+        Args:
+            keys_dir: Directory holding PEM encoded private or public keys
+            active_kid: Kid of the private key used for signing
+            algorithm: Asymmetric JWT algorithm
+
+        Returns:
+            KeyRing signing with active_kid and verifying with every key
+
+        Raises:
+            ValueError: If the directory has no keys or the active key is
+                missing or not a private key
+        """
+        keys: Dict[Optional[str], Key] = {}
+        for path in sorted(Path(keys_dir).glob("*.pem")):
+            keys[path.stem] = jwk.construct(path.read_bytes(), algorithm)
+        if not keys:
+            raise ValueError(f"No *.pem keys found in {keys_dir}")
+
+        signing_key = keys.get(active_kid)
+        if signing_key is None:
+            raise ValueError(f"Active JWT key {active_kid!r} not found in {keys_dir}")
+        if signing_key.is_public():
+            raise ValueError(f"Active JWT key {active_kid!r} is not a private key")
+
+        verification_keys = {
+            kid: key if key.is_public() else key.public_key() for kid, key in keys.items()
+        }
+        return cls(algorithm, signing_key, active_kid, verification_keys)
+
+    @property
+    def headers(self) -> Optional[Dict[str, str]]:
+        """Extra JWT headers for new tokens."""
+        return {"kid": self.signing_kid} if self.signing_kid else None
+
+    def verification_key(self, kid: Optional[str]) -> Any:
+        """Look up the key for a token's ``kid`` header.
+
+        Raises:
+            JWTError: If no key with that kid is known
+        """
+        if not is_asymmetric(self.algorithm):
+            return self.signing_key
+        key = self.verification_keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown signing key: {kid}")
+        return key
+
+    def _build_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """JWK set of the public verification keys."""
+        if not is_asymmetric(self.algorithm):
+            return {"keys": []}
+        keys = []
+        for kid, key in self.verification_keys.items():
+            jwk_dict = key.to_dict()
+            jwk_dict.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+            keys.append(jwk_dict)
+        return {"keys": keys}
+
+    @property
+    def jwks_body(self) -> bytes:
+        """Pre-serialized JWKS document."""
+        return self._jwks_body
+
+
+def load_key_ring() -> KeyRing:
+    """Build the key ring from settings.
+
+    Raises:
+        ValueError: If an asymmetric algorithm is configured without keys
+    """
+    if not is_asymmetric(settings.ALGORITHM):
+        return KeyRing.from_secret(settings.SECRET_KEY, settings.ALGORITHM)
+    if not settings.JWT_KEYS_DIR or not settings.JWT_ACTIVE_KID:
+        raise ValueError(
+            f"{settings.ALGORITHM} requires JWT_KEYS_DIR and JWT_ACTIVE_KID to be set"
+        )
+    return KeyRing.from_directory(
+        settings.JWT_KEYS_DIR, settings.JWT_ACTIVE_KID, settings.ALGORITHM
+    )
+
+
+def generate_private_key_pem(algorithm: str) -> bytes:
+    """Generate a PEM encoded private key suitable for algorithm.
+
+    Raises:
+        ValueError: If algorithm is not an EC or RSA algorithm
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+    if algorithm in EC_CURVES:
+        private_key = ec.generate_private_key(getattr(ec, EC_CURVES[algorithm])())
+    elif algorithm.startswith(("RS", "PS")):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=RSA_KEY_SIZE)
+    else:
+        raise ValueError(f"Cannot generate keys for algorithm: {algorithm}")
+
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for key management."""
+    parser = argparse.ArgumentParser(prog="python -m app.utils.jwt_keys")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    generate = subcommands.add_parser("generate", help="Generate a new signing key")
+    generate.add_argument("--dir", required=True, help="Key directory (JWT_KEYS_DIR)")
+    generate.add_argument("--kid", required=True, help="Key ID, used as the file name")
+    generate.add_argument("--algorithm", default="ES256", help="JWT algorithm (default: ES256)")
+    args = parser.parse_args(argv)
+
+    path = Path(args.dir) / f"{args.kid}.pem"
+    if path.exists():
+        print(f"Error: {path} already exists")
+        raise SystemExit(1)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(generate_private_key_pem(args.algorithm))
+    path.chmod(0o600)
+    print(f"Wrote {args.algorithm} key {args.kid} to {path}")
+
+
+key_ring = load_key_ring()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Continuous event loop lag measurement."""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from app.utils.metrics import event_loop_lag_seconds
+
+
+class EventLoopLagMonitor:
+    """Measure how late the event loop wakes up from a fixed sleep.
+
+    A task sleeps ``interval`` seconds in a loop; any extra time before it
+    resumes is time the loop spent on other work without yielding (blocking
+    calls, CPU-heavy handlers). The largest lag of the recent samples is
+    reported so a single stall stays visible for ``window`` samples.
+    """
+
+    def __init__(self, interval: float, window: int = 10):
+        """Initialize monitor.
+
+        Args:
+            interval: Seconds between samples (0 disables the monitor)
+            window: Number of recent samples to keep
+        """
+        self.interval = interval
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the monitor samples at all."""
+        return self.interval > 0
+
+    @property
+    def lag_seconds(self) -> float:
+        """Largest lag among the recent samples."""
+        return max(self._samples, default=0.0)
+
+    async def run(self) -> None:
+        """Sample the loop lag until cancelled."""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self._samples.append(lag)
+            event_loop_lag_seconds.set(lag)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the recent samples."""
+        return {
+            "interval_seconds": self.interval,
+            "lag_seconds": round(self.lag_seconds, 6),
+            "samples": len(self._samples),
+        }
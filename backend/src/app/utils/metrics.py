@@ -0,0 +1,358 @@
+"""Minimal in-process metrics registry with Prometheus text exposition."""
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Render a label set, e.g. {method="GET",route="/health"}."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """Base class for labelled metrics."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Label values in declaration order."""
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> Iterable[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """Yield (suffix, label names, label values, value) tuples."""
+
+    def render(self) -> List[str]:
+        """Render HELP/TYPE lines and samples."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, names, values, value in self._samples():
+            labels = _format_labels(names, values)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase counter by amount."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", self.labelnames, key, value
+
+
+class CollectedCounter(Counter):
+    """Counter mirroring a cumulative count that is kept elsewhere.
+
+    A collector copies the source's current total in with ``set`` right
+    before rendering (e.g. cache statistics). The source only grows, except
+    that it starts again from zero in a new worker, which Prometheus treats
+    as a counter reset.
+    """
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set counter to the source's current total."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase gauge by amount."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease gauge by amount."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set gauge to value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", self.labelnames, key, value
+
+
+class Histogram(_Metric):
+    """Cumulative histogram of observed values."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def time(self, **labels: str) -> "_Timer":
+        """Context manager observing the elapsed time of its block."""
+        return _Timer(self, labels)
+
+    def count(self, **labels: str) -> float:
+        """Number of observations for a label set."""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0.0
+
+    def _samples(self):
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        bucket_names = self.labelnames + ("le",)
+        for key, state in items:
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets, state):
+                cumulative += bucket_count
+                yield "_bucket", bucket_names, key + (_format_value(bound),), cumulative
+            yield "_bucket", bucket_names, key + ("+Inf",), state[-1]
+            yield "_sum", self.labelnames, key, state[-2]
+            yield "_count", self.labelnames, key, state[-1]
+
+
+class _Timer:
+    """Context manager feeding elapsed seconds into a histogram."""
+
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def collected_counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> CollectedCounter:
+        """Create and register a counter filled in by a collector."""
+        return self._register(CollectedCounter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges and collected counters before rendering."""
+        self._collectors.append(collector)
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        for collector in self._collectors:
+            collector()
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# HTTP
+http_requests_total = registry.counter(
+    "http_requests_total", "Total HTTP requests by route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method", "route"),
+)
+
+# Auth flow
+password_hash_duration_seconds = registry.histogram(
+    "password_hash_duration_seconds", "bcrypt hash/verify time on the hashing executor.",
+    ("operation",),
+)
+password_hash_queue_wait_seconds = registry.histogram(
+    "password_hash_queue_wait_seconds", "Time spent waiting for a password hashing slot.",
+)
+password_hash_rejections_total = registry.counter(
+    "password_hash_rejections_total",
+    "Password hashing requests rejected because the executor was saturated.",
+)
+login_throttled_total = registry.counter(
+    "login_throttled_total", "Login attempts rejected by the rate limiter before bcrypt.",
+    ("scope",),
+)
+jwt_encode_duration_seconds = registry.histogram(
+    "jwt_encode_duration_seconds", "JWT encode time by token type.", ("type",), FAST_BUCKETS,
+)
+jwt_decode_duration_seconds = registry.histogram(
+    "jwt_decode_duration_seconds", "JWT verification time, split by token cache outcome.",
+    ("cache",), FAST_BUCKETS,
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "Database statement execution time by operation.",
+    ("operation",),
+)
+event_loop_lag_seconds = registry.gauge(
+    "event_loop_lag_seconds", "Most recent event loop wake-up delay.",
+)
+event_loop_blocked_total = registry.counter(
+    "event_loop_blocked_total", "Event loop stalls detected by the blocking call detector.",
+    ("method", "route"),
+)
+event_loop_blocked_seconds = registry.histogram(
+    "event_loop_blocked_seconds", "Duration of detected event loop stalls.", ("method", "route"),
+)
+log_records_dropped_total = registry.counter(
+    "log_records_dropped_total", "Log records dropped because the log queue was full.",
+)
+db_replica_ejections_total = registry.counter(
+    "db_replica_ejections_total", "Read replicas taken out of rotation after a failure.",
+    ("replica",),
+)
+
+_DB_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+
+def _statement_operation(statement: str) -> str:
+    """Bounded label for a SQL statement (its leading keyword)."""
+    keyword = statement.lstrip()[:6].upper()
+    return keyword if keyword in _DB_OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record execution time of every statement run through engine.
+
+    Args:
+        engine: Sync engine (use ``async_engine.sync_engine`` for async engines)
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start_time = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start: Optional[float] = getattr(context, "_query_start_time", None)
+        if start is not None:
+            db_query_duration_seconds.observe(
+                time.perf_counter() - start, operation=_statement_operation(statement)
+            )
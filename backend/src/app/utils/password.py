@@ -0,0 +1,203 @@
+"""Password hashing utilities and the bounded hashing executor."""
+import asyncio
+import multiprocessing
+import re
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, TypeVar
+
+import bcrypt
+
+from app.config import settings
+from app.utils.metrics import (
+    password_hash_duration_seconds,
+    password_hash_queue_wait_seconds,
+    password_hash_rejections_total,
+)
+
+T = TypeVar("T")
+
+BCRYPT_COST_PATTERN = re.compile(r"^\$2[aby]\$(\d{2})\$")
+
+
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
+    """Hash password using bcrypt.
+
+    Args:
+        password: Plain text password
+        rounds: bcrypt work factor (defaults to settings.BCRYPT_ROUNDS)
+
+    Returns:
+        Hashed password as a string
+    """
+    password_bytes = password.encode('utf-8')
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(password_bytes, salt)
+    return hashed.decode('utf-8')
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    """Verify plain text password against a bcrypt hash.
+
+    Args:
+        password: Plain text password to verify
+        hashed_password: Stored bcrypt hash
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    password_bytes = password.encode('utf-8')
+    hashed_bytes = hashed_password.encode('utf-8')
+    return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Extract the work factor from a bcrypt hash.
+
+    Args:
+        hashed_password: bcrypt hash, e.g. "$2b$12$..."
+
+    Returns:
+        Work factor, or None if the hash is not a bcrypt hash
+    """
+    match = BCRYPT_COST_PATTERN.match(hashed_password)
+    return int(match.group(1)) if match else None
+
+
+def needs_rehash(hashed_password: str, rounds: Optional[int] = None) -> bool:
+    """Check whether a stored hash uses a different work factor than configured.
+
+    Args:
+        hashed_password: Stored bcrypt hash
+        rounds: Target work factor (defaults to settings.BCRYPT_ROUNDS)
+
+    Returns:
+        True if the password should be rehashed
+    """
+    return hash_rounds(hashed_password) != (rounds or settings.BCRYPT_ROUNDS)
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when no hashing slot became free within the queue timeout."""
+
+
+class PasswordHasher:
+    """Run bcrypt work off the event loop with a bounded number of in-flight jobs.
+
+    Jobs run on a thread pool (bcrypt releases the GIL) or, in "process" mode, on a
+    process pool so hashing never competes with the event loop for the GIL. Callers
+    wait at most ``queue_timeout`` seconds for a free slot before
+    ``PasswordHasherBusyError`` is raised, which the API turns into a 503.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int = 1,
+        max_concurrency: int = 1,
+        queue_timeout: Optional[float] = 1.0,
+    ):
+        """Initialize hasher.
+
+        Args:
+            mode: "thread" or "process"
+            max_workers: Number of executor workers
+            max_concurrency: Maximum number of jobs submitted to the executor at once
+            queue_timeout: Seconds to wait for a free slot before giving up
+                (None waits indefinitely)
+
+        Raises:
+            ValueError: If mode is not supported
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported password hasher mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[Executor] = None
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_executor(self) -> Executor:
+        """Create the executor on first use."""
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, operation: str, func: Callable[..., T], *args) -> T:
+        """Run func on the executor once a concurrency slot is available.
+
+        Args:
+            operation: Metrics label for the work ("hash" or "verify")
+            func: Picklable function to run
+            *args: Arguments for func
+
+        Raises:
+            PasswordHasherBusyError: If no slot became free within queue_timeout
+        """
+        semaphore = self._get_semaphore()
+        wait_start = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except TimeoutError:
+            password_hash_rejections_total.inc()
+            raise PasswordHasherBusyError("Password hashing capacity exhausted")
+        password_hash_queue_wait_seconds.observe(time.perf_counter() - wait_start)
+
+        try:
+            loop = asyncio.get_running_loop()
+            with password_hash_duration_seconds.time(operation=operation):
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        """Hash password on the executor."""
+        return await self._run("hash", hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify password on the executor."""
+        return await self._run("verify", check_password, password, hashed_password)
+
+    def hash_blocking(self, password: str) -> str:
+        """Hash password on the executor from synchronous code (e.g. scripts)."""
+        return self._get_executor().submit(hash_password, password).result()
+
+    def hash_many_blocking(self, passwords: List[str]) -> List[str]:
+        """Hash a batch of passwords in parallel across the executor's workers."""
+        chunksize = max(1, len(passwords) // (self.max_workers * 4))
+        return list(self._get_executor().map(hash_password, passwords, chunksize=chunksize))
+
+    def shutdown(self) -> None:
+        """Shut down the executor; it is recreated on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    mode=settings.PASSWORD_HASHER_MODE,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_concurrency=settings.PASSWORD_HASHER_MAX_CONCURRENCY,
+    queue_timeout=settings.PASSWORD_HASHER_QUEUE_TIMEOUT,
+)
@@ -0,0 +1,104 @@
+"""Bounded on-disk storage for per-request profiles."""
+import cProfile
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROFILE_SUFFIX = ".prof"
+
+# Where the stored captures are served (only while profiling is enabled)
+PROFILES_PATH = "/internal/profiles"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9]+")
+
+
+def profile_name(timestamp: float, method: str, route: str, request_id: str) -> str:
+    """File name of a capture, sortable by time and readable at a glance.
+
+    Args:
+        timestamp: Request start (seconds since the epoch)
+        method: HTTP method
+        route: Route template of the request
+        request_id: Short unique suffix
+
+    Returns:
+        Name like "20261017T101500123-POST-api-auth-login-1a2b3c4d.prof"
+    """
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(timestamp))
+    stamp += f"{int(timestamp * 1000) % 1000:03d}"
+    slug = _UNSAFE_CHARS.sub("-", route).strip("-") or "root"
+    return f"{stamp}-{method}-{slug}-{request_id}{PROFILE_SUFFIX}"
+
+
+class ProfileStore:
+    """Directory of cProfile captures keeping only the most recent ones.
+
+    Files are written in the marshal format of ``pstats``, readable with
+    ``python -m pstats``, snakeviz or gprof2dot.
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        """Initialize store.
+
+        Args:
+            directory: Where captures are written (created on first save)
+            max_files: Number of captures kept; older ones are deleted
+        """
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def save(self, profiler: cProfile.Profile, name: str) -> Path:
+        """Write a capture and prune the oldest ones beyond max_files.
+
+        Blocking file I/O: call it from a worker thread.
+
+        Args:
+            profiler: Disabled profiler holding the capture
+            name: File name from profile_name
+
+        Returns:
+            Path of the written file
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / name
+        tmp_path = path.with_suffix(".tmp")
+        profiler.dump_stats(tmp_path)
+        os.replace(tmp_path, path)
+
+        for stale in self._files()[self.max_files:]:
+            stale.unlink(missing_ok=True)
+        return path
+
+    def _files(self) -> List[Path]:
+        """Captures, newest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"), reverse=True)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Metadata of the stored captures, newest first."""
+        captures = []
+        for path in self._files():
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                continue  # pruned concurrently
+            captures.append({"name": path.name, "size_bytes": size})
+        return captures
+
+    def path(self, name: str) -> Optional[Path]:
+        """Path of a stored capture.
+
+        Args:
+            name: File name as returned by list
+
+        Returns:
+            Path, or None if no such capture exists (names that are not plain
+            capture file names are never resolved)
+        """
+        if Path(name).name != name or not name.endswith(PROFILE_SUFFIX):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
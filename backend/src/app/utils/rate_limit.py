@@ -0,0 +1,130 @@
+"""In-process token bucket rate limiting."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from app.config import settings
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets with a bounded number of tracked keys.
+
+    Each key may spend ``burst`` requests at once and regains ``rate`` requests
+    per second. Buckets are kept in least recently used order, so buckets that
+    have refilled completely (and carry no state) collect at the front and are
+    dropped from there whenever a new key is added; beyond ``max_keys`` the
+    least recently used bucket is evicted even if it is not full yet.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_keys: int):
+        """Initialize limiter.
+
+        Args:
+            name: Label used in stats and metrics (e.g. "ip", "email")
+            rate: Requests regained per second (0 disables the limiter)
+            burst: Bucket capacity
+            max_keys: Maximum number of tracked keys
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # key -> [tokens, last refill time]
+        self._buckets: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests are limited at all."""
+        return self.rate > 0 and self.burst > 0
+
+    def hit(self, key: str) -> float:
+        """Consume one request for key.
+
+        Args:
+            key: Client key (e.g. IP address or normalized email)
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until it would be
+        """
+        if not self.enabled:
+            return 0.0
+
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._drop_refilled(now)
+                bucket = [float(self.burst), now]
+                self._buckets[key] = bucket
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+                    self.evictions += 1
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                self.allowed += 1
+                return 0.0
+
+            self.limited += 1
+            return (1 - bucket[0]) / self.rate
+
+    def _drop_refilled(self, now: float) -> int:
+        """Drop full buckets from the least recently used end (lock held)."""
+        dropped = 0
+        buckets = self._buckets
+        while buckets:
+            tokens, updated = next(iter(buckets.values()))
+            if tokens + (now - updated) * self.rate < self.burst:
+                break
+            buckets.popitem(last=False)
+            dropped += 1
+        return dropped
+
+    def purge(self) -> int:
+        """Drop buckets that have refilled completely.
+
+        Returns:
+            Number of dropped buckets
+        """
+        with self._lock:
+            return self._drop_refilled(time.monotonic())
+
+    def clear(self) -> None:
+        """Drop all buckets and reset counters."""
+        with self._lock:
+            self._buckets.clear()
+            self.allowed = self.limited = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of limiter counters."""
+        with self._lock:
+            return {
+                "size": len(self._buckets),
+                "max_keys": self.max_keys,
+                "allowed": self.allowed,
+                "limited": self.limited,
+                "evictions": self.evictions,
+            }
+
+
+login_ip_limiter = TokenBucketLimiter(
+    "ip",
+    rate=settings.LOGIN_IP_RATE_PER_MINUTE / 60,
+    burst=settings.LOGIN_IP_BURST,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+)
+login_email_limiter = TokenBucketLimiter(
+    "email",
+    rate=settings.LOGIN_EMAIL_RATE_PER_MINUTE / 60,
+    burst=settings.LOGIN_EMAIL_BURST,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+)
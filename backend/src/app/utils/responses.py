@@ -0,0 +1,35 @@
+"""Pre-serialized JSON responses for the hot auth endpoints.
+
+Routes keep their ``response_model`` for the OpenAPI schema but return these
+responses directly, so FastAPI skips re-validating and re-encoding values that
+are already typed; the body is serialized once by orjson.
+"""
+from typing import Optional, Sequence
+from uuid import UUID
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Row
+
+
+def token_response(access_token: str, refresh_token: str) -> ORJSONResponse:
+    """Response matching ``TokenResponse``."""
+    return ORJSONResponse({
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    })
+
+
+def user_response(user_id: UUID, email: str) -> ORJSONResponse:
+    """Response matching ``UserResponse``."""
+    return ORJSONResponse({"id": user_id, "email": email})
+
+
+def post_page_response(rows: Sequence[Row], next_cursor: Optional[str]) -> ORJSONResponse:
+    """Response matching ``PostPage``."""
+    return ORJSONResponse({
+        "items": [
+            {"id": row.id, "content": row.content, "created_at": row.created_at} for row in rows
+        ],
+        "next_cursor": next_cursor,
+    })
@@ -1,10 +1,29 @@
-"""Seed data script for initial user creation."""
+"""Seed data script for initial user creation and bulk user import."""
+import argparse
+import csv
+import json
+import os
+import re
 import sys
-from typing import Optional
+import time
+import uuid
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from app.database import SessionLocal, engine, Base
+from app.database import Base, Database
 from app.models.user import User
+from app.utils.password import PasswordHasher, password_hasher
+
+BCRYPT_HASH_PATTERN = re.compile(r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$")
+
+# PostgreSQL accepts at most 65535 bind parameters per statement and every
+# row of a multi-row INSERT binds one per column
+MAX_BATCH_SIZE = 65535 // len(User.__table__.columns)
 
 
 def create_seed_user(db: Session, seed_email: Optional[str] = None, seed_password: Optional[str] = None) -> None:
@@ -36,11 +55,12 @@ def create_seed_user(db: Session, seed_email: Optional[str] = None, seed_passwor
         print(f"User with email {seed_email} already exists. Skipping seed.")
         return
 
-    # Create new user
+    # Create new user, hashing on the password hasher executor
     try:
-        user = User(
+        User.validate_password(seed_password)
+        user = User.from_hashed_password(
             email=seed_email,
-            password=seed_password
+            hashed_password=password_hasher.hash_blocking(seed_password)
         )
         db.add(user)
         db.commit()
@@ -52,15 +72,240 @@ def create_seed_user(db: Session, seed_email: Optional[str] = None, seed_passwor
         raise
 
 
-def main() -> None:
+class BulkImportStats:
+    """Counters reported while importing users."""
+
+    def __init__(self):
+        """Initialize counters."""
+        self.read = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.started_at = time.perf_counter()
+
+    @property
+    def rows_per_second(self) -> float:
+        """Average import rate so far."""
+        elapsed = time.perf_counter() - self.started_at
+        return self.read / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Human readable progress line."""
+        return (
+            f"read={self.read} inserted={self.inserted} duplicates={self.duplicates} "
+            f"invalid={self.invalid} ({self.rows_per_second:.0f} rows/s)"
+        )
+
+
+def read_user_records(path: Path, file_format: Optional[str] = None) -> Iterator[Any]:
+    """Stream user records from a CSV or JSON Lines file.
+
+    Each record needs an ``email`` and either a ``password`` or a bcrypt
+    ``hashed_password``. The file is read lazily, one row at a time.
+
+    Args:
+        path: Input file
+        file_format: "csv" or "jsonl"; inferred from the file extension if omitted
+
+    Yields:
+        Records as dictionaries; a JSONL line yields its decoded value as is
+        (the import rejects anything but an object) or None if it is not JSON
+    """
+    file_format = file_format or ("jsonl" if path.suffix in (".jsonl", ".ndjson") else "csv")
+    with path.open(newline="", encoding="utf-8") as file:
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        yield None
+
+
+def _prepare_batch(
+    records: List[Any],
+    hasher: Optional[PasswordHasher],
+    stats: BulkImportStats,
+) -> List[Dict[str, object]]:
+    """Validate records and hash plain text passwords in parallel.
+
+    Invalid records (including JSONL lines that are not objects) are counted
+    and dropped.
+    """
+    valid = []
+    to_hash = []
+    for record in records:
+        if not isinstance(record, dict):
+            stats.invalid += 1
+            continue
+        try:
+            # Values of the wrong type fail here with AttributeError/TypeError
+            email = (record.get("email") or "").strip()
+            hashed_password = (record.get("hashed_password") or "").strip()
+            password = record.get("password")
+            User.validate_email(email)
+            if hashed_password:
+                if not BCRYPT_HASH_PATTERN.match(hashed_password):
+                    raise ValueError("Invalid bcrypt hash")
+            elif hasher is None:
+                raise ValueError("Plain text passwords require hashing")
+            else:
+                User.validate_password(password)
+                to_hash.append(len(valid))
+        except (AttributeError, TypeError, ValueError):
+            stats.invalid += 1
+            continue
+        valid.append({"email": email, "hashed_password": hashed_password or password})
+
+    if to_hash:
+        hashes = hasher.hash_many_blocking([valid[index]["hashed_password"] for index in to_hash])
+        for index, hashed in zip(to_hash, hashes):
+            valid[index]["hashed_password"] = hashed
+
+    now = datetime.utcnow()
+    for row in valid:
+        row.update({"id": uuid.uuid4(), "created_at": now, "updated_at": now})
+    return valid
+
+
+def _insert_ignoring_duplicates(db: Session, rows: List[Dict[str, object]]) -> int:
+    """Insert rows with one multi-row INSERT ... ON CONFLICT (email) DO NOTHING.
+
+    Returns:
+        Number of inserted rows
+    """
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    statement = (
+        dialect.insert(User.__table__)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["email"])
+    )
+    result = db.execute(statement)
+    db.commit()
+    return result.rowcount
+
+
+def bulk_import_users(
+    db: Session,
+    records: Iterable[Any],
+    hasher: Optional[PasswordHasher] = None,
+    batch_size: int = 1000,
+    progress: bool = True,
+) -> BulkImportStats:
+    """Import users in batches with constant memory.
+
+    Records are consumed lazily, batch by batch. Plain text passwords are hashed
+    in parallel on ``hasher``; records with pre-hashed bcrypt values skip hashing.
+    Existing emails are skipped.
+
+    Args:
+        db: Database session
+        records: Records from read_user_records
+        hasher: Executor for plain text passwords (None accepts only pre-hashed values)
+        batch_size: Rows per INSERT statement (1 to MAX_BATCH_SIZE)
+        progress: Print a progress line after every batch
+
+    Returns:
+        Import counters
+
+    Raises:
+        ValueError: If batch_size is out of range
+    """
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+    stats = BulkImportStats()
+    iterator = iter(records)
+    while batch := list(islice(iterator, batch_size)):
+        stats.read += len(batch)
+        rows = _prepare_batch(batch, hasher, stats)
+        if rows:
+            inserted = _insert_ignoring_duplicates(db, rows)
+            stats.inserted += inserted
+            stats.duplicates += len(rows) - inserted
+        if progress:
+            print(f"Imported {stats.summary()}")
+    return stats
+
+
+def run_bulk_import(args: argparse.Namespace, database: Database) -> None:
+    """Run a bulk import from parsed command line arguments."""
+    hasher = None
+    if not args.prehashed:
+        hasher = PasswordHasher(mode="process", max_workers=args.workers)
+
+    db = database.session_factory()
+    try:
+        stats = bulk_import_users(
+            db,
+            read_user_records(args.bulk, args.format),
+            hasher=hasher,
+            batch_size=args.batch_size,
+        )
+    finally:
+        db.close()
+        if hasher is not None:
+            hasher.shutdown()
+
+    print(f"Bulk import completed: {stats.summary()}")
+
+
+def _batch_size(value: str) -> int:
+    """Parse --batch-size, keeping one INSERT within PostgreSQL's parameter limit."""
+    batch_size = int(value)
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_BATCH_SIZE}")
+    return batch_size
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.utils.seed_data",
+        description="Create the seed user from SEED_USER_EMAIL/SEED_USER_PASSWORD, "
+                    "or bulk import users from a CSV/JSONL file.",
+    )
+    parser.add_argument("--bulk", type=Path, help="CSV or JSONL file with users to import")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Input format")
+    parser.add_argument(
+        "--batch-size", type=_batch_size, default=1000,
+        help=f"Rows per INSERT (at most {MAX_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Processes hashing plain text passwords",
+    )
+    parser.add_argument(
+        "--prehashed", action="store_true",
+        help="Only accept bcrypt hashed_password values (no hashing)",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point for seed data script."""
+    args = build_parser().parse_args(argv)
     print("Starting seed data script...")
 
+    database = Database()
+
     # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=database.engine)
+
+    if args.bulk is not None:
+        try:
+            run_bulk_import(args, database)
+        except Exception as e:
+            print(f"Seed data script failed: {e}")
+            sys.exit(1)
+        finally:
+            database.engine.dispose()
+        print("Seed data script completed successfully.")
+        return
 
     # Create session and seed data
-    db = SessionLocal()
+    db = database.session_factory()
     try:
         create_seed_user(db)
     except Exception as e:
@@ -68,6 +313,8 @@ def main() -> None:
         sys.exit(1)
     finally:
         db.close()
+        database.engine.dispose()
+        password_hasher.shutdown()
 
     print("Seed data script completed successfully.")
 
@@ -0,0 +1,142 @@
+"""JSON lines logging written by a background thread through a bounded queue.
+
+Request handlers only put records on an in-memory queue; a ``QueueListener``
+thread formats them and writes them out. When the queue is full (a burst the
+output cannot keep up with) records are dropped and counted instead of
+blocking the event loop.
+"""
+import copy
+import logging
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.config import Settings
+from app.utils.metrics import log_records_dropped_total
+
+APP_LOGGER = "app"
+
+# Fields of the request being served, filled in by handlers and dependencies
+# and written by the access log (None outside a request)
+request_log_fields: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_log_fields", default=None
+)
+
+
+def annotate_request(**fields: Any) -> None:
+    """Attach fields (e.g. user_id, auth_failure) to the current request's access log.
+
+    Does nothing outside a request or when the access log is disabled.
+
+    Args:
+        **fields: Field names and values
+    """
+    current = request_log_fields.get()
+    if current is not None:
+        current.update(fields)
+
+
+def sampled(rate: float) -> bool:
+    """Whether an event kept at the given sample rate should be logged."""
+    return rate >= 1 or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line.
+
+    Structured fields are passed as ``extra={"fields": {...}}`` and merged
+    into the top level of the object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message and traceback while the caller's state is still valid.
+
+        Unlike ``QueueHandler.prepare`` the traceback is kept separate from the
+        message, so the JSON output gets its own ``exc_info`` field.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped_total.inc()
+
+
+class LogPipeline:
+    """Route the ``app`` loggers to stdout as JSON lines via a background thread."""
+
+    def __init__(self, config: Settings):
+        """Initialize pipeline.
+
+        Args:
+            config: Settings with LOG_LEVEL and LOG_QUEUE_SIZE
+        """
+        self.level = config.LOG_LEVEL.upper()
+        self.queue_size = config.LOG_QUEUE_SIZE
+        self._listener: Optional[QueueListener] = None
+        self._handler: Optional[BoundedQueueHandler] = None
+        self._propagate = True
+
+    def start(self) -> None:
+        """Start the writer thread and attach the queue handler.
+
+        Called once per worker process (threads do not survive a fork).
+        """
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(self.queue_size)
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter())
+        self._listener = QueueListener(log_queue, output)
+        self._handler = BoundedQueueHandler(log_queue)
+
+        logger = logging.getLogger(APP_LOGGER)
+        self._propagate = logger.propagate
+        logger.addHandler(self._handler)
+        logger.setLevel(self.level)
+        logger.propagate = False
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Detach the handler and write out the queued records."""
+        if self._listener is None:
+            return
+        logger = logging.getLogger(APP_LOGGER)
+        logger.removeHandler(self._handler)
+        logger.propagate = self._propagate
+        self._listener.stop()
+        self._listener = None
+        self._handler = None
@@ -0,0 +1,143 @@
+"""Bounded cache of verified JWT payloads."""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Type
+
+from app.config import settings
+
+
+class CachedToken(NamedTuple):
+    """Cached verification result for a single token.
+
+    ``payload`` is None for negatively cached (invalid) tokens, in which case
+    ``error`` holds the original validation error message and ``error_type``
+    its exception class (e.g. ``ExpiredSignatureError``), so a cache hit
+    raises the same error as the first verification.
+    """
+
+    expires_at: float
+    payload: Optional[Dict[str, Any]]
+    error: Optional[str]
+    error_type: Optional[Type[Exception]] = None
+
+
+class TokenCache:
+    """LRU cache of verification results keyed by a digest of the token.
+
+    Valid tokens are kept until their ``exp`` claim, invalid tokens for
+    ``negative_ttl`` seconds. Entries are never served past their expiry.
+    """
+
+    def __init__(self, max_entries: int, negative_ttl: float):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached tokens (0 disables the cache)
+            negative_ttl: Seconds to remember that a token is invalid
+        """
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict[bytes, CachedToken] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_entries > 0
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        """Digest used as cache key so raw tokens are never held in memory."""
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[CachedToken]:
+        """Look up a cached verification result.
+
+        Args:
+            key: Token digest from ``key()``
+
+        Returns:
+            Cached entry, or None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if time.time() >= entry.expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if entry.payload is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put_valid(self, key: bytes, payload: Dict[str, Any]) -> None:
+        """Cache a verified payload until its ``exp`` claim."""
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        self._put(key, CachedToken(float(expires_at), payload, None))
+
+    def put_invalid(self, key: bytes, error: Exception) -> None:
+        """Remember an invalid token for ``negative_ttl`` seconds.
+
+        Args:
+            key: Digest of the token
+            error: Validation error, raised again (same class and message) on hits
+        """
+        if self.negative_ttl <= 0:
+            return
+        self._put(key, CachedToken(time.time() + self.negative_ttl, None, str(error), type(error)))
+
+    def _put(self, key: bytes, entry: CachedToken) -> None:
+        """Insert entry, evicting least recently used entries beyond max_entries."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.negative_hits = self.misses = 0
+            self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache counters."""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            }
+
+
+token_cache = TokenCache(
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+    negative_ttl=settings.TOKEN_CACHE_NEGATIVE_TTL_SECONDS,
+)
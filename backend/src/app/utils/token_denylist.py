@@ -0,0 +1,152 @@
+"""In-memory denylist of revoked token IDs (``jti`` claims)."""
+import heapq
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+_HASH_MASK = (1 << 64) - 1
+
+# Rebuild the Bloom filter once this share of the values it holds has expired
+BLOOM_REBUILD_STALE_RATIO = 0.5
+
+
+class BloomFilter:
+    """Bloom filter over strings with two probes derived from ``hash()``.
+
+    ``hash()`` of a str is computed once and cached on the object, so a probe
+    costs two bit tests. Values are only meaningful within one process.
+    """
+
+    def __init__(self, size_bits: int):
+        """Initialize filter.
+
+        Args:
+            size_bits: Number of bits (rounded up to a power of two)
+        """
+        self.size_bits = 1 << max(3, (size_bits - 1).bit_length())
+        self._mask = self.size_bits - 1
+        self._bits = bytearray(self.size_bits // 8)
+
+    def _probes(self, value: str) -> Tuple[int, int]:
+        """Two bit positions for value."""
+        h = hash(value) & _HASH_MASK
+        return h & self._mask, (h >> 32) & self._mask
+
+    def add(self, value: str) -> None:
+        """Add value to the filter."""
+        for bit in self._probes(value):
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+
+    def __contains__(self, value: str) -> bool:
+        """False if value was definitely never added."""
+        first, second = self._probes(value)
+        bits = self._bits
+        return bool(bits[first >> 3] & (1 << (first & 7))) and bool(
+            bits[second >> 3] & (1 << (second & 7))
+        )
+
+
+class TokenDenylist:
+    """Set of revoked ``jti`` values that forgets each entry once its token expires.
+
+    Lookups are a dict probe, optionally fronted by a Bloom filter so the
+    common "not revoked" answer never touches a very large dict. Expired
+    entries are dropped by ``purge()`` in expiry order. Their bits stay in the
+    filter (only raising its false positive rate, which the dict probe
+    absorbs) until enough have accumulated to make a rebuild worthwhile.
+    """
+
+    def __init__(self, bloom_bits: int = 0):
+        """Initialize denylist.
+
+        Args:
+            bloom_bits: Size of the Bloom filter front in bits (0 disables it)
+        """
+        self.bloom_bits = bloom_bits
+        self._entries: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bloom: Optional[BloomFilter] = BloomFilter(bloom_bits) if bloom_bits else None
+        self._lock = threading.Lock()
+        self._bloom_stale = 0
+        self.purged = 0
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """Revoke a token ID until expires_at (Unix timestamp)."""
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            if jti in self._entries:
+                return
+            self._entries[jti] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, jti))
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Whether jti has been revoked and its token has not yet expired."""
+        bloom = self._bloom
+        if bloom is not None and jti not in bloom:
+            return False
+        expires_at = self._entries.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def purge(self) -> int:
+        """Drop entries whose tokens have expired.
+
+        Returns:
+            Number of removed entries
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                _, jti = heapq.heappop(heap)
+                del self._entries[jti]
+                removed += 1
+            if removed and self._bloom is not None:
+                self._bloom_stale += removed
+                if self._bloom_stale >= BLOOM_REBUILD_STALE_RATIO * (
+                    len(self._entries) + self._bloom_stale
+                ):
+                    self._rebuild_bloom()
+            self.purged += removed
+        return removed
+
+    def _rebuild_bloom(self) -> None:
+        """Replace the Bloom filter with one holding only the live entries.
+
+        Bloom filters cannot delete. The new filter is filled before it is
+        published, so lock-free readers in ``is_revoked`` see either the old
+        filter (a superset) or the complete new one, never a partial one.
+        Called with the lock held.
+        """
+        bloom = BloomFilter(self.bloom_bits)
+        for jti in self._entries:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._bloom_stale = 0
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            if self._bloom is not None:
+                self._bloom = BloomFilter(self.bloom_bits)
+            self._bloom_stale = 0
+            self.purged = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of denylist counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bloom_bits": self._bloom.size_bits if self._bloom is not None else 0,
+                "purged": self.purged,
+            }
+
+
+token_denylist = TokenDenylist(bloom_bits=settings.TOKEN_DENYLIST_BLOOM_BITS)
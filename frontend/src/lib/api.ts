@@ -5,6 +5,7 @@ export interface LoginResponse extends TokenResponse {}
 
 export interface RefreshTokenResponse {
   access_token: string
+  refresh_token: string
   token_type: string
 }
 
@@ -23,7 +24,7 @@ export const login = async (
 }
 
 /**
- * Refresh access token using refresh token
+ * Refresh access token using refresh token (the refresh token is rotated)
  */
 export const refreshToken = async (
   refreshToken: string
@@ -35,10 +36,17 @@ export const refreshToken = async (
 }
 
 /**
- * Logout - inform server (currently just client-side)
+ * Logout - revoke the given tokens on the server
  */
-export const logout = async (): Promise<void> => {
-  await apiClient.post('/auth/logout')
+export const logout = async (
+  accessToken?: string | null,
+  refreshToken?: string | null
+): Promise<void> => {
+  await apiClient.post(
+    '/auth/logout',
+    refreshToken ? { refresh_token: refreshToken } : undefined,
+    accessToken ? { headers: { Authorization: `Bearer ${accessToken}` } } : undefined
+  )
 }
 
 /**
@@ -50,6 +50,7 @@ export const useAuthStore = create<AuthState>()(
       },
 
       logout: () => {
+        const { accessToken, refreshToken } = get()
         set({
           isAuthenticated: false,
           user: null,
@@ -57,8 +58,8 @@ export const useAuthStore = create<AuthState>()(
           refreshToken: null,
           isLoading: false,
         })
-        // Call logout API to inform server
-        authApi.logout().catch(() => {
+        // Revoke the tokens on the server
+        authApi.logout(accessToken, refreshToken).catch(() => {
           // Ignore errors on logout
         })
       },
@@ -71,8 +72,10 @@ export const useAuthStore = create<AuthState>()(
 
         try {
           const response = await authApi.refreshToken(refreshToken)
+          // Refresh tokens are single use; keep the rotated one
           set({
             accessToken: response.access_token,
+            refreshToken: response.refresh_token ?? refreshToken,
           })
         } catch (error) {
           // If refresh fails, logout the user
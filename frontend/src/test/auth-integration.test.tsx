@@ -138,6 +138,7 @@ describe('Authentication Integration Tests', () => {
     // Mock refresh token to return new access token
     mockRefreshToken.mockResolvedValue({
       access_token: 'new-access-token',
+      refresh_token: 'rotated-refresh-token',
       token_type: 'bearer',
     })
 
@@ -153,6 +154,7 @@ describe('Authentication Integration Tests', () => {
     await waitFor(() => {
       const authState = useAuthStore.getState()
       expect(authState.accessToken).toBe('new-access-token')
+      expect(authState.refreshToken).toBe('rotated-refresh-token')
       expect(authState.isAuthenticated).toBe(true)
     })
   })